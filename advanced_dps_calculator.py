@@ -3,49 +3,36 @@ advanced_dps_calculator.py - Comprehensive DPS Engine
 """
 
 from typing import Dict, List, Set
+from dps_engine import ADVANCED_ENGINE, ADVANCED_WEAPONS
 
 class AdvancedDPSCalculator:
     """Real-time DPS calculation with all modifiers."""
     
     def __init__(self):
-        self.weapon_base_damage = {
-            'Stygian Blade': {'attack': 20, 'speed': 1.0},
-            'Heart-Seeking Bow': {'attack': 10, 'speed': 0.5},
-            'Shield of Chaos': {'attack': 25, 'speed': 0.8},
-            'Eternal Spear': {'attack': 25, 'speed': 0.9},
-            'Twin Fists': {'attack': 12, 'speed': 1.5},
-            'Adamant Rail': {'attack': 10, 'speed': 1.2},
-        }
+        self.weapon_base_damage = ADVANCED_WEAPONS
     
     def calculate_comprehensive_dps(self, build_state: Dict) -> Dict:
         """Calculate actual DPS with all modifiers."""
         
         weapon = build_state.get('weapon')
-        boons = build_state.get('boons', set())
-        pom_levels = build_state.get('pom_levels', {})
         
         if not weapon:
             return {'total_dps': 0, 'breakdown': {}}
         
-        weapon_data = self.weapon_base_damage.get(weapon, {'attack': 20, 'speed': 1.0})
-        base_attack = weapon_data['attack']
-        attack_speed = weapon_data['speed']
-        
-        total_damage = base_attack
-        
-        # Add boon bonuses
-        for boon in boons:
-            level = pom_levels.get(boon, 1)
-            if 'Strike' in boon or 'Attack' in boon:
-                bonus = 10 + (level * 2)
-                total_damage += bonus
-        
-        dps = total_damage * attack_speed
+        result = ADVANCED_ENGINE.evaluate({
+            'weapon': weapon,
+            'boons': build_state.get('boons', set()),
+            'pom_levels': build_state.get('pom_levels', {}),
+        })
         
         return {
-            'total_dps': round(dps, 1),
+            'total_dps': round(result['dps'], 1),
             'breakdown': {
-                'base': base_attack,
-                'total': total_damage,
+                'base': result['base'],
+                'total': result['total'],
             }
         }
+    
+    def calculate_batch_dps(self, build_states: List[Dict]):
+        """DPS of many candidate builds at once (NumPy array when available)."""
+        return ADVANCED_ENGINE.evaluate_batch(build_states)
@@ -5,9 +5,17 @@ Handles run history tracking, statistics calculation, and data persistence.
 
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from persistence import PersistenceWorker, atomic_write_text
+from room_tracker import RunTracker
+from run_aggregates import RunAggregates
+from run_index import RunIndex
+from run_storage import BinaryRunLogStore, RunLogStore, iter_run_file
+from run_table import ColumnarRunTable
+from sqlite_storage import SQLiteRunStore
 
 
 class RunAnalytics:
@@ -15,34 +23,222 @@ class RunAnalytics:
     Manages run history, calculates statistics, and handles data persistence.
     """
     
-    RUNS_FILE = "hades_runs_history.json"
-    
-    def __init__(self):
+    RUNS_FILE = "hades_runs_history.json"  # Legacy single-file history
+    RUNS_DIR = "hades_runs_history"
+    RUNS_BIN_DIR = "hades_runs_binary"
+    RUNS_DB = "hades_runs_history.db"
+    SUMMARY_FILE = "hades_runs_summary.json"
+    BACKENDS = ("jsonl", "binary", "sqlite")
+    LOAD_CHUNK_SIZE = 500
+    TRANSFER_CHUNK_SIZE = 500
+    SUMMARY_RECENT_RUNS = 10
+    
+    def __init__(self, columnar: bool = True, backend: str = "jsonl", lazy: bool = False,
+                 writer: Optional[PersistenceWorker] = None):
+        """
+        Args:
+            columnar: Keep a NumPy column copy of the history for vectorized
+                queries (ignored when NumPy is not installed)
+            backend: Storage backend, "jsonl" (append-only run log), "binary"
+                (the same log with compact binary records) or "sqlite"
+            lazy: Start from the saved summary snapshot and stream the full
+                history in a background thread instead of loading it here
+            writer: Background writer for saves; without one every save
+                happens synchronously in the calling thread
+        """
         self.runs: List[Dict[str, Any]] = []
+        self.aggregates = RunAggregates()
+        self.index = RunIndex()
+        self.columnar = columnar and ColumnarRunTable.available()
+        self.table = ColumnarRunTable() if self.columnar else None
+        self.store = self._create_store(backend)
+        self.lazy = lazy
+        self.writer = writer
+        self.loaded_runs = 0
+        self._loaded = threading.Event()
         self.load_runs()
     
+    def _create_store(self, backend: str):
+        """Create the storage backend for the run history."""
+        if backend == "sqlite":
+            return SQLiteRunStore(self.RUNS_DB, legacy_file=self.RUNS_FILE, log_dir=self.RUNS_DIR)
+        if backend == "binary":
+            return BinaryRunLogStore(self.RUNS_BIN_DIR, legacy_file=self.RUNS_FILE, log_dir=self.RUNS_DIR)
+        if backend == "jsonl":
+            return RunLogStore(self.RUNS_DIR, legacy_file=self.RUNS_FILE)
+        raise ValueError(f"Unknown storage backend: {backend} (expected one of {self.BACKENDS})")
+    
+    @property
+    def sql(self) -> Optional[SQLiteRunStore]:
+        """The SQLite store when that backend is active, for in-database aggregates."""
+        return self.store if isinstance(self.store, SQLiteRunStore) else None
+    
+    def _synced_sql(self) -> Optional[SQLiteRunStore]:
+        """
+        The SQLite store once every queued write has reached it.
+        
+        Appends go through the writer, so SQL reads wait for it to catch
+        up; statistics the in-memory aggregates hold never come from here.
+        """
+        sql = self.sql
+        if sql is not None and self.writer is not None:
+            self.writer.flush()
+        return sql
+    
     # === DATA PERSISTENCE ===
     
     def load_runs(self) -> None:
-        """Load run history from JSON file."""
-        if os.path.exists(self.RUNS_FILE):
-            try:
-                with open(self.RUNS_FILE, 'r', encoding='utf-8') as f:
-                    self.runs = json.load(f)
-                print(f"✓ Loaded {len(self.runs)} runs from history")
-            except Exception as e:
-                print(f"⚠ Error loading runs: {e}")
-                self.runs = []
+        """
+        Load run history from the run log (migrating the old JSON file once).
+        
+        In lazy mode only the summary snapshot is read here; the history is
+        streamed by a daemon thread and swapped in once complete.  Summary
+        statistics answer from the snapshot meanwhile, while calls that need
+        individual runs wait for the stream (see wait_until_loaded).
+        """
+        self._loaded.clear()
+        self.loaded_runs = 0
+        if not self.lazy:
+            self._stream_history()
+            return
+        
+        self._load_summary()
+        threading.Thread(target=self._stream_history, name="run-history-loader", daemon=True).start()
+    
+    def _stream_history(self) -> None:
+        """Read the store chunk by chunk into fresh runs, aggregates and indexes."""
+        runs: List[Dict[str, Any]] = []
+        aggregates = RunAggregates()
+        index = RunIndex()
+        table = ColumnarRunTable() if self.columnar else None
+        
+        try:
+            self.store.migrate_legacy()
+            for chunk in self.store.iter_runs(self.LOAD_CHUNK_SIZE):
+                for run in chunk:
+                    aggregates.add(run)
+                    index.add(run)
+                    if table is not None:
+                        table.append(run)
+                runs.extend(chunk)
+                self.loaded_runs = len(runs)
+            failed = False
+        except Exception as e:
+            print(f"⚠ Error loading runs: {e}")
+            failed = True
+            runs = []
+            aggregates.reset()
+            index.reset()
+            if table is not None:
+                table.reset()
+        
+        if runs:
+            print(f"✓ Loaded {len(runs)} runs from history")
         else:
-            self.runs = []
             print("ℹ No run history found, starting fresh")
+        
+        self.runs = runs
+        self.aggregates = aggregates
+        self.index = index
+        self.table = table
+        if self.lazy and not failed:
+            self._save_summary()
+        self._loaded.set()
+    
+    @property
+    def loading(self) -> bool:
+        """Whether the background history load is still running."""
+        return not self._loaded.is_set()
+    
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Block until the full history is in memory (immediate when not lazy)."""
+        return self._loaded.wait(timeout)
+    
+    def _load_summary(self) -> None:
+        """Seed statistics and recent runs from the summary snapshot, if present."""
+        if not os.path.exists(self.SUMMARY_FILE):
+            return
+        try:
+            with open(self.SUMMARY_FILE, 'r', encoding='utf-8') as f:
+                summary = json.load(f)
+            self.aggregates = RunAggregates.from_dict(summary['aggregates'])
+            self.runs = summary.get('recent_runs', [])
+        except Exception as e:
+            print(f"⚠ Error loading run summary: {e}")
+            self.aggregates = RunAggregates()
+            self.runs = []
+    
+    def _save_summary(self) -> None:
+        """Write the aggregates and latest runs used for the next lazy start."""
+        if not self.lazy:
+            return
+        summary = {
+            'aggregates': self.aggregates.to_dict(),
+            'recent_runs': self.runs[-self.SUMMARY_RECENT_RUNS:]
+        }
+        if self.writer is not None:
+            self.writer.write_json(self.SUMMARY_FILE, summary, ensure_ascii=False)
+            return
+        try:
+            atomic_write_text(self.SUMMARY_FILE, json.dumps(summary, ensure_ascii=False))
+        except Exception as e:
+            print(f"⚠ Error saving run summary: {e}")
     
     def save_runs(self) -> None:
-        """Save run history to JSON file."""
+        """Rewrite the whole run history (used after bulk changes)."""
+        self.wait_until_loaded()
+        runs = list(self.runs)
+        if self.writer is not None:
+            # A newer rewrite already contains every earlier queued run
+            self.writer.submit("run-history", lambda: self._rewrite_store(runs))
+        else:
+            self._rewrite_store(runs)
+        self._save_summary()
+    
+    def _rewrite_store(self, runs: List[Dict[str, Any]]) -> None:
+        try:
+            self.store.rewrite(runs)
+            print(f"✓ Saved {len(runs)} runs to history")
+        except Exception as e:
+            print(f"⚠ Error saving runs: {e}")
+    
+    def _index_run(self, run_data: Dict[str, Any]) -> None:
+        """Fold a newly added run into the in-memory statistics."""
+        self.aggregates.add(run_data)
+        self.index.add(run_data)
+        if self.table is not None:
+            self.table.append(run_data)
+    
+    def _reindex(self) -> None:
+        """Rebuild the in-memory statistics from the full run list."""
+        self.aggregates.rebuild(self.runs)
+        self.index.rebuild(self.runs)
+        if self.table is not None:
+            self.table.rebuild(self.runs)
+    
+    def _append_run(self, run_data: Dict[str, Any]) -> None:
+        """Persist a single new run without rewriting the history."""
+        if self.writer is not None:
+            self.writer.submit("run-append", lambda: self._append_to_store(run_data), coalesce=False)
+        else:
+            self._append_to_store(run_data)
+    
+    def _append_to_store(self, run_data: Dict[str, Any]) -> None:
         try:
-            with open(self.RUNS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.runs, f, indent=2, ensure_ascii=False)
-            print(f"✓ Saved {len(self.runs)} runs to history")
+            self.store.append(run_data)
+        except Exception as e:
+            print(f"⚠ Error saving run: {e}")
+    
+    def _append_runs(self, runs: List[Dict[str, Any]]) -> None:
+        """Persist a batch of new runs with one store write."""
+        if self.writer is not None:
+            self.writer.submit("run-append", lambda: self._append_many_to_store(runs), coalesce=False)
+        else:
+            self._append_many_to_store(runs)
+    
+    def _append_many_to_store(self, runs: List[Dict[str, Any]]) -> None:
+        try:
+            self.store.append_many(runs)
         except Exception as e:
             print(f"⚠ Error saving runs: {e}")
     
@@ -56,51 +252,142 @@ class RunAnalytics:
         Returns:
             Run number of the added run
         """
+        self.wait_until_loaded()
         run_data['timestamp'] = datetime.now().isoformat()
         run_data['run_number'] = len(self.runs) + 1
         run_data['date'] = datetime.now().strftime("%Y-%m-%d %H:%M")
         
         self.runs.append(run_data)
-        self.save_runs()
+        self._index_run(run_data)
+        self._append_run(run_data)
+        self._save_summary()
         
         return run_data['run_number']
     
-    def export_data(self, filepath: str) -> bool:
-        """Export run data to custom location."""
+    def export_data(self, filepath: str,
+                    progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Export run data to custom location.
+        
+        Runs are serialized and written one chunk at a time (same layout as
+        an indented json.dump of the list) into a temporary file that
+        replaces the target when complete.
+        
+        Args:
+            filepath: Destination file
+            progress: Called as progress(runs_written, total_runs) per chunk
+        """
+        self.wait_until_loaded()
+        runs = list(self.runs)
+        total = len(runs)
+        tmp_path = filepath + ".tmp"
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.runs, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('[')
+                for start in range(0, total, self.TRANSFER_CHUNK_SIZE):
+                    chunk = runs[start:start + self.TRANSFER_CHUNK_SIZE]
+                    items = ",".join(
+                        "\n  " + json.dumps(run, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                        for run in chunk
+                    )
+                    f.write(("," if start else "") + items)
+                    if progress:
+                        progress(start + len(chunk), total)
+                f.write("\n]" if total else "]")
+            os.replace(tmp_path, filepath)
             return True
         except Exception as e:
             print(f"Export failed: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
     
-    def import_data(self, filepath: str) -> bool:
-        """Import run data from file."""
+    @staticmethod
+    def _run_key(run: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """Identity of a run across machines: (timestamp, original run number)."""
+        timestamp = run.get('timestamp')
+        if timestamp is None:
+            return None
+        return (timestamp, run.get('source_run_number', run.get('run_number')))
+    
+    def import_data(self, filepath: str,
+                    progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        """
+        Merge runs from an exported file into the history.
+        
+        The file is parsed and stored in fixed-size chunks.  Runs already in
+        the history (same timestamp and original run number) are skipped;
+        new runs are renumbered after the current history, keeping their
+        original number as ``source_run_number``.
+        
+        Args:
+            filepath: JSON array (as written by export_data) or JSON-Lines file
+            progress: Called as progress(bytes_read, total_bytes) per chunk
+        """
+        self.wait_until_loaded()
+        seen = {self._run_key(run) for run in self.runs}
+        imported = duplicates = 0
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                imported_runs = json.load(f)
-            self.runs.extend(imported_runs)
-            self.save_runs()
-            return True
+            for chunk in iter_run_file(filepath, self.TRANSFER_CHUNK_SIZE, progress):
+                # Check the whole chunk before touching the history
+                fresh = []
+                chunk_keys = set()
+                for run in chunk:
+                    if not isinstance(run, dict):
+                        raise ValueError(f"invalid run record: {run!r}")
+                    key = self._run_key(run)
+                    if key is not None:
+                        if key in seen or key in chunk_keys:
+                            duplicates += 1
+                            continue
+                        chunk_keys.add(key)
+                    fresh.append(run)
+                if not fresh:
+                    continue
+                
+                start = len(self.runs)
+                try:
+                    for number, run in enumerate(fresh, start + 1):
+                        if run.get('run_number') is not None:
+                            run.setdefault('source_run_number', run['run_number'])
+                        run['run_number'] = number
+                        self.runs.append(run)
+                        self._index_run(run)
+                except Exception:
+                    # Keep memory in step with the store: drop the partial chunk
+                    del self.runs[start:]
+                    self._reindex()
+                    raise
+                self._append_runs(fresh)
+                seen |= chunk_keys
+                imported += len(fresh)
         except Exception as e:
             print(f"Import failed: {e}")
             return False
+        finally:
+            self._save_summary()
+        
+        print(f"✓ Imported {imported} runs ({duplicates} duplicates skipped)")
+        return True
     
     def clear_all_runs(self) -> None:
         """Clear all run history (with confirmation in GUI)."""
+        self.wait_until_loaded()
         self.runs = []
+        self._reindex()
         self.save_runs()
     
     # === BASIC STATISTICS ===
     
     def get_total_runs(self) -> int:
         """Get total number of runs recorded."""
-        return len(self.runs)
+        return self.aggregates.total_runs
     
     def get_wins(self) -> int:
         """Get total number of victories."""
-        return sum(1 for run in self.runs if run.get('victory', False))
+        return self.aggregates.wins
     
     def get_defeats(self) -> int:
         """Get total number of defeats."""
@@ -115,17 +402,15 @@ class RunAnalytics:
     
     def get_avg_build_score(self) -> float:
         """Get average build score across all runs."""
-        if not self.runs:
+        if not self.aggregates.total_runs:
             return 0.0
-        total_score = sum(run.get('build_score', 0) for run in self.runs)
-        return total_score / len(self.runs)
+        return self.aggregates.total_score / self.aggregates.total_runs
     
     def get_avg_heat_level(self) -> float:
         """Get average heat level attempted."""
-        if not self.runs:
+        if not self.aggregates.total_runs:
             return 0.0
-        total_heat = sum(run.get('heat_level', 0) for run in self.runs)
-        return total_heat / len(self.runs)
+        return self.aggregates.total_heat / self.aggregates.total_runs
     
     # === WEAPON STATISTICS ===
     
@@ -136,45 +421,7 @@ class RunAnalytics:
         Returns:
             Dictionary with weapon names as keys and stats as values
         """
-        weapon_stats = defaultdict(lambda: {
-            'runs': 0,
-            'wins': 0,
-            'defeats': 0,
-            'win_rate': 0.0,
-            'avg_score': 0.0,
-            'total_score': 0,
-            'avg_heat': 0.0,
-            'total_heat': 0,
-            'best_score': 0,
-            'aspects_used': defaultdict(int)
-        })
-        
-        for run in self.runs:
-            weapon = run.get('weapon', 'Unknown')
-            aspect = run.get('aspect', 'Unknown')
-            
-            stats = weapon_stats[weapon]
-            stats['runs'] += 1
-            stats['total_score'] += run.get('build_score', 0)
-            stats['total_heat'] += run.get('heat_level', 0)
-            stats['aspects_used'][aspect] += 1
-            
-            if run.get('victory', False):
-                stats['wins'] += 1
-            else:
-                stats['defeats'] += 1
-            
-            if run.get('build_score', 0) > stats['best_score']:
-                stats['best_score'] = run.get('build_score', 0)
-        
-        # Calculate averages and percentages
-        for weapon, stats in weapon_stats.items():
-            if stats['runs'] > 0:
-                stats['win_rate'] = (stats['wins'] / stats['runs']) * 100
-                stats['avg_score'] = stats['total_score'] / stats['runs']
-                stats['avg_heat'] = stats['total_heat'] / stats['runs']
-        
-        return dict(weapon_stats)
+        return self.aggregates.weapon_stats()
     
     def get_best_weapon(self) -> Optional[Tuple[str, float]]:
         """Get weapon with highest win rate (minimum 3 runs)."""
@@ -196,37 +443,7 @@ class RunAnalytics:
         Returns:
             Dictionary with god names as keys and stats as values
         """
-        god_stats = defaultdict(lambda: {
-            'runs': 0,
-            'wins': 0,
-            'defeats': 0,
-            'win_rate': 0.0,
-            'avg_score': 0.0,
-            'total_score': 0
-        })
-        
-        for run in self.runs:
-            gods = run.get('gods', [])
-            victory = run.get('victory', False)
-            score = run.get('build_score', 0)
-            
-            for god in gods:
-                stats = god_stats[god]
-                stats['runs'] += 1
-                stats['total_score'] += score
-                
-                if victory:
-                    stats['wins'] += 1
-                else:
-                    stats['defeats'] += 1
-        
-        # Calculate percentages
-        for god, stats in god_stats.items():
-            if stats['runs'] > 0:
-                stats['win_rate'] = (stats['wins'] / stats['runs']) * 100
-                stats['avg_score'] = stats['total_score'] / stats['runs']
-        
-        return dict(god_stats)
+        return self.aggregates.god_stats()
     
     def get_god_combo_stats(self, min_runs: int = 2) -> List[Tuple[str, int, int, float]]:
         """
@@ -238,114 +455,159 @@ class RunAnalytics:
         Returns:
             List of tuples: (combo_string, runs, wins, win_rate)
         """
-        combo_stats = defaultdict(lambda: {'runs': 0, 'wins': 0})
+        return self.aggregates.combo_stats(min_runs)
+    
+    def get_god_subset_stats(self, size: int = 2, min_runs: int = 2) -> List[Tuple[str, int, int, float]]:
+        """
+        Get statistics for every combination of ``size`` gods (1 to 4).
         
-        for run in self.runs:
-            gods = sorted(run.get('gods', []))
-            if len(gods) >= 2:
-                combo = " + ".join(gods[:3])  # Limit to top 3 gods
-                combo_stats[combo]['runs'] += 1
-                if run.get('victory', False):
-                    combo_stats[combo]['wins'] += 1
+        Unlike get_god_combo_stats, a run counts towards every subset of the
+        gods it used, not only its sorted first three.
+        
+        Returns:
+            List of tuples: (combo_string, runs, wins, win_rate)
+        """
+        return self.aggregates.cube.subsets(size, min_runs)
+    
+    def get_combo_summary(self, gods: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Runs, wins, win rate and average score of runs containing all ``gods``.
+        
+        Up to four gods this is a single lookup in the precomputed combo
+        cube.  Larger sets fall back to an index query, which is skipped
+        (None) while the history is still loading.
+        """
+        gods = set(gods)
+        if len(gods) <= self.aggregates.cube.MAX_SUBSET_SIZE:
+            return self.aggregates.cube.stats(gods)
+        if self.loading:
+            return None
+        summary = self.query_summary(gods=sorted(gods))
+        return {key: summary[key] for key in ('runs', 'wins', 'win_rate', 'avg_score')}
+    
+    def get_pairing_win_rate(self, god: str, partners: List[str]) -> Optional[Tuple[float, int]]:
+        """
+        Historical win rate of ``god`` alongside each of ``partners``.
         
-        # Filter by minimum runs and convert to list
-        combo_list = []
-        for combo, stats in combo_stats.items():
-            if stats['runs'] >= min_runs:
-                win_rate = (stats['wins'] / stats['runs'] * 100) if stats['runs'] > 0 else 0
-                combo_list.append((combo, stats['runs'], stats['wins'], win_rate))
+        Pools the precomputed pair cells (or the god alone when there are
+        no partners), weighting each pair by its run count.
         
-        # Sort by win rate, then runs
-        combo_list.sort(key=lambda x: (x[3], x[1]), reverse=True)
-        return combo_list
+        Returns:
+            (win_rate, runs) or None when there is no matching history
+        """
+        cube = self.aggregates.cube
+        keys = [(god, partner) for partner in set(partners) if partner != god] or [(god,)]
+        runs = wins = 0
+        for key in keys:
+            cell = cube.cells.get(cube.key(key))
+            if cell is not None:
+                runs += cell[0]
+                wins += cell[1]
+        if not runs:
+            return None
+        return (wins / runs * 100, runs)
     
     # === BOON STATISTICS ===
     
     def get_most_used_boons(self, limit: int = 10) -> List[Tuple[str, int]]:
         """Get most frequently used boons."""
-        boon_counter = defaultdict(int)
-        
-        for run in self.runs:
-            for boon in run.get('boons', []):
-                boon_counter[boon] += 1
-        
-        sorted_boons = sorted(boon_counter.items(), key=lambda x: x[1], reverse=True)
-        return sorted_boons[:limit]
+        return self.aggregates.boon_usage(limit)
     
     def get_boon_win_rates(self) -> Dict[str, float]:
         """Calculate win rates for boons used."""
-        boon_stats = defaultdict(lambda: {'runs': 0, 'wins': 0})
-        
-        for run in self.runs:
-            victory = run.get('victory', False)
-            for boon in run.get('boons', []):
-                boon_stats[boon]['runs'] += 1
-                if victory:
-                    boon_stats[boon]['wins'] += 1
-        
-        win_rates = {}
-        for boon, stats in boon_stats.items():
-            if stats['runs'] >= 3:  # Minimum 3 uses
-                win_rates[boon] = (stats['wins'] / stats['runs']) * 100
-        
-        return win_rates
+        return self.aggregates.boon_win_rates(min_runs=3)
     
     # === RUN QUERIES ===
     
     def get_recent_runs(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most recent runs."""
+        if limit > len(self.runs):
+            self.wait_until_loaded()
         return list(reversed(self.runs[-limit:]))
     
     def get_best_run(self) -> Optional[Dict[str, Any]]:
         """Get run with highest build score."""
-        if not self.runs:
-            return None
-        return max(self.runs, key=lambda r: r.get('build_score', 0))
+        return self.aggregates.best_run
     
     def get_runs_by_weapon(self, weapon: str) -> List[Dict[str, Any]]:
         """Get all runs with specific weapon."""
-        return [r for r in self.runs if r.get('weapon') == weapon]
+        self.wait_until_loaded()
+        return [self.runs[i] for i in self.index.posting('weapon', weapon)]
     
     def get_runs_by_god(self, god: str) -> List[Dict[str, Any]]:
         """Get all runs that included specific god."""
-        return [r for r in self.runs if god in r.get('gods', [])]
+        self.wait_until_loaded()
+        return [self.runs[i] for i in self.index.posting('god', god)]
     
     def get_victory_runs(self) -> List[Dict[str, Any]]:
         """Get all victorious runs."""
-        return [r for r in self.runs if r.get('victory', False)]
-    
-    # === PROGRESSION TRACKING ===
-    
-    def get_streak_data(self) -> Dict[str, int]:
-        """Calculate current and best win/loss streaks."""
-        if not self.runs:
-            return {'current_streak': 0, 'best_win_streak': 0, 'worst_loss_streak': 0}
+        self.wait_until_loaded()
+        return [self.runs[i] for i in self.index.posting('victory', True)]
+    
+    def query_runs(self, weapon: Optional[str] = None, aspect: Optional[str] = None,
+                   gods: List[str] = (), boons: List[str] = (),
+                   victory: Optional[bool] = None, boss_reached: Optional[str] = None,
+                   min_score: Optional[float] = None,
+                   min_heat: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get all runs matching every given filter.
         
-        current_streak = 0
-        best_win_streak = 0
-        worst_loss_streak = 0
-        temp_win_streak = 0
-        temp_loss_streak = 0
+        Categorical filters are answered by posting list intersection;
+        score and heat thresholds are then checked on the candidates only.
         
-        for run in reversed(self.runs):
-            if run.get('victory', False):
-                temp_win_streak += 1
-                temp_loss_streak = 0
-                current_streak = temp_win_streak
-            else:
-                temp_loss_streak += 1
-                temp_win_streak = 0
-                current_streak = -temp_loss_streak
-            
-            best_win_streak = max(best_win_streak, temp_win_streak)
-            worst_loss_streak = max(worst_loss_streak, temp_loss_streak)
+        Example:
+            query_runs(gods=['Aphrodite'], boons=['Heartbreak Strike'], victory=True)
+        """
+        self.wait_until_loaded()
+        run_ids = self.index.lookup(gods, boons, weapon, aspect, boss_reached, victory)
+        matched = [self.runs[i] for i in run_ids]
+        if min_score is not None:
+            matched = [r for r in matched if r.get('build_score', 0) >= min_score]
+        if min_heat is not None:
+            matched = [r for r in matched if r.get('heat_level', 0) >= min_heat]
+        return matched
+    
+    def query_summary(self, weapon: Optional[str] = None, aspect: Optional[str] = None,
+                      gods: List[str] = (), boons: List[str] = (),
+                      victory: Optional[bool] = None, boss_reached: Optional[str] = None,
+                      min_score: Optional[float] = None,
+                      min_heat: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Aggregate runs matching the given filters.
         
+        Uses vectorized masks over the column table when available.
+        
+        Returns:
+            Dictionary with runs, wins, win_rate, avg_score, avg_heat and best_run
+        """
+        self.wait_until_loaded()
+        if self.table is not None:
+            mask = self.table.mask(weapon, aspect, gods, boons, victory, min_score, min_heat)
+            if boss_reached is not None:
+                mask &= self.table.mask_rows(self.index.posting('boss_reached', boss_reached))
+            summary = self.table.summarize(mask)
+            best_row = self.table.best_row(mask)
+            summary['best_run'] = self.runs[best_row] if best_row is not None else None
+            return summary
+        
+        matched = self.query_runs(weapon, aspect, gods, boons, victory, boss_reached, min_score, min_heat)
+        runs = len(matched)
+        wins = sum(1 for r in matched if r.get('victory', False))
         return {
-            'current_streak': current_streak,
-            'best_win_streak': best_win_streak,
-            'worst_loss_streak': worst_loss_streak
+            'runs': runs,
+            'wins': wins,
+            'win_rate': (wins / runs * 100) if runs else 0.0,
+            'avg_score': sum(r.get('build_score', 0) for r in matched) / runs if runs else 0.0,
+            'avg_heat': sum(r.get('heat_level', 0) for r in matched) / runs if runs else 0.0,
+            'best_run': max(matched, key=lambda r: r.get('build_score', 0)) if matched else None
         }
     
+    # === PROGRESSION TRACKING ===
+    
+    def get_streak_data(self) -> Dict[str, int]:
+        """Calculate current and best win/loss streaks."""
+        return self.aggregates.streak_data()
+    
     def get_progression_summary(self) -> Dict[str, Any]:
         """Get overall progression summary."""
         return {
@@ -359,76 +621,84 @@ class RunAnalytics:
             'best_weapon': self.get_best_weapon(),
             'streak_data': self.get_streak_data()
         }
-# Add to imports at top
-from room_tracker import RunTracker
-
-# Add to RunAnalytics class:
-
-def add_run_with_rooms(self, run_data: Dict[str, Any], run_tracker: RunTracker):
-    """Add run with complete room-by-room data."""
-    run_data['room_progression'] = run_tracker.to_dict()
-    return self.add_run(run_data)
+    
+    # === ROOM STATISTICS ===
+    
+    def add_run_with_rooms(self, run_data: Dict[str, Any], run_tracker: RunTracker):
+        """Add run with complete room-by-room data."""
+        run_data['room_progression'] = run_tracker.to_dict()
+        return self.add_run(run_data)
 
-def get_room_statistics(self) -> Dict[str, Any]:
-    """Get statistics about room choices across all runs."""
-    total_rooms = 0
-    reward_choices = {}
-    god_encounter_frequency = {}
-    reroll_usage = 0
-    
-    for run in self.runs:
-        room_prog = run.get('room_progression', {})
-        rooms = room_prog.get('rooms', [])
+    def get_room_statistics(self) -> Dict[str, Any]:
+        """Get statistics about room choices across all runs."""
+        self.wait_until_loaded()
+        sql = self._synced_sql()
+        if sql is not None:
+            return sql.room_statistics()
         
-        total_rooms += len(rooms)
-        
-        for room in rooms:
-            # Track reward choices
-            if room.get('reward_chosen'):
-                reward = room['reward_chosen']
-                reward_choices[reward] = reward_choices.get(reward, 0) + 1
-            
-            # Track god encounters
-            if room.get('god_chosen'):
-                god = room['god_chosen']
-                god_encounter_frequency[god] = god_encounter_frequency.get(god, 0) + 1
-            
-            # Track reroll usage
-            if room.get('reroll_used'):
-                reroll_usage += 1
-    
-    return {
-        'total_rooms_cleared': total_rooms,
-        'reward_preferences': reward_choices,
-        'god_encounter_frequency': god_encounter_frequency,
-        'reroll_usage': reroll_usage,
-        'avg_rooms_per_run': total_rooms / len(self.runs) if self.runs else 0
-    }
-
-def get_boon_acquisition_patterns(self) -> Dict[str, List]:
-    """Analyze when certain boons are typically acquired."""
-    patterns = {}
+        total_rooms = 0
+        reward_choices = {}
+        god_encounter_frequency = {}
+        reroll_usage = 0
     
-    for run in self.runs:
-        room_prog = run.get('room_progression', {})
-        timeline = room_prog.get('boon_timeline', [])
-        
-        for entry in timeline:
-            boon = entry['boon']
-            room_num = entry['room']
-            
-            if boon not in patterns:
-                patterns[boon] = []
-            patterns[boon].append(room_num)
-    
-    # Calculate average acquisition room
-    for boon, rooms in patterns.items():
-        avg_room = sum(rooms) / len(rooms)
-        patterns[boon] = {
-            'times_taken': len(rooms),
-            'avg_room_number': avg_room,
-            'earliest': min(rooms),
-            'latest': max(rooms)
+        for run in self.runs:
+            room_prog = run.get('room_progression', {})
+            rooms = room_prog.get('rooms', [])
+    
+            total_rooms += len(rooms)
+    
+            for room in rooms:
+                # Track reward choices
+                if room.get('reward_chosen'):
+                    reward = room['reward_chosen']
+                    reward_choices[reward] = reward_choices.get(reward, 0) + 1
+    
+                # Track god encounters
+                if room.get('god_chosen'):
+                    god = room['god_chosen']
+                    god_encounter_frequency[god] = god_encounter_frequency.get(god, 0) + 1
+    
+                # Track reroll usage
+                if room.get('reroll_used'):
+                    reroll_usage += 1
+    
+        return {
+            'total_rooms_cleared': total_rooms,
+            'reward_preferences': reward_choices,
+            'god_encounter_frequency': god_encounter_frequency,
+            'reroll_usage': reroll_usage,
+            'avg_rooms_per_run': total_rooms / len(self.runs) if self.runs else 0
         }
+
+    def get_boon_acquisition_patterns(self) -> Dict[str, List]:
+        """Analyze when certain boons are typically acquired."""
+        self.wait_until_loaded()
+        sql = self._synced_sql()
+        if sql is not None:
+            return sql.boon_acquisition_patterns()
+        
+        patterns = {}
     
-    return patterns
+        for run in self.runs:
+            room_prog = run.get('room_progression', {})
+            timeline = room_prog.get('boon_timeline', [])
+    
+            for entry in timeline:
+                boon = entry['boon']
+                room_num = entry['room']
+    
+                if boon not in patterns:
+                    patterns[boon] = []
+                patterns[boon].append(room_num)
+    
+        # Calculate average acquisition room
+        for boon, rooms in patterns.items():
+            avg_room = sum(rooms) / len(rooms)
+            patterns[boon] = {
+                'times_taken': len(rooms),
+                'avg_room_number': avg_room,
+                'earliest': min(rooms),
+                'latest': max(rooms)
+            }
+    
+        return patterns
@@ -0,0 +1,326 @@
+"""
+Hades Build Helper - Boon Catalog Module
+Compiled view of data.py: integer ids, slotted records, bitmask builds
+and a per-boon classification table.
+"""
+
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple, FrozenSet
+
+from data import GODS_DATA, BOONS_DATA, DUO_BOONS_DATA, LEGENDARY_BOONS_DATA
+
+
+def popcount(mask: int) -> int:
+    """Number of set bits in a mask."""
+    return bin(mask).count("1")
+
+
+# === CLASSIFICATION ===
+
+# data.py ``type`` -> core slot (the slot tag must also be present, which
+# keeps Hermes enhancers such as Quick Strike out of the Attack slot)
+SLOT_TYPES = {
+    'Attack': 'attack',
+    'Special': 'special',
+    'Dash': 'dash',
+    'Cast': 'cast',
+    'Call': 'call',
+}
+
+# Tag base -> damage family
+FAMILY_TAGS = {
+    'lightning': 'lightning',
+    'jolted': 'lightning',
+    'knockback': 'knockback',
+    'rupture': 'knockback',
+    'deflect': 'deflect',
+    'weak': 'weak',
+    'doom': 'doom',
+    'blade_rift': 'blade_rift',
+    'crit': 'crit',
+    'hangover': 'hangover',
+    'chill': 'chill',
+}
+
+TAG_SUFFIXES = ('_applier', '_enhancer', '_synergy', '_chance', '_damage')
+
+# Fallback for names not described by data.py (hammers, custom entries)
+NAME_SLOT_KEYWORDS = (
+    ('Strike', 'attack'),
+    ('Flourish', 'special'),
+    ('Dash', 'dash'),
+    ('Shot', 'cast'),
+    ('Cast', 'cast'),
+    ('Aid', 'call'),
+    ('Call', 'call'),
+)
+
+
+def _tag_base(tag: str) -> str:
+    """``crit_damage_enhancer`` -> ``crit``."""
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in TAG_SUFFIXES:
+            if tag.endswith(suffix) and len(tag) > len(suffix):
+                tag = tag[:-len(suffix)]
+                stripped = True
+    return tag
+
+
+class BoonClass:
+    """Slot, damage family, status applied and enhanced mechanics of a boon."""
+
+    __slots__ = ('slot', 'family', 'status', 'enhances')
+
+    def __init__(self, slot: Optional[str] = None, family: Optional[str] = None,
+                 status: Optional[str] = None, enhances: FrozenSet[str] = frozenset()):
+        self.slot = slot
+        self.family = family
+        self.status = status
+        self.enhances = enhances
+
+    @classmethod
+    def from_data(cls, boon_type: Optional[str], tags: Iterable[str],
+                  status: Optional[str]) -> 'BoonClass':
+        tags = tuple(tags)
+        slot = SLOT_TYPES.get(boon_type)
+        if slot is not None and slot not in tags:
+            slot = None
+        family = None
+        for tag in tags:
+            family = FAMILY_TAGS.get(_tag_base(tag))
+            if family is not None:
+                break
+        enhances = frozenset(tag[:-len('_enhancer')] for tag in tags if tag.endswith('_enhancer'))
+        return cls(slot, family, status, enhances)
+
+    @classmethod
+    def from_name(cls, name: str) -> 'BoonClass':
+        for keyword, slot in NAME_SLOT_KEYWORDS:
+            if keyword in name:
+                return cls(slot)
+        return cls()
+
+    def __repr__(self) -> str:
+        return f"BoonClass({self.slot!r}, {self.family!r}, {self.status!r}, {sorted(self.enhances)})"
+
+
+class BoonRecord:
+    """One boon (regular, duo or legendary) with its ids and masks."""
+
+    __slots__ = (
+        'id', 'bit', 'name', 'kind', 'god', 'god_mask', 'type', 'tier',
+        'tags', 'tag_mask', 'status', 'prerequisites', 'requires_mask', 'data',
+        'classification'
+    )
+
+    def __init__(self, boon_id: int, name: str, kind: str, data: Dict[str, Any]):
+        self.id = boon_id
+        self.bit = 1 << boon_id
+        self.name = name
+        self.kind = kind  # "boon", "duo" or "legendary"
+        self.data = data
+        self.god: Optional[str] = data.get('god')
+        self.god_mask = 0
+        self.type: Optional[str] = data.get('type')
+        self.tier: Optional[str] = data.get('tier')
+        self.tags: Tuple[str, ...] = tuple(data.get('tags', ()))
+        self.tag_mask = 0
+        self.status: Optional[str] = data.get('status_curse_applied')
+        # (prerequisite name, prerequisite bit) in data.py order
+        self.prerequisites: Tuple[Tuple[str, int], ...] = ()
+        self.requires_mask = 0
+        if kind == "boon" and self.type is None:
+            # Placeholder for a prerequisite missing from BOONS_DATA
+            self.classification = BoonClass.from_name(name)
+        else:
+            self.classification = BoonClass.from_data(self.type, self.tags, self.status)
+
+    def __repr__(self) -> str:
+        return f"BoonRecord({self.id}, {self.name!r}, {self.kind})"
+
+
+class BoonCatalog:
+    """
+    Boons, gods and tags from data.py compiled to integer ids.
+
+    Ids follow data.py order (gods, then regular boons, duos, legendaries),
+    so they are stable for a given data file.  A build is two ints: a boon
+    mask with bit ``record.id`` per acquired boon and a god mask with bit
+    ``god_ids[god]`` per god.  Duo and legendary requirements are compiled
+    to ``god_mask``/``requires_mask``, so checking them is an AND plus a
+    compare.
+
+    Reverse indexes map a boon to the duos and legendaries it unlocks and
+    a god pair to its duos, so per-boon lookups cost the size of the
+    answer rather than a scan of the duo/legendary tables.
+
+    ``classify`` answers slot, damage family, status and enhancer-of
+    questions from the ``type``/``tags`` fields with one dict lookup,
+    replacing keyword checks on boon names.
+    """
+
+    def __init__(self):
+        self.god_ids: Dict[str, int] = {god: i for i, god in enumerate(GODS_DATA)}
+        self.tag_ids: Dict[str, int] = {}
+        self.records: List[BoonRecord] = []
+        self.by_name: Dict[str, BoonRecord] = {}
+        self.classes: Dict[str, BoonClass] = {}
+
+        for boon in BOONS_DATA:
+            self._add(boon['name'], "boon", boon)
+        for duo in DUO_BOONS_DATA:
+            self._add(duo['name'], "duo", duo)
+        for legendary in LEGENDARY_BOONS_DATA:
+            self._add(legendary['name'], "legendary", legendary)
+
+        for record in self.records:
+            if record.god is not None:
+                record.god_mask = self.god_mask([record.god])
+            for tag in record.tags:
+                tag_id = self.tag_ids.setdefault(tag, len(self.tag_ids))
+                record.tag_mask |= 1 << tag_id
+
+        self.duos = [r for r in self.records if r.kind == "duo"]
+        self.legendaries = [r for r in self.records if r.kind == "legendary"]
+        for record in self.duos + self.legendaries:
+            gods = record.data.get('gods', [record.god])
+            record.god_mask = self.god_mask(gods)
+            prerequisites = []
+            for _, name in record.data.get('prerequisites', []):
+                prerequisite = self.by_name.get(name) or self._add(name, "boon", {})
+                prerequisites.append((name, prerequisite.bit))
+                record.requires_mask |= prerequisite.bit
+            record.prerequisites = tuple(prerequisites)
+
+        for record in self.records:
+            self.classes[record.name] = record.classification
+
+        # === REVERSE INDEXES ===
+        self.duos_by_boon: Dict[str, List[BoonRecord]] = {}
+        self.legendaries_by_boon: Dict[str, List[BoonRecord]] = {}
+        self.duos_by_god_pair: Dict[Tuple[str, str], List[BoonRecord]] = {}
+        self.legendaries_by_god: Dict[str, List[BoonRecord]] = {}
+        for duo in self.duos:
+            for name in dict.fromkeys(name for name, _ in duo.prerequisites):
+                self.duos_by_boon.setdefault(name, []).append(duo)
+            gods = duo.data.get('gods', [])
+            for i, god in enumerate(gods):
+                for other in gods[i + 1:]:
+                    self.duos_by_god_pair.setdefault(self.god_pair(god, other), []).append(duo)
+        for legendary in self.legendaries:
+            for name in dict.fromkeys(name for name, _ in legendary.prerequisites):
+                self.legendaries_by_boon.setdefault(name, []).append(legendary)
+            self.legendaries_by_god.setdefault(legendary.god, []).append(legendary)
+
+    def _add(self, name: str, kind: str, data: Dict[str, Any]) -> BoonRecord:
+        record = self.by_name.get(name)
+        if record is None:
+            record = BoonRecord(len(self.records), name, kind, data)
+            self.records.append(record)
+            self.by_name[name] = record
+        return record
+
+    # === MASKS ===
+
+    def boon_mask(self, names: Iterable[str]) -> int:
+        """Mask of the given boon names (names not in data.py are ignored)."""
+        mask = 0
+        by_name = self.by_name
+        for name in names:
+            record = by_name.get(name)
+            if record is not None:
+                mask |= record.bit
+        return mask
+
+    def god_mask(self, gods: Iterable[str]) -> int:
+        mask = 0
+        for god in gods:
+            god_id = self.god_ids.get(god)
+            if god_id is not None:
+                mask |= 1 << god_id
+        return mask
+
+    def tag_mask(self, tags: Iterable[str]) -> int:
+        mask = 0
+        for tag in tags:
+            tag_id = self.tag_ids.get(tag)
+            if tag_id is not None:
+                mask |= 1 << tag_id
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Boon names in a mask, in id order."""
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.records[low.bit_length() - 1].name)
+            mask ^= low
+        return names
+
+    def get(self, name: str) -> Optional[BoonRecord]:
+        return self.by_name.get(name)
+
+    # === CLASSIFICATION ===
+
+    def classify(self, name: str) -> BoonClass:
+        """Classification of a boon; unknown names fall back to name keywords."""
+        boon_class = self.classes.get(name)
+        if boon_class is None:
+            boon_class = BoonClass.from_name(name)
+            self.classes[name] = boon_class
+        return boon_class
+
+    def slot(self, name: str) -> Optional[str]:
+        """Core slot a boon fills ("attack", "special", "dash", "cast", "call")."""
+        return self.classify(name).slot
+
+    def slots(self, names: Iterable[str]) -> Set[str]:
+        """Core slots filled by a build."""
+        classify = self.classify
+        return {slot for slot in (classify(name).slot for name in names) if slot is not None}
+
+    def has_slot(self, names: Iterable[str], slot: str) -> bool:
+        classify = self.classify
+        return any(classify(name).slot == slot for name in names)
+
+    def family(self, name: str) -> Optional[str]:
+        """Damage family ("lightning", "crit", "doom", ...) of a boon."""
+        return self.classify(name).family
+
+    # === REVERSE LOOKUPS ===
+
+    @staticmethod
+    def god_pair(god: str, other: str) -> Tuple[str, str]:
+        """Order-independent key for duos_by_god_pair."""
+        return (god, other) if god <= other else (other, god)
+
+    def duos_for_boon(self, name: str) -> List[BoonRecord]:
+        """Duos that list ``name`` as a prerequisite, in data.py order."""
+        return self.duos_by_boon.get(name, [])
+
+    def legendaries_for_boon(self, name: str) -> List[BoonRecord]:
+        """Legendaries that list ``name`` as a prerequisite, in data.py order."""
+        return self.legendaries_by_boon.get(name, [])
+
+    def duos_for_gods(self, god: str, other: str) -> List[BoonRecord]:
+        """Duos shared by two gods, in data.py order."""
+        return self.duos_by_god_pair.get(self.god_pair(god, other), [])
+
+    def legendaries_for_god(self, god: str) -> List[BoonRecord]:
+        return self.legendaries_by_god.get(god, [])
+
+    # === REQUIREMENTS ===
+
+    @staticmethod
+    def requirements_met(record: BoonRecord, boon_mask: int, god_mask: int) -> bool:
+        """Whether a build has every god and prerequisite a duo/legendary needs."""
+        return (god_mask & record.god_mask == record.god_mask
+                and boon_mask & record.requires_mask == record.requires_mask)
+
+    def count_available(self, records: List[BoonRecord], boon_mask: int, god_mask: int) -> int:
+        """How many of ``records`` have all requirements met by a build."""
+        return sum(1 for record in records if self.requirements_met(record, boon_mask, god_mask))
+
+
+CATALOG = BoonCatalog()
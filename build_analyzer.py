@@ -2,8 +2,10 @@
 Build Analyzer - Boss prep, Pom priority, Chaos calculator, Build strength
 """
 
-from typing import Dict, List, Set
-from data import BOON_NAME_TO_DATA, DUO_BOONS_DATA, LEGENDARY_BOONS_DATA
+from typing import Dict, List, Any, Optional, Set
+from data import BOON_NAME_TO_DATA, BIOME_ENDS
+from boon_catalog import CATALOG
+from dps_engine import LIVE_ENGINE, POM
 
 
 class BuildAnalyzer:
@@ -19,9 +21,12 @@ class BuildAnalyzer:
         self.max_health = 100
         self.room_number = 1
         self.region = "Tartarus"
+        self.aspect = None
+        self.death_defiances = 0
         
     def set_state(self, boons: Set[str], gods: Set[str], poms: Dict, hammers: int, 
-                  weapon: str, hp: int, max_hp: int, room: int, region: str):
+                  weapon: str, hp: int, max_hp: int, room: int, region: str,
+                  aspect: Optional[str] = None, death_defiances: int = 0):
         """Update analyzer state."""
         self.acquired_boons = boons
         self.selected_gods = gods
@@ -32,9 +37,66 @@ class BuildAnalyzer:
         self.max_health = max_hp
         self.room_number = room
         self.region = region
+        self.aspect = aspect
+        self.death_defiances = death_defiances
     
-    def calculate_build_strength(self) -> Dict:
-        """Calculate overall build strength (0-100)."""
+    def _dps_build(self) -> Dict[str, Any]:
+        """Current build in the DPS engine's format."""
+        return {
+            'weapon': self.weapon,
+            'aspect': self.aspect,
+            'boons': self.acquired_boons,
+            'pom_levels': self.pom_levels,
+            'hammers': self.hammer_count,
+        }
+    
+    def extract_features(self) -> Dict[str, Any]:
+        """
+        Everything the advisors score a build on, computed once.
+        
+        Slot coverage, duo/legendary counts, synergy and DPS depend only on
+        the build; HP, room, region and Death Defiances are the run context.
+        Cache the result on (build fingerprint, context) and hand it to
+        calculate_build_strength and the advisors.
+        """
+        slots = CATALOG.slots(self.acquired_boons)
+        dps = LIVE_ENGINE.dps(self._dps_build()) if self.weapon else 0.0
+        
+        return {
+            # Build
+            'weapon': self.weapon,
+            'aspect': self.aspect,
+            'boon_count': len(self.acquired_boons),
+            'god_count': len(self.selected_gods),
+            'gods_in_build': sorted(self.selected_gods),
+            'hammer_count': self.hammer_count,
+            'avg_pom_level': sum(self.pom_levels.values()) / len(self.pom_levels) if self.pom_levels else 1,
+            'slots': frozenset(slots),
+            'has_attack': 'attack' in slots,
+            'has_special': 'special' in slots,
+            'has_cast': 'cast' in slots,
+            'has_dash': 'dash' in slots,
+            'has_call': 'call' in slots,
+            'duo_count': self._count_duo_boons(),
+            'legendary_count': self._count_legendary_boons(),
+            'good_synergy': self._has_good_synergy(),
+            'dps': dps,
+            'dps_total': int(dps),
+            # Run context
+            'room': self.room_number,
+            'region': self.region,
+            'rooms_to_boss': BIOME_ENDS.get(self.region, 14) - self.room_number,
+            'health': self.current_health,
+            'max_health': self.max_health,
+            'hp_percent': self.current_health / self.max_health if self.max_health > 0 else 1.0,
+            'dd_remaining': self.death_defiances,
+        }
+    
+    def calculate_build_strength(self, features: Optional[Dict[str, Any]] = None) -> Dict:
+        """Calculate overall build strength (0-100), from cached features if given."""
+        if features is None:
+            features = self.extract_features()
+        
         strength = {
             'total': 0,
             'offense': 0,
@@ -48,9 +110,9 @@ class BuildAnalyzer:
         # === OFFENSE (40 points) ===
         offense = 0
         
-        has_attack = any('Strike' in b for b in self.acquired_boons)
-        has_special = any('Flourish' in b for b in self.acquired_boons)
-        has_cast = any('Shot' in b or 'Cast' in b for b in self.acquired_boons)
+        has_attack = features['has_attack']
+        has_special = features['has_special']
+        has_cast = features['has_cast']
         
         if has_attack:
             offense += 12
@@ -65,14 +127,14 @@ class BuildAnalyzer:
         if has_cast:
             offense += 8
         
-        if self.hammer_count >= 1:
+        if features['hammer_count'] >= 1:
             offense += 5
-            strength['breakdown'].append(f"✅ {self.hammer_count} Hammer(s)")
+            strength['breakdown'].append(f"✅ {features['hammer_count']} Hammer(s)")
         else:
             strength['breakdown'].append("❌ No Daedalus Hammer")
         
-        duo_count = self._count_duo_boons()
-        legendary_count = self._count_legendary_boons()
+        duo_count = features['duo_count']
+        legendary_count = features['legendary_count']
         
         offense += duo_count * 3
         offense += legendary_count * 2
@@ -85,8 +147,8 @@ class BuildAnalyzer:
         # === DEFENSE (25 points) ===
         defense = 0
         
-        has_dash = any('Dash' in b for b in self.acquired_boons)
-        has_call = any('Aid' in b or 'Call' in b for b in self.acquired_boons)
+        has_dash = features['has_dash']
+        has_call = features['has_call']
         
         if has_dash:
             defense += 8
@@ -98,7 +160,7 @@ class BuildAnalyzer:
             defense += 7
             strength['breakdown'].append("✅ Call boon")
         
-        hp_percent = (self.current_health / self.max_health) * 100 if self.max_health > 0 else 0
+        hp_percent = features['hp_percent'] * 100 if features['max_health'] > 0 else 0
         if hp_percent >= 80:
             defense += 10
         elif hp_percent >= 60:
@@ -114,21 +176,17 @@ class BuildAnalyzer:
         # === UTILITY (20 points) ===
         utility = 0
         
-        god_count = len(self.selected_gods)
-        utility += min(god_count * 3, 12)
-        
-        boon_count = len(self.acquired_boons)
-        utility += min(boon_count, 8)
+        utility += min(features['god_count'] * 3, 12)
+        utility += min(features['boon_count'], 8)
         
         strength['utility'] = min(utility, 20)
         
         # === CONSISTENCY (15 points) ===
         consistency = 0
         
-        avg_pom_level = sum(self.pom_levels.values()) / len(self.pom_levels) if self.pom_levels else 1
-        consistency += min(int((avg_pom_level - 1) * 3), 10)
+        consistency += min(int((features['avg_pom_level'] - 1) * 3), 10)
         
-        if self._has_good_synergy():
+        if features['good_synergy']:
             consistency += 5
             strength['breakdown'].append("✅ Good boon synergy")
         
@@ -210,11 +268,12 @@ class BuildAnalyzer:
         defense_score = (build_strength['defense'] / 25) * 25
         readiness += defense_score
         
-        if not any('Dash' in b for b in self.acquired_boons):
+        slots = CATALOG.slots(self.acquired_boons)
+        if 'dash' not in slots:
             boss_info['warnings'].append("⚠️ No defensive dash")
             boss_info['recommendations'].append("Get Athena/Poseidon dash")
         
-        if not any('Aid' in b or 'Call' in b for b in self.acquired_boons):
+        if 'call' not in slots:
             boss_info['warnings'].append("⚠️ No Call ability")
             boss_info['recommendations'].append("Get a Call for emergency damage")
         
@@ -238,34 +297,40 @@ class BuildAnalyzer:
         """Rank which boons to upgrade with Pom."""
         priorities = []
         
-        for boon_name in self.acquired_boons:
-            boon_data = BOON_NAME_TO_DATA.get(boon_name)
-            if not boon_data:
-                continue
-            
+        candidates = [
+            boon_name for boon_name in self.acquired_boons
+            if boon_name in BOON_NAME_TO_DATA and self.pom_levels.get(boon_name, 1) < 10
+        ]
+        
+        # Marginal DPS of one Pom on every candidate, in one pass
+        build = self._dps_build()
+        current_dps = LIVE_ENGINE.dps(build)
+        pom_dps = LIVE_ENGINE.evaluate_deltas(build, [(POM, boon_name) for boon_name in candidates])
+        
+        for boon_name, new_dps in zip(candidates, pom_dps):
+            boon_data = BOON_NAME_TO_DATA[boon_name]
             current_level = self.pom_levels.get(boon_name, 1)
-            
-            if current_level >= 10:
-                continue
+            dps_gain = (float(new_dps) - current_dps) / current_dps * 100 if current_dps > 0 else 0.0
             
             score = 50
             reasons = []
             
-            if 'Strike' in boon_name:
+            if dps_gain > 0:
+                score += min(15, int(dps_gain))
+                reasons.append(f"+{dps_gain:.1f}% DPS")
+            
+            slot = CATALOG.slot(boon_name)
+            if slot == 'attack':
                 score += 30
                 reasons.append("Core attack damage")
-            elif 'Flourish' in boon_name:
+            elif slot == 'special':
                 score += 25
                 reasons.append("Core special damage")
-            elif 'Shot' in boon_name or 'Cast' in boon_name:
+            elif slot == 'cast':
                 score += 20
                 reasons.append("Cast damage")
             
-            is_duo_prereq = any(
-                boon_name in [b for _, b in duo['prerequisites']]
-                for duo in DUO_BOONS_DATA
-            )
-            if is_duo_prereq:
+            if CATALOG.duos_for_boon(boon_name):
                 score += 15
                 reasons.append("Enables duo boon")
             
@@ -286,10 +351,11 @@ class BuildAnalyzer:
                 'current_level': current_level,
                 'score': score,
                 'reasons': reasons,
-                'god': boon_data['god']
+                'god': boon_data['god'],
+                'dps_gain': round(dps_gain, 1)
             })
         
-        priorities.sort(key=lambda x: x['score'], reverse=True)
+        priorities.sort(key=lambda x: (x['score'], x['dps_gain']), reverse=True)
         return priorities
     
     def chaos_gate_risk_assessment(self, curse_description: str, blessing_description: str) -> Dict:
@@ -315,8 +381,7 @@ class BuildAnalyzer:
         elif hp_percent < 80:
             risk += 10
         
-        boss_rooms = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        boss_room = boss_rooms.get(self.region, 14)
+        boss_room = BIOME_ENDS.get(self.region, 14)
         rooms_until_boss = boss_room - self.room_number
         
         if rooms_until_boss <= 2:
@@ -368,23 +433,13 @@ class BuildAnalyzer:
     
     def _count_duo_boons(self) -> int:
         """Count acquired duo boons."""
-        count = 0
-        for duo in DUO_BOONS_DATA:
-            if all(g in self.selected_gods for g in duo['gods']):
-                prereqs_met = all(b in self.acquired_boons for _, b in duo['prerequisites'])
-                if prereqs_met:
-                    count += 1
-        return count
+        return CATALOG.count_available(CATALOG.duos, CATALOG.boon_mask(self.acquired_boons),
+                                       CATALOG.god_mask(self.selected_gods))
     
     def _count_legendary_boons(self) -> int:
         """Count acquired legendary boons."""
-        count = 0
-        for leg in LEGENDARY_BOONS_DATA:
-            if leg['god'] in self.selected_gods:
-                prereqs_met = all(b in self.acquired_boons for _, b in leg['prerequisites'])
-                if prereqs_met:
-                    count += 1
-        return count
+        return CATALOG.count_available(CATALOG.legendaries, CATALOG.boon_mask(self.acquired_boons),
+                                       CATALOG.god_mask(self.selected_gods))
     
     def _has_good_synergy(self) -> bool:
         """Check if build has good synergy."""
@@ -399,9 +454,9 @@ class BuildAnalyzer:
         
         for god in gods:
             has_attack = any(b for b in self.acquired_boons 
-                           if BOON_NAME_TO_DATA.get(b, {}).get('god') == god and 'Strike' in b)
+                           if BOON_NAME_TO_DATA.get(b, {}).get('god') == god and CATALOG.slot(b) == 'attack')
             has_special = any(b for b in self.acquired_boons 
-                            if BOON_NAME_TO_DATA.get(b, {}).get('god') == god and 'Flourish' in b)
+                            if BOON_NAME_TO_DATA.get(b, {}).get('god') == god and CATALOG.slot(b) == 'special')
             if has_attack and has_special:
                 return True
         
@@ -0,0 +1,83 @@
+"""
+Hades Build Helper - Build Cache Module
+Bounded LRU memoization of per-build results (DPS, win chance, strength).
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable
+
+
+class BuildCache:
+    """
+    Least-recently-used cache shared by every per-build calculation.
+
+    Keys are ``(kind, fingerprint, *extra)`` tuples, where the fingerprint
+    is ``BuildState.fingerprint``, so DPS, win probability and build
+    strength live side by side and evict each other fairly.  Changing the
+    build changes the fingerprint, so entries never need to be invalidated
+    by hand; toggling back to an earlier build is a hit.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, computing and storing it on a miss."""
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            pass
+        else:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = compute()
+        self.store(key, value)
+        return value
+
+    def find(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for ``key`` (counted as a hit or miss), or ``default``."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh an entry, evicting the least recently used one if full."""
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for tuning ``max_entries``."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits / lookups * 100) if lookups else 0.0,
+        }
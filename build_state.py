@@ -0,0 +1,178 @@
+"""
+Hades Build Helper - Build State Module
+Current build with an incrementally maintained 64-bit fingerprint.
+"""
+
+import hashlib
+from typing import Dict, List, Callable, Hashable, Iterable, Optional, Set, Tuple
+
+
+_ZOBRIST_KEYS: Dict[Tuple[Hashable, ...], int] = {}
+
+
+def zobrist_key(*feature: Hashable) -> int:
+    """
+    Stable random 64-bit key for one build feature, e.g. ``("boon", name)``.
+
+    Keys come from BLAKE2b of the feature, so they are the same in every
+    session (unlike ``hash()``) and need no precomputed table.
+    """
+    key = _ZOBRIST_KEYS.get(feature)
+    if key is None:
+        digest = hashlib.blake2b(repr(feature).encode('utf-8'), digest_size=8).digest()
+        key = int.from_bytes(digest, 'little')
+        _ZOBRIST_KEYS[feature] = key
+    return key
+
+
+class BuildState:
+    """
+    Weapon, aspect, boons, gods, pom levels, hammers, room and death
+    defiances of the current run.
+
+    ``fingerprint`` is the XOR of one Zobrist key per feature (each boon,
+    god, explicit pom level, and the weapon/aspect/room/DD/hammer values).
+    Every mutator XORs the old feature out and the new one in, so the
+    fingerprint is always current and costs O(1) to read or update.  Read
+    the collections freely but change them only through these methods,
+    otherwise the fingerprint goes stale.
+
+    ``listener`` (if set) is called with the name of each part that
+    changed: ``weapon``, ``aspect``, ``boons``, ``gods``, ``poms``,
+    ``hammers``, ``room`` or ``dd``.  The app feeds these to its
+    ReactiveStore as inputs.
+    """
+
+    def __init__(self):
+        self.weapon: Optional[str] = None
+        self.aspect: Optional[str] = None
+        self.boons: Set[str] = set()
+        self.gods: Set[str] = set()
+        self.pom_levels: Dict[str, int] = {}
+        self.hammers: List[str] = []
+        self.room = 1
+        self.death_defiances = 3
+        self.fingerprint = self.compute_fingerprint()
+        self.listener: Optional[Callable[[str], None]] = None
+
+    def compute_fingerprint(self) -> int:
+        """Fingerprint recomputed from scratch (the incremental value must match)."""
+        fingerprint = (zobrist_key('weapon', self.weapon) ^ zobrist_key('aspect', self.aspect)
+                       ^ zobrist_key('hammers', len(self.hammers)) ^ zobrist_key('room', self.room)
+                       ^ zobrist_key('dd', self.death_defiances))
+        for boon in self.boons:
+            fingerprint ^= zobrist_key('boon', boon)
+        for god in self.gods:
+            fingerprint ^= zobrist_key('god', god)
+        for boon, level in self.pom_levels.items():
+            fingerprint ^= zobrist_key('pom', boon, level)
+        return fingerprint
+
+    def copy(self) -> 'BuildState':
+        """Independent copy with the same fingerprint (and no listener)."""
+        state = BuildState.__new__(BuildState)
+        state.weapon = self.weapon
+        state.aspect = self.aspect
+        state.boons = set(self.boons)
+        state.gods = set(self.gods)
+        state.pom_levels = dict(self.pom_levels)
+        state.hammers = list(self.hammers)
+        state.room = self.room
+        state.death_defiances = self.death_defiances
+        state.fingerprint = self.fingerprint
+        state.listener = None
+        return state
+
+    def _changed(self, *parts: str) -> None:
+        if self.listener is not None:
+            for part in parts:
+                self.listener(part)
+
+    # === SCALARS ===
+
+    def _swap(self, kind: str, old: Hashable, new: Hashable) -> None:
+        self.fingerprint ^= zobrist_key(kind, old) ^ zobrist_key(kind, new)
+        if old != new:
+            self._changed(kind)
+
+    def set_weapon(self, weapon: Optional[str]) -> None:
+        old, self.weapon = self.weapon, weapon
+        self._swap('weapon', old, weapon)
+
+    def set_aspect(self, aspect: Optional[str]) -> None:
+        old, self.aspect = self.aspect, aspect
+        self._swap('aspect', old, aspect)
+
+    def set_room(self, room: int) -> None:
+        old, self.room = self.room, room
+        self._swap('room', old, room)
+
+    def set_death_defiances(self, count: int) -> None:
+        old, self.death_defiances = self.death_defiances, count
+        self._swap('dd', old, count)
+
+    def add_hammer(self, hammer: str) -> None:
+        self.hammers.append(hammer)
+        self._swap('hammers', len(self.hammers) - 1, len(self.hammers))
+
+    # === BOONS, GODS AND POMS ===
+
+    def add_god(self, god: str) -> None:
+        if god not in self.gods:
+            self.gods.add(god)
+            self.fingerprint ^= zobrist_key('god', god)
+            self._changed('gods')
+
+    def add_boon(self, boon: str, god: Optional[str] = None, level: int = 1) -> None:
+        """Add a boon (and its god) at a pom level."""
+        if boon not in self.boons:
+            self.boons.add(boon)
+            self.fingerprint ^= zobrist_key('boon', boon)
+            self._changed('boons')
+        if god is not None:
+            self.add_god(god)
+        self.set_pom(boon, level)
+
+    def remove_boon(self, boon: str) -> None:
+        if boon in self.boons:
+            self.boons.discard(boon)
+            self.fingerprint ^= zobrist_key('boon', boon)
+            self._changed('boons')
+        self.clear_pom(boon)
+
+    def set_pom(self, boon: str, level: int) -> None:
+        old = self.pom_levels.get(boon)
+        if old == level:
+            return
+        if old is not None:
+            self.fingerprint ^= zobrist_key('pom', boon, old)
+        self.pom_levels[boon] = level
+        self.fingerprint ^= zobrist_key('pom', boon, level)
+        self._changed('poms')
+
+    def clear_pom(self, boon: str) -> None:
+        old = self.pom_levels.pop(boon, None)
+        if old is not None:
+            self.fingerprint ^= zobrist_key('pom', boon, old)
+            self._changed('poms')
+
+    def clear_boons(self) -> None:
+        """Drop every boon and pom level (gods and weapon stay)."""
+        for boon in self.boons:
+            self.fingerprint ^= zobrist_key('boon', boon)
+        for boon, level in self.pom_levels.items():
+            self.fingerprint ^= zobrist_key('pom', boon, level)
+        self.boons.clear()
+        self.pom_levels.clear()
+        self._changed('boons', 'poms')
+
+    def load(self, weapon: Optional[str], aspect: Optional[str], boons: Iterable[str],
+             pom_levels: Dict[str, int], gods: Iterable[str]) -> None:
+        """Replace the build with a saved template."""
+        self.weapon = weapon
+        self.aspect = aspect
+        self.boons = set(boons)
+        self.pom_levels = dict(pom_levels)
+        self.gods = set(gods)
+        self.fingerprint = self.compute_fingerprint()
+        self._changed('weapon', 'aspect', 'boons', 'poms', 'gods')
@@ -0,0 +1,113 @@
+"""
+Hades Build Helper - Build View Module
+Read-only build properties and per-build helpers shared by the app and the simulator.
+"""
+
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from data import BOON_NAME_TO_DATA
+from dps_engine import LIVE_ENGINE
+
+
+class BuildViewMixin:
+    """
+    What the advisors read from "the app", computed from ``self.build``.
+
+    Mixed into HadesHelperUltimate, run_simulator.SimulatedRun and
+    door_planner.PlanState so the three cannot drift apart.  The class
+    must provide ``build`` (a BuildState); ``analyze_boon_synergies`` also
+    needs ``synergy_analyzer`` and ``_extract_build_features`` needs
+    ``build_analyzer``, ``current_health``, ``max_health`` and
+    ``current_region``.
+    """
+
+    __slots__ = ()
+
+    # === BUILD STATE (read-only views; change it through self.build) ===
+
+    @property
+    def selected_gods(self) -> Set[str]:
+        return self.build.gods
+
+    @property
+    def acquired_boons(self) -> Set[str]:
+        return self.build.boons
+
+    @property
+    def selected_weapon(self) -> Optional[str]:
+        return self.build.weapon
+
+    @property
+    def selected_aspect(self) -> Optional[str]:
+        return self.build.aspect
+
+    @property
+    def pom_levels(self) -> Dict[str, int]:
+        return self.build.pom_levels
+
+    @property
+    def hammer_upgrades(self) -> List[str]:
+        return self.build.hammers
+
+    @property
+    def room_number(self) -> int:
+        return self.build.room
+
+    @property
+    def death_defiances_remaining(self) -> int:
+        return self.build.death_defiances
+
+    # === DPS ===
+
+    def _dps_build(self) -> Dict[str, Any]:
+        """Current build in the DPS engine's format."""
+        return {
+            'weapon': self.selected_weapon,
+            'aspect': self.selected_aspect,
+            'boons': self.acquired_boons,
+            'pom_levels': self.pom_levels,
+            'hammers': len(self.hammer_upgrades),
+        }
+
+    def calculate_detailed_dps_value(self) -> float:
+        """Unrounded DPS of the current build."""
+        return LIVE_ENGINE.dps(self._dps_build())
+
+    def what_if_dps(self, deltas: List[Tuple]) -> List[float]:
+        """DPS after each candidate change (add boon, pom boon, add hammer), in one pass."""
+        return [float(dps) for dps in LIVE_ENGINE.evaluate_deltas(self._dps_build(), deltas)]
+
+    # === ANALYSIS ===
+
+    def analyze_boon_synergies(self, boon_name: str) -> Dict:
+        synergy_data = {'synergy_score': 0, 'synergies': [], 'duo_potential': []}
+        boon_data = BOON_NAME_TO_DATA.get(boon_name)
+        if not boon_data:
+            return synergy_data
+
+        god = boon_data.get('god')
+        duos = self.synergy_analyzer.get_duo_progress(
+            self.acquired_boons | {boon_name}, self.selected_gods | {god}
+        )
+
+        for duo in duos:
+            if duo['progress'] > 0:
+                synergy_data['duo_potential'].append({
+                    'name': duo['name'],
+                    'progress': duo['progress'],
+                    'ready': duo.get('ready', False)
+                })
+                if duo.get('ready'):
+                    synergy_data['synergy_score'] += 50
+
+        return synergy_data
+
+    def _extract_build_features(self) -> Dict[str, Any]:
+        """BuildAnalyzer feature vector of the current build and run context (uncached)."""
+        self.build_analyzer.set_state(
+            self.acquired_boons, self.selected_gods, self.pom_levels, len(self.hammer_upgrades),
+            self.selected_weapon, self.current_health, self.max_health, self.room_number,
+            self.current_region, aspect=self.selected_aspect,
+            death_defiances=self.death_defiances_remaining
+        )
+        return self.build_analyzer.extract_features()
@@ -0,0 +1,124 @@
+"""
+Hades Build Helper - God Combo Cube Module
+Precomputed run statistics for every subset of gods up to size 4.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+
+class GodComboCube:
+    """
+    Lattice of god subsets with run count, wins and total build score.
+
+    Every added run updates each subset (of size 0 to MAX_SUBSET_SIZE) of
+    the gods it used, so "runs containing Zeus + Poseidon" is a single
+    dict lookup.  The empty subset holds the totals over all runs.
+    With ten gods a run touches at most 386 cells.
+    """
+
+    MAX_SUBSET_SIZE = 4
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all cells."""
+        # subset (sorted tuple of gods) -> [runs, wins, total_score]
+        self.cells: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def rebuild(self, runs: Iterable[Dict[str, Any]]) -> None:
+        """Recompute all cells from a run list."""
+        self.reset()
+        for run in runs:
+            self.add(run)
+
+    @classmethod
+    def key(cls, gods: Iterable[str]) -> Tuple[str, ...]:
+        """Canonical cell key for a set of gods."""
+        key = tuple(sorted(set(gods)))
+        if len(key) > cls.MAX_SUBSET_SIZE:
+            raise ValueError(f"God combos are precomputed up to {cls.MAX_SUBSET_SIZE} gods")
+        return key
+
+    def add(self, run: Dict[str, Any]) -> None:
+        """Fold one run into every subset of its gods."""
+        gods = sorted(set(run.get('gods', [])))
+        win = 1 if run.get('victory', False) else 0
+        score = run.get('build_score', 0)
+        cells = self.cells
+
+        for size in range(min(len(gods), self.MAX_SUBSET_SIZE) + 1):
+            for subset in combinations(gods, size):
+                cell = cells.get(subset)
+                if cell is None:
+                    cells[subset] = [1, win, score]
+                else:
+                    cell[0] += 1
+                    cell[1] += win
+                    cell[2] += score
+
+    def merge(self, other: 'GodComboCube') -> 'GodComboCube':
+        """Add another cube's cells into this one (cubes over disjoint runs)."""
+        cells = self.cells
+        for subset, (runs, wins, score) in other.cells.items():
+            cell = cells.get(subset)
+            if cell is None:
+                cells[subset] = [runs, wins, score]
+            else:
+                cell[0] += runs
+                cell[1] += wins
+                cell[2] += score
+        return self
+
+    # === LOOKUPS ===
+
+    def stats(self, gods: Iterable[str]) -> Dict[str, Any]:
+        """Runs, wins, win rate and average score of runs containing all ``gods``."""
+        cell = self.cells.get(self.key(gods))
+        if cell is None:
+            return {'runs': 0, 'wins': 0, 'win_rate': 0.0, 'avg_score': 0.0}
+        runs, wins, total_score = cell
+        return {
+            'runs': runs,
+            'wins': wins,
+            'win_rate': wins / runs * 100,
+            'avg_score': total_score / runs
+        }
+
+    def win_rate(self, gods: Iterable[str]) -> Optional[float]:
+        """Win rate of runs containing all ``gods`` (None if there are none)."""
+        cell = self.cells.get(self.key(gods))
+        if cell is None:
+            return None
+        return cell[1] / cell[0] * 100
+
+    def subsets(self, size: int, min_runs: int = 1) -> List[Tuple[str, int, int, float]]:
+        """
+        Every subset of ``size`` gods with at least ``min_runs`` runs.
+
+        Returns:
+            Rows of (combo_string, runs, wins, win_rate), best win rate first
+        """
+        rows = [
+            (" + ".join(subset), runs, wins, wins / runs * 100)
+            for subset, (runs, wins, _) in self.cells.items()
+            if len(subset) == size and runs >= min_runs
+        ]
+        rows.sort(key=lambda x: (x[3], x[1]), reverse=True)
+        return rows
+
+    # === SNAPSHOTS ===
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """JSON-serializable copy of the cells (keys joined with " + ")."""
+        return {" + ".join(subset): list(cell) for subset, cell in self.cells.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Any]]) -> 'GodComboCube':
+        cube = cls()
+        cube.cells = {
+            (tuple(key.split(" + ")) if key else ()): list(cell)
+            for key, cell in data.items()
+        }
+        return cube
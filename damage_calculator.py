@@ -4,32 +4,15 @@ Real-time Damage Calculator for Hades builds
 
 from typing import Dict, List
 from data import BOON_NAME_TO_DATA
+from boon_catalog import CATALOG
+from dps_engine import CLASSIC_ENGINE, CLASSIC_WEAPONS, CLASSIC_MULTIPLIERS
 
 class DamageCalculator:
     """Calculate actual DPS based on build."""
     
-    # Base weapon damage values
-    BASE_DAMAGE = {
-        "Stygian Blade": {"attack": 20, "special": 30, "speed": 1.2},
-        "Heart-Seeking Bow": {"attack": 50, "special": 10, "speed": 0.8},
-        "Shield of Chaos": {"attack": 20, "special": 35, "speed": 1.0},
-        "Eternal Spear": {"attack": 25, "special": 40, "speed": 1.1},
-        "Twin Fists": {"attack": 12, "special": 20, "speed": 2.0},
-        "Adamant Rail": {"attack": 10, "special": 50, "speed": 3.0}
-    }
-    
-    # Damage bonus per boon type
-    DAMAGE_MULTIPLIERS = {
-        "Strike": 0.4,      # 40% damage increase
-        "Flourish": 0.6,    # 60% damage increase
-        "Deadly": 0.2,      # 20% + crit
-        "Heartbreak": 0.5,  # 50% + weak
-        "Thunder": 0.1,     # 10% + chain lightning
-        "Lightning": 0.1,   # 10% + chain
-        "Curse": 0.6,       # Doom damage
-        "Frost": 0.3,       # 30% + chill
-        "Tidal": 0.3,       # 30% knockback
-    }
+    # Base weapon damage values and damage bonus per boon slot/family
+    BASE_DAMAGE = CLASSIC_WEAPONS
+    DAMAGE_MULTIPLIERS = CLASSIC_MULTIPLIERS
     
     def __init__(self):
         self.weapon = None
@@ -61,52 +44,22 @@ class DamageCalculator:
                 "rating": "📊 No Weapon"
             }
         
-        weapon_data = self.BASE_DAMAGE.get(self.weapon, {"attack": 20, "speed": 1.0})
-        base_attack = weapon_data["attack"]
-        attack_speed = weapon_data["speed"]
-        
-        # Calculate damage multiplier from boons
-        total_multiplier = 1.0
-        crit_chance = 0.0
-        
-        for boon_name in self.boons:
-            boon_data = BOON_NAME_TO_DATA.get(boon_name)
-            if not boon_data:
-                continue
-            
-            # Check boon type and add multiplier
-            for damage_type, multiplier in self.DAMAGE_MULTIPLIERS.items():
-                if damage_type in boon_name:
-                    level = self.pom_levels.get(boon_name, 1)
-                    # Each pom level adds 2% more effectiveness
-                    adjusted_multiplier = multiplier * (1 + (level - 1) * 0.02)
-                    total_multiplier += adjusted_multiplier
-                    break
-            
-            # Check for crit boons
-            if "Deadly" in boon_name or "Artemis" in boon_data.get('god', ''):
-                crit_chance += 0.15  # 15% base crit chance
-        
-        # Hammer bonus (each hammer adds ~20% damage)
-        total_multiplier += self.hammer_count * 0.2
-        
-        # Calculate final damage
-        modified_damage = base_attack * total_multiplier
-        
-        # Apply critical hits (crits do 3x damage)
-        avg_damage_with_crit = modified_damage * (1 + crit_chance * 2)
-        
-        # Calculate DPS
-        dps = avg_damage_with_crit * attack_speed
+        result = CLASSIC_ENGINE.evaluate({
+            'weapon': self.weapon,
+            'boons': self.boons,
+            'pom_levels': self.pom_levels,
+            'hammers': self.hammer_count,
+        })
+        dps = result['dps']
         
         return {
             "total_dps": round(dps, 1),
-            "base_damage": base_attack,
-            "modified_damage": round(modified_damage, 1),
-            "crit_damage": round(avg_damage_with_crit, 1),
-            "multiplier": round(total_multiplier, 2),
-            "crit_chance": round(crit_chance * 100, 1),
-            "attack_speed": attack_speed,
+            "base_damage": result['base'],
+            "modified_damage": round(result['damage'], 1),
+            "crit_damage": round(result['crit_damage'], 1),
+            "multiplier": round(result['multiplier'], 2),
+            "crit_chance": round(result['crit_chance'] * 100, 1),
+            "attack_speed": result['speed'],
             "rating": self._rate_dps(dps)
         }
     
@@ -136,8 +89,9 @@ class DamageCalculator:
             return ["✨ Add boons to begin building"]
         
         # Check for attack/special boons
-        has_attack = any("Strike" in b for b in self.boons)
-        has_special = any("Flourish" in b for b in self.boons)
+        slots = CATALOG.slots(self.boons)
+        has_attack = "attack" in slots
+        has_special = "special" in slots
         
         if not has_attack:
             recommendations.append("⚡ Add an Attack boon for consistent damage")
@@ -281,3 +281,11 @@ TIER_ICONS = {
 
 # === BOSS DATA ===
 BOSSES = ["Tartarus", "Asphodel", "Elysium", "Temple of Styx", "Hades"]
+
+# Room number at which each biome's boss is fought
+BIOME_ENDS: Dict[str, int] = {
+    "Tartarus": 14,
+    "Asphodel": 24,
+    "Elysium": 36,
+    "Temple of Styx": 45,
+}
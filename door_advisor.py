@@ -4,7 +4,8 @@ Analyzes current build and recommends which door to take
 """
 
 from typing import Dict, List, Tuple, Set
-from data import GODS_DATA, DUO_BOONS_DATA, LEGENDARY_BOONS_DATA, BOON_NAME_TO_DATA
+from data import GODS_DATA, BOON_NAME_TO_DATA, BIOME_ENDS
+from boon_catalog import CATALOG
 
 
 class DoorAdvisor:
@@ -17,7 +18,12 @@ class DoorAdvisor:
         "Chaos Gate", "Trial of Gods", "Shop", "Fountain"
     ]
     
-    def __init__(self):
+    def __init__(self, analytics=None):
+        """
+        Args:
+            analytics: Optional RunAnalytics used to weigh gods by past results
+        """
+        self.analytics = analytics
         self.current_region = "Tartarus"
         self.room_number = 1
         self.current_health = 100
@@ -65,6 +71,15 @@ class DoorAdvisor:
                 score += legendary_potential
                 reasons.append(f"⚡ Progress toward legendary")
             
+            # Past runs with this god alongside the current ones
+            if self.analytics is not None:
+                pairing = self.analytics.get_pairing_win_rate(god, list(self.selected_gods))
+                if pairing and pairing[1] >= 3:
+                    win_rate, runs = pairing
+                    delta = win_rate - self.analytics.get_win_rate()
+                    score += int(max(-10, min(10, delta / 2)))
+                    reasons.append(f"📊 {win_rate:.0f}% win rate in {runs} past runs")
+            
             # Check if we need this god for build diversity
             if god not in self.selected_gods:
                 score += 15
@@ -190,18 +205,18 @@ class DoorAdvisor:
         """Check how much this god helps with duo boons."""
         score = 0
         
-        for duo in DUO_BOONS_DATA:
-            if god in duo['gods']:
-                # Check if we have the other god
-                other_gods = [g for g in duo['gods'] if g != god]
-                if all(g in self.selected_gods for g in other_gods):
-                    # Check prerequisite progress
-                    prereqs_needed = [b for _, b in duo['prerequisites'] if b not in self.acquired_boons]
-                    
-                    if len(prereqs_needed) == 1:
-                        score += 50  # One boon away!
-                    elif len(prereqs_needed) == 2:
-                        score += 25  # Two boons away
+        # Duos with a god we already have
+        for other_god in self.selected_gods:
+            if other_god == god:
+                continue
+            for duo in CATALOG.duos_for_gods(god, other_god):
+                # Check prerequisite progress
+                prereqs_needed = [b for b, _ in duo.prerequisites if b not in self.acquired_boons]
+                
+                if len(prereqs_needed) == 1:
+                    score += 50  # One boon away!
+                elif len(prereqs_needed) == 2:
+                    score += 25  # Two boons away
         
         return min(score, 60)  # Cap at 60
     
@@ -209,25 +224,17 @@ class DoorAdvisor:
         """Check legendary boon potential."""
         score = 0
         
-        for leg in LEGENDARY_BOONS_DATA:
-            if leg['god'] == god:
-                prereqs_needed = [b for _, b in leg['prerequisites'] if b not in self.acquired_boons]
-                
-                if len(prereqs_needed) <= 1:
-                    score += 30
+        for leg in CATALOG.legendaries_for_god(god):
+            prereqs_needed = [b for b, _ in leg.prerequisites if b not in self.acquired_boons]
+            
+            if len(prereqs_needed) <= 1:
+                score += 30
         
         return score
     
     def _rooms_until_boss(self) -> int:
         """Calculate rooms until next boss."""
-        region_boss_rooms = {
-            "Tartarus": 14,
-            "Asphodel": 24,
-            "Elysium": 36,
-            "Temple of Styx": 45
-        }
-        
-        boss_room = region_boss_rooms.get(self.current_region, 14)
+        boss_room = BIOME_ENDS.get(self.current_region, 14)
         return max(0, boss_room - self.room_number)
     
     def _get_recommendation(self, score: int) -> str:
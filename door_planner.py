@@ -0,0 +1,281 @@
+"""
+Hades Build Helper - Door Planner Module
+Expectimax lookahead over door choices until the biome boss.
+"""
+
+import random
+import time
+from typing import Dict, List, Any, Optional
+
+from boon_catalog import CATALOG
+from build_cache import BuildCache
+from build_state import BuildState, zobrist_key
+from build_view import BuildViewMixin
+from duo_intelligence import DuoIntelligence
+from run_simulator import (
+    Offering, OFFERABLE_BOONS, ROOM_DAMAGE, generate_offerings, apply_offering, room_damage, take_hit
+)
+
+
+VALUE_MAX = 100.0      # leaf values lie in [0, VALUE_MAX]
+HP_BUCKET = 10         # HP is memoized in buckets of this many points
+CORE_SLOTS = ('attack', 'special', 'cast', 'dash', 'call')
+
+# UniversalDoorAdvisor door types -> offerings the planner can play out;
+# other door types (shop, chaos, trial, resources ...) are modeled as no-ops
+DOOR_OFFERINGS = {
+    "Pom of Power": ("item", "Pom of Power"),
+    "Daedalus Hammer": ("item", "Daedalus Hammer"),
+    "Centaur Heart": ("item", "Centaur Heart"),
+    "Fountain (Healing)": ("item", "Fountain"),
+    "Gold (Coin Bag)": ("item", "Gold (50)"),
+}
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class PlanState(BuildViewMixin):
+    """
+    Run state inside the search.
+
+    The build is a BuildState and offerings, room damage and Death
+    Defiances go through the same transition functions as SimulatedRun
+    (run_simulator.apply_offering, room_damage, take_hit); ``apply`` and
+    ``advance`` just run them on a copy.  The fingerprint is the build's
+    Zobrist fingerprint plus one key per active god and one for max HP.
+    """
+
+    __slots__ = ('build', 'active_gods', 'current_region', 'current_health', 'max_health',
+                 'gold', 'alive')
+
+    @classmethod
+    def from_app(cls, app) -> 'PlanState':
+        """State of the app's current run (gods with boons count as active)."""
+        state = cls()
+        state.build = app.build.copy()
+        state.active_gods = set(app.selected_gods)
+        state.current_region = app.current_region
+        state.current_health = app.current_health
+        state.max_health = app.max_health
+        state.gold = 0
+        state.alive = app.current_health > 0
+        return state
+
+    @classmethod
+    def create(cls, weapon: Optional[str], aspect: Optional[str], boons, gods, active_gods,
+               poms: Dict[str, int], hammers: int, room: int, region: str,
+               hp: int, max_hp: int, dd: int) -> 'PlanState':
+        build = BuildState()
+        build.load(weapon, aspect, boons, poms, gods)
+        for i in range(hammers):
+            build.add_hammer(f"Hammer {i + 1}")
+        build.set_room(room)
+        build.set_death_defiances(dd)
+        state = cls()
+        state.build = build
+        state.active_gods = set(active_gods) | build.gods
+        state.current_region = region
+        state.current_health = hp
+        state.max_health = max_hp
+        state.gold = 0
+        state.alive = hp > 0
+        return state
+
+    @property
+    def fingerprint(self) -> int:
+        fingerprint = self.build.fingerprint ^ zobrist_key('max_hp', self.max_health)
+        for god in self.active_gods:
+            fingerprint ^= zobrist_key('active', god)
+        return fingerprint
+
+    def copy(self) -> 'PlanState':
+        state = PlanState()
+        state.build = self.build.copy()
+        state.active_gods = set(self.active_gods)
+        state.current_region = self.current_region
+        state.current_health = self.current_health
+        state.max_health = self.max_health
+        state.gold = self.gold
+        state.alive = self.alive
+        return state
+
+    # === TRANSITIONS ===
+
+    def apply(self, offering: Offering) -> 'PlanState':
+        """State after taking an offering."""
+        state = self.copy()
+        apply_offering(state, offering)
+        return state
+
+    def advance(self) -> 'PlanState':
+        """Clear the room: expected room damage, a Death Defiance if it kills, next room."""
+        state = self.copy()
+        cap = ROOM_DAMAGE.get(state.current_region, 20)
+        take_hit(state, room_damage(state.calculate_detailed_dps_value(), cap / 2))
+        state.build.set_room(state.build.room + 1)
+        return state
+
+
+def evaluate(state: PlanState) -> float:
+    """
+    Static value of a state in [0, VALUE_MAX].
+
+    DPS (35), core slots (20), ready duos (15), ready legendaries (5),
+    HP (15) and Death Defiances left (10).
+    """
+    if not state.alive:
+        return 0.0
+    boons = state.acquired_boons
+    dps = state.calculate_detailed_dps_value()
+    slots = CATALOG.slots(boons)
+    boon_mask = CATALOG.boon_mask(boons)
+    god_mask = CATALOG.god_mask(state.selected_gods)
+    duos = CATALOG.count_available(CATALOG.duos, boon_mask, god_mask)
+    legendaries = CATALOG.count_available(CATALOG.legendaries, boon_mask, god_mask)
+    health = min(state.current_health / state.max_health, 1.0) if state.max_health > 0 else 0.0
+    return (35.0 * min(dps / 300.0, 1.0)
+            + 4.0 * sum(1 for slot in CORE_SLOTS if slot in slots)
+            + min(15.0, 7.5 * duos)
+            + min(5.0, 2.5 * legendaries)
+            + 15.0 * health
+            + 10.0 * min(state.death_defiances_remaining, 3) / 3)
+
+
+class DoorPlanner:
+    """
+    Expectimax search over door choices for the rest of the biome.
+
+    Max nodes pick a door; chance nodes average over ``samples`` offering
+    sets drawn from the run_simulator offering model (a god door with no
+    boon named averages over that god's boons).  Chance nodes are cut off
+    as soon as even perfect remaining outcomes (VALUE_MAX) cannot beat the
+    best door found so far (Star1 pruning).  Values are memoized on
+    (fingerprint, room, HP bucket, depth) in an LRU table kept between
+    calls.  Iterative deepening runs until the time budget is spent and
+    returns the deepest completed search, so more time gives a deeper plan.
+    """
+
+    def __init__(self, time_budget: float = 0.05, samples: int = 3, max_depth: int = 12,
+                 table_size: int = 100000):
+        self.time_budget = time_budget
+        self.samples = samples
+        self.max_depth = max_depth
+        self.table = BuildCache(max_entries=table_size)
+        self.duo_intelligence = DuoIntelligence()
+        self.nodes = 0
+        self._deadline = 0.0
+
+    # === API ===
+
+    def plan(self, state: PlanState, offerings: List[Offering],
+             time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Value of taking each offering, looking ahead to the biome boss.
+
+        Returns:
+            Dict with best (index), values (per offering, in order), depth
+            (rooms searched ahead), rooms_left, nodes and elapsed_ms
+        """
+        start = time.perf_counter()
+        self._deadline = start + (self.time_budget if time_budget is None else time_budget)
+        self.nodes = 0
+        rooms_left = self.rooms_left(state)
+
+        # Depth 0: the value right after taking the door
+        values = [self._expect_offering(state, offering, 0, float('-inf')) for offering in offerings]
+        depth = 0
+        for target in range(1, min(self.max_depth, rooms_left) + 1):
+            try:
+                values = [self._expect_offering(state, offering, target, float('-inf'))
+                          for offering in offerings]
+            except _OutOfTime:
+                break
+            depth = target
+
+        best = max(range(len(offerings)), key=lambda i: values[i]) if offerings else None
+        return {
+            'best': best,
+            'values': values,
+            'depth': depth,
+            'rooms_left': rooms_left,
+            'nodes': self.nodes,
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+        }
+
+    def rooms_left(self, state: PlanState) -> int:
+        return self.duo_intelligence.get_rooms_remaining(state.room_number, state.current_region)
+
+    @staticmethod
+    def door_offering(door: Dict[str, Any]) -> Offering:
+        """Offering for a door dict as used by UniversalDoorAdvisor."""
+        if door['type'] == "God Boon":
+            if door.get('boon'):
+                return ("boon", door['boon'])
+            if door.get('god'):
+                return ("god", door['god'])
+            return ("item", "God Boon")
+        return DOOR_OFFERINGS.get(door['type'], ("item", door['type']))
+
+    # === SEARCH ===
+
+    def _outcomes(self, state: PlanState, offering: Offering) -> List[Offering]:
+        """Equally likely concrete results of taking an offering."""
+        kind, name = offering
+        if kind != "god":
+            return [offering]
+        boons = sorted(b['name'] for b in OFFERABLE_BOONS.get(name, ()) if b['name'] not in state.acquired_boons)
+        if not boons:
+            return [("new_god", name)]
+        rng = random.Random(state.fingerprint ^ zobrist_key('god door', name))
+        return [("boon", boon) for boon in rng.sample(boons, min(self.samples, len(boons)))]
+
+    def _expect_offering(self, state: PlanState, offering: Offering, depth: int, alpha: float) -> float:
+        """Chance node: average over the offering's outcomes, then the rest of the biome."""
+        outcomes = self._outcomes(state, offering)
+        children = [state.apply(outcome).advance() for outcome in outcomes]
+        return self._average(children, lambda child, child_alpha: self._value(child, depth, child_alpha), alpha)
+
+    def _average(self, items: List[Any], value_of, alpha: float) -> float:
+        """Mean of value_of(item) with Star1 cutoffs against ``alpha``."""
+        count = len(items)
+        total = 0.0
+        for i, item in enumerate(items):
+            remaining = count - i - 1
+            child_alpha = count * alpha - total - remaining * VALUE_MAX
+            total += value_of(item, child_alpha)
+            if (total + remaining * VALUE_MAX) / count <= alpha:
+                return (total + remaining * VALUE_MAX) / count
+        return total / count
+
+    def _value(self, state: PlanState, depth: int, alpha: float) -> float:
+        """Value of arriving in a room with ``depth`` more rooms to search."""
+        self.nodes += 1
+        if not state.alive or depth <= 0 or self.rooms_left(state) <= 0:
+            return evaluate(state)
+        # Leaves never time out, so the depth-0 pass always completes
+        if time.perf_counter() > self._deadline:
+            raise _OutOfTime()
+
+        key = (state.fingerprint, state.room_number, state.current_health // HP_BUCKET, depth)
+        cached = self.table.find(key)
+        if cached is not None:
+            return cached
+
+        rng = random.Random(hash(key))
+        offer_sets = [generate_offerings(rng, state.active_gods, state.acquired_boons)
+                      for _ in range(self.samples)]
+
+        def best_door(offers: List[Offering], child_alpha: float) -> float:
+            # Max node: try doors in order of their immediate value for early cutoffs
+            ordered = sorted(offers, key=lambda o: -evaluate(state.apply(o)))
+            best = float('-inf')
+            for offering in ordered:
+                best = max(best, self._expect_offering(state, offering, depth - 1, max(child_alpha, best)))
+            return best
+
+        value = self._average(offer_sets, best_door, alpha)
+        if value > alpha:
+            self.table.store(key, value)
+        return value
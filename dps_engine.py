@@ -0,0 +1,414 @@
+"""
+Hades Build Helper - DPS Engine Module
+One DPS model for single builds and NumPy batches of candidate builds.
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batches fall back to per-build evaluation
+    np = None
+
+from data import BOON_NAME_TO_DATA
+from boon_catalog import CATALOG
+
+
+# Per-boon coefficients:
+# (flat, flat per pom level, percent, percent per pom level, crit chance)
+Coefficients = Tuple[float, float, float, float, float]
+NO_COEFFICIENTS: Coefficients = (0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Build deltas for DPSEngine.evaluate_deltas
+ADD_BOON = "add_boon"   # ("add_boon", name)
+POM = "pom"             # ("pom", name) or ("pom", name, levels)
+HAMMER = "hammer"       # ("hammer",) or ("hammer", count)
+
+
+class DPSProfile:
+    """
+    Coefficient tables for one DPS model.
+
+    Every model is evaluated as::
+
+        damage = (base + flat) * aspect * (1 + percent / 100)
+        dps    = damage * (1 + crit_chance * crit_bonus) * speed        (rate)
+               = damage * (1 + crit_chance * crit_bonus) * (1 / speed)  (interval)
+
+    where ``flat``, ``percent`` and ``crit_chance`` are sums of per-boon
+    coefficients (a boon at pom level L adds ``base + per_level * (L - 1)``)
+    and hammers add ``hammer_percent`` each.
+    """
+
+    def __init__(self, name: str, weapons: Dict[str, Dict[str, float]],
+                 default_weapon: Dict[str, float], boon_coefficients: Callable[[str], Coefficients],
+                 speed_mode: str = "rate", aspect_mults: Optional[Dict[str, float]] = None,
+                 hammer_percent: float = 0.0, crit_bonus: float = 0.0):
+        if speed_mode not in ("rate", "interval"):
+            raise ValueError(f"Unknown speed mode: {speed_mode}")
+        self.name = name
+        self.weapons = weapons
+        self.default_weapon = default_weapon
+        self.boon_coefficients = boon_coefficients
+        self.speed_mode = speed_mode
+        self.aspect_mults = aspect_mults or {}
+        self.hammer_percent = hammer_percent
+        self.crit_bonus = crit_bonus
+
+
+# === PROFILES ===
+
+# DamageCalculator (build tracker DPS panel)
+CLASSIC_WEAPONS = {
+    "Stygian Blade": {"attack": 20, "special": 30, "speed": 1.2},
+    "Heart-Seeking Bow": {"attack": 50, "special": 10, "speed": 0.8},
+    "Shield of Chaos": {"attack": 20, "special": 35, "speed": 1.0},
+    "Eternal Spear": {"attack": 25, "special": 40, "speed": 1.1},
+    "Twin Fists": {"attack": 12, "special": 20, "speed": 2.0},
+    "Adamant Rail": {"attack": 10, "special": 50, "speed": 3.0}
+}
+
+# Damage bonus per boon slot (attack/special) or damage family (dash/cast)
+CLASSIC_MULTIPLIERS = {
+    "attack": 0.4,      # 40% damage increase
+    "special": 0.6,     # 60% damage increase
+    "crit": 0.2,        # 20% + crit
+    "weak": 0.5,        # 50% + weak
+    "lightning": 0.1,   # 10% + chain lightning
+    "doom": 0.6,        # Doom damage
+    "chill": 0.3,       # 30% + chill
+    "knockback": 0.3,   # 30% knockback
+}
+
+
+def _classic_coefficients(name: str) -> Coefficients:
+    boon_data = BOON_NAME_TO_DATA.get(name)
+    if not boon_data:
+        return NO_COEFFICIENTS
+
+    boon_class = CATALOG.classify(name)
+    if boon_class.slot in ("attack", "special"):
+        multiplier = CLASSIC_MULTIPLIERS[boon_class.slot]
+    elif boon_class.slot is not None:
+        multiplier = CLASSIC_MULTIPLIERS.get(boon_class.family, 0.0)
+    else:
+        multiplier = 0.0
+
+    # Each pom level adds 2% more effectiveness; crit boons add 15% crit chance
+    crit = 0.15 if "Deadly" in name or "Artemis" in boon_data.get('god', '') else 0.0
+    return (0.0, 0.0, multiplier * 100, multiplier * 2, crit)
+
+
+# AdvancedDPSCalculator (comprehensive DPS view)
+ADVANCED_WEAPONS = {
+    'Stygian Blade': {'attack': 20, 'speed': 1.0},
+    'Heart-Seeking Bow': {'attack': 10, 'speed': 0.5},
+    'Shield of Chaos': {'attack': 25, 'speed': 0.8},
+    'Eternal Spear': {'attack': 25, 'speed': 0.9},
+    'Twin Fists': {'attack': 12, 'speed': 1.5},
+    'Adamant Rail': {'attack': 10, 'speed': 1.2},
+}
+
+
+def _advanced_coefficients(name: str) -> Coefficients:
+    # Attack boons add 10 + 2 per level
+    if CATALOG.slot(name) == 'attack':
+        return (12.0, 2.0, 0.0, 0.0, 0.0)
+    return NO_COEFFICIENTS
+
+
+# HadesHelperUltimate (live DPS in the main window); speed is seconds per attack
+LIVE_WEAPONS = {
+    'Stygian Blade': {'attack': 20, 'speed': 0.45},
+    'Heart-Seeking Bow': {'attack': 10, 'speed': 0.7},
+    'Shield of Chaos': {'attack': 25, 'speed': 0.5},
+    'Eternal Spear': {'attack': 25, 'speed': 0.55},
+    'Twin Fists': {'attack': 12, 'speed': 0.3},
+    'Adamant Rail': {'attack': 10, 'speed': 0.15}
+}
+
+LIVE_ASPECT_MULTS = {
+    'Zagreus': 1.05, 'Nemesis': 1.10, 'Poseidon': 1.05,
+    'Arthur': 1.20, 'Talos': 1.05, 'Demeter': 1.10,
+    'Gilgamesh': 1.15, 'Chaos': 1.10, 'Hera': 1.05,
+    'Achilles': 1.15, 'Eris': 1.10
+}
+
+
+def _live_coefficients(name: str) -> Coefficients:
+    # Core damage boons add 40% + 8% per level
+    if CATALOG.slot(name) in ('attack', 'special', 'cast'):
+        return (0.0, 0.0, 40.0, 8.0, 0.0)
+    return NO_COEFFICIENTS
+
+
+CLASSIC_PROFILE = DPSProfile(
+    "classic", CLASSIC_WEAPONS, {"attack": 20, "speed": 1.0}, _classic_coefficients,
+    hammer_percent=20.0, crit_bonus=2.0  # crits do 3x damage
+)
+ADVANCED_PROFILE = DPSProfile(
+    "advanced", ADVANCED_WEAPONS, {'attack': 20, 'speed': 1.0}, _advanced_coefficients
+)
+LIVE_PROFILE = DPSProfile(
+    "live", LIVE_WEAPONS, {'attack': 20, 'speed': 0.5}, _live_coefficients,
+    speed_mode="interval", aspect_mults=LIVE_ASPECT_MULTS
+)
+
+
+class DPSEngine:
+    """
+    Evaluates a DPSProfile for one build or a batch of builds.
+
+    Builds are dicts with ``weapon``, ``aspect``, ``boons``, ``pom_levels``
+    and ``hammers`` (all optional).  Boon coefficients are compiled once per
+    name.  ``encode_batch`` turns a batch into flat (build, boon) index
+    arrays and ``evaluate_encoded`` sums coefficients with ``np.bincount``,
+    so thousands of candidate builds cost a handful of NumPy calls.
+    ``evaluate_batch`` does both.
+    """
+
+    def __init__(self, profile: DPSProfile):
+        self.profile = profile
+        self._coefficients: Dict[str, Coefficients] = {}
+
+        # Weapon and aspect code tables for batches (last entry is the default)
+        self._weapon_codes = {weapon: i for i, weapon in enumerate(profile.weapons)}
+        weapon_rows = list(profile.weapons.values()) + [profile.default_weapon]
+        self._weapon_base = [row['attack'] for row in weapon_rows]
+        self._weapon_speed = [row['speed'] for row in weapon_rows]
+        self._aspect_codes = {aspect: i for i, aspect in enumerate(profile.aspect_mults)}
+        self._aspect_mults = list(profile.aspect_mults.values()) + [1.0]
+
+    def coefficients(self, name: str) -> Coefficients:
+        """Compiled coefficients of a boon for this profile."""
+        coefficients = self._coefficients.get(name)
+        if coefficients is None:
+            coefficients = self.profile.boon_coefficients(name)
+            self._coefficients[name] = coefficients
+        return coefficients
+
+    # === SINGLE BUILD ===
+
+    def evaluate(self, build: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        DPS of one build.
+
+        Returns:
+            Dict with dps, base, speed, flat, total (base + flat), aspect_mult,
+            multiplier (1 + percent / 100), damage, crit_chance and crit_damage
+        """
+        profile = self.profile
+        weapon = build.get('weapon')
+        base, speed, aspect_mult = self._weapon_terms(build)
+        flat, percent, crit_chance = self._totals(build)
+
+        multiplier = 1 + percent / 100
+        damage = (base + flat) * aspect_mult * multiplier
+        crit_damage = damage * (1 + crit_chance * profile.crit_bonus)
+        dps = crit_damage * (speed if profile.speed_mode == "rate" else 1 / speed)
+
+        return {
+            'dps': dps if weapon else 0.0,
+            'base': base,
+            'speed': speed,
+            'flat': flat,
+            'total': base + flat,
+            'aspect_mult': aspect_mult,
+            'multiplier': multiplier,
+            'damage': damage,
+            'crit_chance': crit_chance,
+            'crit_damage': crit_damage,
+        }
+
+    def dps(self, build: Dict[str, Any]) -> float:
+        return self.evaluate(build)['dps']
+
+    def _weapon_terms(self, build: Dict[str, Any]) -> Tuple[float, float, float]:
+        """Base damage, speed and aspect multiplier of a build."""
+        profile = self.profile
+        weapon_data = profile.weapons.get(build.get('weapon'), profile.default_weapon)
+        aspect_mult = profile.aspect_mults.get(build.get('aspect'), 1.0)
+        return weapon_data['attack'], weapon_data['speed'], aspect_mult
+
+    def _totals(self, build: Dict[str, Any]) -> Tuple[float, float, float]:
+        """Summed flat, percent and crit chance of a build's boons and hammers."""
+        pom_levels = build.get('pom_levels') or {}
+        flat = percent = crit_chance = 0.0
+        coefficients = self.coefficients
+        for boon in build.get('boons', ()):
+            flat_base, flat_level, percent_base, percent_level, crit = coefficients(boon)
+            if flat_base or flat_level or percent_base or percent_level or crit:
+                extra = pom_levels.get(boon, 1) - 1
+                flat += flat_base + flat_level * extra
+                percent += percent_base + percent_level * extra
+                crit_chance += crit
+        percent += build.get('hammers', 0) * self.profile.hammer_percent
+        return flat, percent, crit_chance
+
+    # === WHAT-IF ===
+
+    def delta_terms(self, build: Dict[str, Any], delta: Tuple) -> Tuple[float, float, float]:
+        """Flat, percent and crit chance a delta adds to ``build``."""
+        kind = delta[0]
+        if kind == ADD_BOON:
+            if delta[1] in build.get('boons', ()):
+                return 0.0, 0.0, 0.0
+            flat_base, _, percent_base, _, crit = self.coefficients(delta[1])
+            return flat_base, percent_base, crit
+        if kind == POM:
+            if delta[1] not in build.get('boons', ()):
+                return 0.0, 0.0, 0.0
+            levels = delta[2] if len(delta) > 2 else 1
+            _, flat_level, _, percent_level, _ = self.coefficients(delta[1])
+            return flat_level * levels, percent_level * levels, 0.0
+        if kind == HAMMER:
+            count = delta[1] if len(delta) > 1 else 1
+            return 0.0, count * self.profile.hammer_percent, 0.0
+        raise ValueError(f"Unknown build delta: {kind}")
+
+    def evaluate_deltas(self, build: Dict[str, Any], deltas: Sequence[Tuple]) -> Any:
+        """
+        DPS of ``build`` after each delta, in one pass.
+
+        Every profile is a sum of per-boon terms, so the build is totalled
+        once and each delta only contributes its own coefficients: adding a
+        boon (at level 1, no-op if already owned), pomming an owned boon, or
+        adding hammers.
+
+        Returns:
+            A float64 NumPy array aligned with ``deltas`` (a list without NumPy)
+        """
+        profile = self.profile
+        base, speed, aspect_mult = self._weapon_terms(build)
+        flat, percent, crit_chance = self._totals(build)
+        rate = speed if profile.speed_mode == "rate" else 1 / speed
+        if not build.get('weapon'):
+            rate = 0.0
+        terms = [self.delta_terms(build, delta) for delta in deltas]
+
+        if np is None:
+            return [
+                (base + flat + d_flat) * aspect_mult * (1 + (percent + d_percent) / 100)
+                * (1 + (crit_chance + d_crit) * profile.crit_bonus) * rate
+                for d_flat, d_percent, d_crit in terms
+            ]
+
+        terms = np.array(terms, dtype=np.float64).reshape(-1, 3)
+        damage = (base + flat + terms[:, 0]) * aspect_mult * (1 + (percent + terms[:, 1]) / 100)
+        damage *= 1 + (crit_chance + terms[:, 2]) * profile.crit_bonus
+        return damage * rate
+
+    # === BATCHES ===
+
+    def encode_batch(self, builds: Sequence[Dict[str, Any]]) -> 'EncodedBatch':
+        """Compile builds to the index arrays evaluate_encoded works on (needs NumPy)."""
+        if np is None:
+            raise ImportError("Batch encoding requires NumPy")
+
+        default_weapon = len(self._weapon_codes)
+        default_aspect = len(self._aspect_codes)
+        weapon_codes: List[int] = []
+        aspect_codes: List[int] = []
+        hammers: List[float] = []
+        has_weapon: List[bool] = []
+
+        # (build row, boon column, pom level - 1) per boon
+        rows: List[int] = []
+        columns: List[int] = []
+        extras: List[int] = []
+        column_codes: Dict[str, int] = {}
+        code = column_codes.setdefault
+
+        for row, build in enumerate(builds):
+            weapon = build.get('weapon')
+            weapon_codes.append(self._weapon_codes.get(weapon, default_weapon))
+            has_weapon.append(bool(weapon))
+            aspect_codes.append(self._aspect_codes.get(build.get('aspect'), default_aspect))
+            hammers.append(build.get('hammers', 0))
+            boons = build.get('boons', ())
+            if not boons:
+                continue
+            rows += [row] * len(boons)
+            columns += [code(boon, len(column_codes)) for boon in boons]
+            pom_levels = build.get('pom_levels')
+            if pom_levels:
+                extras += [pom_levels.get(boon, 1) - 1 for boon in boons]
+            else:
+                extras += [0] * len(boons)
+
+        return EncodedBatch(
+            size=len(builds),
+            weapons=np.array(weapon_codes, dtype=np.intp),
+            aspects=np.array(aspect_codes, dtype=np.intp),
+            hammers=np.array(hammers, dtype=np.float64),
+            has_weapon=np.array(has_weapon, dtype=bool),
+            rows=np.array(rows, dtype=np.intp),
+            columns=np.array(columns, dtype=np.intp),
+            extras=np.array(extras, dtype=np.float64),
+            names=list(column_codes),
+        )
+
+    def evaluate_encoded(self, batch: 'EncodedBatch') -> Any:
+        """DPS of every build in an encoded batch as a float64 array."""
+        profile = self.profile
+        count = batch.size
+        percent = batch.hammers * profile.hammer_percent
+        if len(batch.rows):
+            table = np.array([self.coefficients(name) for name in batch.names], dtype=np.float64)
+            coefficients = table[batch.columns]
+            extra = batch.extras
+            flat = np.bincount(batch.rows, coefficients[:, 0] + coefficients[:, 1] * extra, count)
+            percent = percent + np.bincount(batch.rows, coefficients[:, 2] + coefficients[:, 3] * extra, count)
+            crit_chance = np.bincount(batch.rows, coefficients[:, 4], count)
+        else:
+            flat = crit_chance = np.zeros(count)
+
+        base = np.array(self._weapon_base, dtype=np.float64)[batch.weapons]
+        speed = np.array(self._weapon_speed, dtype=np.float64)[batch.weapons]
+        aspect = np.array(self._aspect_mults, dtype=np.float64)[batch.aspects]
+
+        damage = (base + flat) * aspect * (1 + percent / 100)
+        damage *= 1 + crit_chance * profile.crit_bonus
+        dps = damage * (speed if profile.speed_mode == "rate" else 1 / speed)
+        dps[~batch.has_weapon] = 0.0
+        return dps
+
+    def evaluate_batch(self, builds: Sequence[Dict[str, Any]]) -> Any:
+        """
+        DPS of every build in one pass.
+
+        Returns:
+            A float64 NumPy array aligned with ``builds`` (a list without NumPy)
+        """
+        if np is None:
+            return [self.dps(build) for build in builds]
+        return self.evaluate_encoded(self.encode_batch(builds))
+
+
+class EncodedBatch:
+    """
+    Builds compiled to flat arrays: one weapon/aspect/hammer entry per build
+    and one (row, column, pom level - 1) triple per acquired boon, where
+    ``names[column]`` is the boon.  Weapon and aspect codes belong to the
+    engine that encoded the batch.
+    """
+
+    __slots__ = ('size', 'weapons', 'aspects', 'hammers', 'has_weapon',
+                 'rows', 'columns', 'extras', 'names')
+
+    def __init__(self, size: int, weapons: Any, aspects: Any, hammers: Any, has_weapon: Any,
+                 rows: Any, columns: Any, extras: Any, names: List[str]):
+        self.size = size
+        self.weapons = weapons
+        self.aspects = aspects
+        self.hammers = hammers
+        self.has_weapon = has_weapon
+        self.rows = rows
+        self.columns = columns
+        self.extras = extras
+        self.names = names
+
+
+CLASSIC_ENGINE = DPSEngine(CLASSIC_PROFILE)
+ADVANCED_ENGINE = DPSEngine(ADVANCED_PROFILE)
+LIVE_ENGINE = DPSEngine(LIVE_PROFILE)
@@ -2,7 +2,10 @@
 duo_intelligence.py - Advanced Duo Boon Intelligence System
 """
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set, Tuple, Optional
+
+from data import BIOME_ENDS
+from duo_probability import DuoOdds
 
 class DuoIntelligence:
     """Advanced duo boon intelligence with predictive analysis."""
@@ -27,27 +30,34 @@ class DuoIntelligence:
                 'gods_per_biome': 1.5,
             }
         }
+        
+        # Room number at which each biome's boss is fought
+        self.biome_ends = dict(BIOME_ENDS)
+        
+        self.odds = DuoOdds({biome: data['base_rate'] for biome, data in self.biome_rates.items()},
+                            self.biome_ends)
     
     def calculate_duo_probability(self, duo_data: Dict, current_gods: Set[str], 
                                   current_room: int, current_biome: str,
-                                  has_keepsake: bool = False) -> Dict:
-        """Calculate realistic probability of getting a duo."""
+                                  has_keepsake: bool = False,
+                                  acquired_boons: Optional[Set[str]] = None) -> Dict:
+        """Probability of getting a duo before the end of the run (see DuoOdds)."""
         
         required_gods = set(duo_data['gods'])
         missing_gods = required_gods - current_gods
         
-        # Prerequisites check
-        prereq_boons = [b for _, b in duo_data['prerequisites']]
+        duo = self.odds.duos[duo_data['name']]
+        state = self.odds.state(duo, acquired_boons or set(), current_gods)
+        probability = self.odds.probability(duo, state, current_room)
         
-        # Calculate base probability
         biome_data = self.biome_rates.get(current_biome, self.biome_rates['Tartarus'])
         rooms_remaining = self.get_rooms_remaining(current_room, current_biome)
         expected_god_rooms = rooms_remaining * biome_data['base_rate']
         
-        probability = min(expected_god_rooms / 10, 0.8)
-        
         return {
             'probability': probability,
+            'biome_probability': self.odds.probability(duo, state, current_room,
+                                                       self.biome_ends.get(current_biome, 14)),
             'status': f"Need {len(missing_gods)} gods",
             'missing_gods': list(missing_gods),
             'rooms_remaining': rooms_remaining,
@@ -56,10 +66,4 @@ class DuoIntelligence:
     
     def get_rooms_remaining(self, current_room: int, biome: str) -> int:
         """Calculate rooms remaining in biome."""
-        biome_ends = {
-            'Tartarus': 14,
-            'Asphodel': 24,
-            'Elysium': 36,
-            'Temple of Styx': 45
-        }
-        return max(biome_ends.get(biome, 14) - current_room, 0)
+        return max(self.biome_ends.get(biome, 14) - current_room, 0)
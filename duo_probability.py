@@ -0,0 +1,182 @@
+"""
+Hades Build Helper - Duo Probability Module
+Exact duo boon odds from a Markov chain over the rooms left in a run.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from boon_catalog import CATALOG
+from run_simulator import SELECTABLE_GODS, OFFERABLE_BOONS, NUM_ROOM_OFFERINGS
+
+
+MAX_GODS = 4  # Olympians met per run; once reached only those gods come back
+
+# Progress on one of a duo's gods
+UNSEEN, SEEN, HELD = 0, 1, 2
+
+# Chain state: (first god, second god, gods met) or DONE once the duo is taken
+State = Tuple[int, int, int]
+DONE: State = (HELD, HELD, -1)
+
+STATES: List[State] = [DONE] + [
+    (a, b, k)
+    for a in (UNSEEN, SEEN, HELD)
+    for b in (UNSEEN, SEEN, HELD)
+    for k in range(MAX_GODS + 1)
+    if k >= (a != UNSEEN) + (b != UNSEEN)
+]
+STATE_INDEX: Dict[State, int] = {state: i for i, state in enumerate(STATES)}
+
+# Sparse transition table: per state index, [(next state index, probability)]
+Transitions = Tuple[Tuple[Tuple[int, float], ...], ...]
+
+
+def boon_chance(god: str) -> float:
+    """Chance a given boon is among the choices when a god's boon is taken."""
+    offerable = len(OFFERABLE_BOONS.get(god, ()))
+    return min(1.0, NUM_ROOM_OFFERINGS / offerable) if offerable else 0.0
+
+
+def _progress(held: int, chance: float) -> List[Tuple[int, float]]:
+    """One god's progress after taking a boon from that god."""
+    if held == HELD:
+        return [(HELD, 1.0)]
+    return [(HELD, chance), (SEEN, 1.0 - chance)]
+
+
+@lru_cache(maxsize=None)
+def transition_table(god_room_rate: float, chance_a: float, chance_b: float) -> Transitions:
+    """
+    One room's transitions for a duo whose gods offer its prerequisites
+    with ``chance_a``/``chance_b``.
+
+    A room holds a god boon with ``god_room_rate``.  Until MAX_GODS are met
+    the god is uniform over SELECTABLE_GODS (meeting a new one counts it);
+    after that it is uniform over the gods already met.  Taking a god's
+    boon gets its prerequisite with its boon chance, and once both are
+    held the duo shows up in either god's room with that same chance.
+    """
+    gods = len(SELECTABLE_GODS)
+    table = []
+    for a, b, k in STATES:
+        if (a, b, k) == DONE:
+            table.append(((0, 1.0),))
+            continue
+        moves: Dict[int, float] = {}
+
+        def add(state: State, p: float) -> None:
+            if p > 0:
+                index = STATE_INDEX[state]
+                moves[index] = moves.get(index, 0.0) + p
+
+        full = k >= MAX_GODS
+        pick = god_room_rate / (k if full else gods)
+        room_a = 0.0 if full and a == UNSEEN else pick
+        room_b = 0.0 if full and b == UNSEEN else pick
+        unseen_others = 0 if full else gods - k - (a == UNSEEN) - (b == UNSEEN)
+        met = k + 1 if not full else k
+
+        if a == HELD and b == HELD:
+            add(DONE, room_a * chance_a + room_b * chance_b)
+        else:
+            for held, p in _progress(a, chance_a):
+                add((held, b, met if a == UNSEEN else k), room_a * p)
+            for held, p in _progress(b, chance_b):
+                add((a, held, met if b == UNSEEN else k), room_b * p)
+        if unseen_others:
+            add((a, b, met), pick * unseen_others)
+        add((a, b, k), 1.0 - sum(moves.values()))
+        table.append(tuple(moves.items()))
+    return tuple(table)
+
+
+class DuoOdds:
+    """
+    Probability of taking each duo boon before a given room.
+
+    Every duo in the catalog is a Markov chain over (prerequisite progress
+    per god, gods met) advanced room by room with the god-room rate of the
+    biome the room is in.  ``values(duo, horizon)`` runs the chain backwards
+    from ``horizon`` once and keeps, for every room and state, the chance
+    of reaching DONE, so odds for a new room or a new build are a lookup.
+    Duos whose gods have the same boon chances share tables.
+    """
+
+    def __init__(self, biome_rates: Dict[str, float], biome_ends: Dict[str, int]):
+        self.biome_ends = dict(biome_ends)
+        self.run_end = max(self.biome_ends.values())
+        # Room index -> god-room rate of its biome
+        self.room_rates: List[float] = []
+        for biome, end in sorted(self.biome_ends.items(), key=lambda item: item[1]):
+            self.room_rates.extend([biome_rates[biome]] * (end - len(self.room_rates)))
+        self.duos = {duo.name: duo for duo in CATALOG.duos}
+        self._values: Dict[Tuple[float, float, int], List[List[float]]] = {}
+
+    def chances(self, duo) -> Tuple[float, float]:
+        first, second = duo.data['gods']
+        return boon_chance(first), boon_chance(second)
+
+    def values(self, duo, horizon: int) -> List[List[float]]:
+        """values[room][state index]: chance of taking ``duo`` before room ``horizon``."""
+        key = self.chances(duo) + (horizon,)
+        values = self._values.get(key)
+        if values is None:
+            chance_a, chance_b = key[0], key[1]
+            values = [[0.0] * len(STATES) for _ in range(horizon + 1)]
+            values[horizon][STATE_INDEX[DONE]] = 1.0
+            for room in range(horizon - 1, -1, -1):
+                table = transition_table(self.room_rates[room], chance_a, chance_b)
+                after = values[room + 1]
+                values[room] = [sum(after[j] * p for j, p in moves) for moves in table]
+            self._values[key] = values
+        return values
+
+    # === BUILD STATE ===
+
+    @staticmethod
+    def state(duo, acquired_boons: Iterable[str], selected_gods: Iterable[str]) -> State:
+        """Chain state of a duo for a build."""
+        acquired_boons = set(acquired_boons)
+        if duo.name in acquired_boons:
+            return DONE
+        gods = {god for god in selected_gods if god in SELECTABLE_GODS}
+        held_by_god: Dict[str, bool] = {}
+        for god, name in duo.data['prerequisites']:
+            held_by_god[god] = held_by_god.get(god, True) and name in acquired_boons
+        progress = [
+            HELD if held_by_god.get(god) else SEEN if god in gods else UNSEEN
+            for god in duo.data['gods']
+        ]
+        return (progress[0], progress[1], min(len(gods), MAX_GODS))
+
+    def probability(self, duo, state: State, room: int, horizon: Optional[int] = None) -> float:
+        """Chance of taking ``duo`` from ``state`` in ``room`` before room ``horizon`` (default: run end)."""
+        horizon = self.run_end if horizon is None else min(horizon, self.run_end)
+        if state == DONE:
+            return 1.0
+        if room >= horizon:
+            return 0.0
+        return self.values(duo, horizon)[max(room, 0)][STATE_INDEX[state]]
+
+    def evaluate(self, acquired_boons: Iterable[str], selected_gods: Iterable[str],
+                 room: int, biome: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Odds for every duo.
+
+        Returns:
+            Dict of duo name -> run (before the final boss), biome (before
+            this biome's boss) and state
+        """
+        acquired_boons = set(acquired_boons)
+        selected_gods = set(selected_gods)
+        biome_end = self.biome_ends.get(biome, self.run_end)
+        odds = {}
+        for name, duo in self.duos.items():
+            state = self.state(duo, acquired_boons, selected_gods)
+            odds[name] = {
+                'run': self.probability(duo, state, room),
+                'biome': self.probability(duo, state, room, biome_end),
+                'state': state,
+            }
+        return odds
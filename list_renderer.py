@@ -0,0 +1,82 @@
+"""
+Hades Build Helper - List Renderer Module
+Keyed, diff-based rendering of widget rows inside a container.
+"""
+
+from typing import Dict, List, Any, Callable, Hashable, Iterable, Optional, Tuple
+
+
+class KeyedListRenderer:
+    """
+    Keeps one widget row per key and patches the rows on each render.
+
+    ``create_row(key, data)`` builds a row and returns ``(frame, refs)``
+    without packing it; ``update_row(key, refs, data)`` changes an existing
+    row in place (e.g. just a label's text).  ``render`` diffs the new
+    ``(key, data)`` items against the rows it holds: rows for new keys are
+    created, rows whose data differs are updated, rows for dropped keys are
+    destroyed, and frames are re-packed only from the first position where
+    the order changed.  ``create_empty()`` (optional) builds and packs the
+    placeholder shown while the list is empty.
+    """
+
+    def __init__(self, create_row: Callable[[Hashable, Any], Tuple[Any, Any]],
+                 update_row: Callable[[Hashable, Any, Any], None],
+                 create_empty: Optional[Callable[[], Any]] = None,
+                 pack_options: Optional[Dict[str, Any]] = None):
+        self.create_row = create_row
+        self.update_row = update_row
+        self.create_empty = create_empty
+        self.pack_options = pack_options or {}
+        # key -> [frame, refs, data]
+        self._rows: Dict[Hashable, List[Any]] = {}
+        self._order: List[Hashable] = []
+        self._empty = None
+        self.created = 0
+        self.updated = 0
+        self.removed = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def render(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        items = list(items)
+        keys = [key for key, _ in items]
+        rows = self._rows
+
+        # Removed rows
+        wanted = set(keys)
+        for key in [key for key in rows if key not in wanted]:
+            rows.pop(key)[0].destroy()
+            self.removed += 1
+        order = [key for key in self._order if key in wanted]
+
+        # New and changed rows
+        for key, data in items:
+            row = rows.get(key)
+            if row is None:
+                frame, refs = self.create_row(key, data)
+                rows[key] = [frame, refs, data]
+                self.created += 1
+            elif row[2] != data:
+                self.update_row(key, row[1], data)
+                row[2] = data
+                self.updated += 1
+
+        # Pack order: everything from the first moved or new row onwards
+        start = 0
+        while start < len(order) and start < len(keys) and order[start] == keys[start]:
+            start += 1
+        if start < len(keys):
+            for key in order[start:]:
+                rows[key][0].pack_forget()
+            for key in keys[start:]:
+                rows[key][0].pack(**self.pack_options)
+        self._order = keys
+
+        # Placeholder
+        if keys and self._empty is not None:
+            self._empty.destroy()
+            self._empty = None
+        elif not keys and self._empty is None and self.create_empty is not None:
+            self._empty = self.create_empty()
@@ -16,17 +16,26 @@ from pathlib import Path
 
 from data import (
     GODS_DATA, WEAPONS_DATA, BOONS_DATA, DUO_BOONS_DATA, 
-    LEGENDARY_BOONS_DATA, BOON_NAME_TO_DATA
+    LEGENDARY_BOONS_DATA, BOON_NAME_TO_DATA, BIOME_ENDS
 )
 from analytics import RunAnalytics
+from persistence import PersistenceWorker
+from build_cache import BuildCache
+from build_state import BuildState
+from build_view import BuildViewMixin
+from reactive import ReactiveStore
+from list_renderer import KeyedListRenderer
 from damage_calculator import DamageCalculator
 from build_analyzer import BuildAnalyzer
+from boon_catalog import CATALOG
 from mirror_data import MIRROR_TALENTS
 from aspect_data import WEAPON_ASPECTS
 from synergy_analyzer import SynergyAnalyzer
 from duo_intelligence import DuoIntelligence
 from advanced_dps_calculator import AdvancedDPSCalculator
+from dps_engine import ADD_BOON
 from smart_door_advisor import SmartDoorAdvisor, RoomType
+from door_planner import DoorPlanner, PlanState
 from keepsake_strategy import KeepsakeStrategyEngine
 from heat_management import HeatManagementSystem
 
@@ -95,14 +104,7 @@ class SmartRecommendationEngine:
     
     def get_context_aware_recommendations(self) -> Dict:
         """Context-aware recommendations."""
-        context = {
-            'room': self.app.room_number,
-            'hp_percent': self.app.current_health / self.app.max_health if self.app.max_health > 0 else 1.0,
-            'boon_count': len(self.app.acquired_boons),
-            'has_attack': any('Strike' in b or 'Shot' in b for b in self.app.acquired_boons),
-            'dd_remaining': self.app.death_defiances_remaining,
-            'region': self.app.current_region,
-        }
+        context = self.app.build_features()
         
         return {
             'immediate_priority': self.get_immediate_priority(context),
@@ -111,7 +113,6 @@ class SmartRecommendationEngine:
         }
     
     def get_immediate_priority(self, context: Dict) -> Dict:
-        room = context['room']
         hp_percent = context['hp_percent']
         boon_count = context['boon_count']
         
@@ -127,8 +128,7 @@ class SmartRecommendationEngine:
             return {'text': '⚔️ Need attack boon!', 'color': COLORS['warning'],
                     'action': 'Get Strike/Shot ASAP', 'priority': 'HIGH'}
         
-        boss_rooms_map = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        rooms_to_boss = boss_rooms_map.get(context['region'], 14) - room
+        rooms_to_boss = context['rooms_to_boss']
         
         if rooms_to_boss <= 3:
             return {'text': f'⚔️ Boss in {rooms_to_boss} rooms!', 'color': COLORS['danger'],
@@ -170,25 +170,25 @@ class SmartRecommendationEngine:
         
         for boon_data in available_boons:
             boon_name = boon_data['name']
+            slot = CATALOG.slot(boon_name)
             score = 50
             reasons = []
             
             boon_count = len(self.app.acquired_boons)
-            if boon_count < 2 and ('Strike' in boon_name or 'Flourish' in boon_name):
+            if boon_count < 2 and slot in ('attack', 'special'):
                 score += 40
                 reasons.append("🎯 Critical early boon")
             
-            has_attack = any('Strike' in b or 'Shot' in b for b in self.app.acquired_boons)
-            if not has_attack and ('Strike' in boon_name or 'Shot' in boon_name):
+            has_attack = CATALOG.has_slot(self.app.acquired_boons, 'attack')
+            if not has_attack and slot == 'attack':
                 score += 30
                 reasons.append("❗ Missing attack")
             
             if self.app.selected_weapon:
-                weapon_prefs = {'Twin Fists': ['Strike'], 'Shield of Chaos': ['Flourish'],
-                               'Stygian Blade': ['Strike'], 'Heart-Seeking Bow': ['Shot'],
-                               'Eternal Spear': ['Strike'], 'Adamant Rail': ['Strike']}
-                prefs = weapon_prefs.get(self.app.selected_weapon, ['Strike'])
-                if any(pref in boon_name for pref in prefs):
+                weapon_prefs = {'Twin Fists': 'attack', 'Shield of Chaos': 'special',
+                               'Stygian Blade': 'attack', 'Heart-Seeking Bow': 'cast',
+                               'Eternal Spear': 'attack', 'Adamant Rail': 'attack'}
+                if slot == weapon_prefs.get(self.app.selected_weapon, 'attack'):
                     score += 20
                     reasons.append(f"⚔️ {WEAPON_SHORT[self.app.selected_weapon]}")
             
@@ -217,39 +217,37 @@ class IntelligentBoonAdvisor:
     
     def analyze_current_situation(self) -> Dict:
         """Deep analysis of current run state."""
-        return {
-            'room': self.app.room_number,
-            'region': self.app.current_region,
-            'hp_percent': self.app.current_health / self.app.max_health if self.app.max_health > 0 else 1.0,
-            'boon_count': len(self.app.acquired_boons),
-            'has_attack': self.has_core_slot('attack'),
-            'has_special': self.has_core_slot('special'),
-            'has_dash': self.has_core_slot('dash'),
-            'has_cast': self.has_core_slot('cast'),
-            'has_call': self.has_core_slot('call'),
-            'weapon': self.app.selected_weapon,
-            'aspect': self.app.selected_aspect,
-            'gods_in_build': list(self.app.selected_gods),
-            'current_dps': self.app.calculate_detailed_dps()['total'],
-            'rooms_to_boss': self.get_rooms_to_boss(),
-        }
+        features = self.app.build_features()
+        return dict(features,
+                    current_dps=features['dps_total'],
+                    build_strength=self.app.store.get('build_strength')['total'])
     
     def get_smart_choice(self, offered_boons: List[str]) -> Dict:
         """Given boon choices, recommend the best one."""
         situation = self.analyze_current_situation()
         scores = {}
+        dps_gains = {}
         
-        for boon in offered_boons:
+        # Marginal DPS of every offered boon, in one pass
+        current_dps = self.app.calculate_detailed_dps_value()
+        offered_dps = self.app.what_if_dps([(ADD_BOON, boon) for boon in offered_boons])
+        
+        for boon, new_dps in zip(offered_boons, offered_dps):
             score = self.score_boon_for_situation(boon, situation)
+            dps_gain = (new_dps - current_dps) / current_dps * 100 if current_dps > 0 else 0.0
+            if dps_gain > 0:
+                score = min(score + min(15, int(dps_gain / 2)), 100)
             scores[boon] = score
+            dps_gains[boon] = round(dps_gain, 1)
         
-        best_boon = max(scores.items(), key=lambda x: x[1])
+        best_boon = max(scores.items(), key=lambda x: (x[1], dps_gains[x[0]]))
         
         return {
             'recommended': best_boon[0],
             'score': best_boon[1],
             'reason': self.explain_recommendation(best_boon[0], situation),
-            'all_scores': scores
+            'all_scores': scores,
+            'dps_gains': dps_gains
         }
     
     def score_boon_for_situation(self, boon_name: str, situation: Dict) -> int:
@@ -259,26 +257,27 @@ class IntelligentBoonAdvisor:
             return 0
         
         score = 50
+        slot = CATALOG.slot(boon_name)
         
         # CRITICAL: Fill missing core slots
-        if not situation['has_attack'] and ('Strike' in boon_name or 'Shot' in boon_name):
+        if not situation['has_attack'] and slot == 'attack':
             score += 50
             
-        if not situation['has_special'] and 'Flourish' in boon_name:
+        if not situation['has_special'] and slot == 'special':
             score += 45
             
-        if not situation['has_dash'] and 'Dash' in boon_name:
+        if not situation['has_dash'] and slot == 'dash':
             score += 40
         
         # IMPORTANT: Low HP - prioritize defensive boons
         if situation['hp_percent'] < 0.4:
-            defensive_keywords = ['Dash', 'Deflect', 'Shield', 'Protection', 'Sturdy']
-            if any(kw in boon_name for kw in defensive_keywords):
+            defensive_keywords = ['Deflect', 'Shield', 'Protection', 'Sturdy']
+            if slot == 'dash' or any(kw in boon_name for kw in defensive_keywords):
                 score += 30
         
         # IMPORTANT: Boss approaching - prioritize damage
         if situation['rooms_to_boss'] <= 3:
-            if 'Strike' in boon_name or 'Flourish' in boon_name or 'Cast' in boon_name:
+            if slot in ('attack', 'special', 'cast'):
                 score += 25
         
         # DUO BOON POTENTIAL
@@ -322,7 +321,7 @@ class IntelligentBoonAdvisor:
         
         # EARLY GAME: Prioritize foundation
         if situation['boon_count'] < 3:
-            if 'Strike' in boon_name or 'Flourish' in boon_name:
+            if slot in ('attack', 'special'):
                 score += 20
         
         # MID GAME: Build synergies
@@ -346,10 +345,11 @@ class IntelligentBoonAdvisor:
         if not boon_data:
             return "Unknown boon"
         
-        if not situation['has_attack'] and ('Strike' in boon_name or 'Shot' in boon_name):
+        slot = CATALOG.slot(boon_name)
+        if not situation['has_attack'] and slot == 'attack':
             reasons.append("🎯 CRITICAL: You need an attack boon!")
         
-        if situation['hp_percent'] < 0.4 and ('Dash' in boon_name or 'Deflect' in boon_name):
+        if situation['hp_percent'] < 0.4 and (slot == 'dash' or 'Deflect' in boon_name):
             reasons.append("🛡️ Low HP - defensive boon recommended")
         
         if situation['rooms_to_boss'] <= 3:
@@ -368,23 +368,11 @@ class IntelligentBoonAdvisor:
     
     def has_core_slot(self, slot_type: str) -> bool:
         """Check if core slot is filled."""
-        keywords = {
-            'attack': ['Strike', 'Shot'],
-            'special': ['Flourish'],
-            'dash': ['Dash'],
-            'cast': ['Cast'],
-            'call': ['Call', 'Aid']
-        }
-        
-        for boon in self.app.acquired_boons:
-            if any(kw in boon for kw in keywords.get(slot_type, [])):
-                return True
-        return False
+        return CATALOG.has_slot(self.app.acquired_boons, slot_type)
     
     def get_rooms_to_boss(self) -> int:
         """Rooms until next boss."""
-        boss_map = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        return boss_map.get(self.app.current_region, 14) - self.app.room_number
+        return self.app.build_features()['rooms_to_boss']
 
 
 class BossPrepAdvisor:
@@ -442,9 +430,10 @@ class BossPrepAdvisor:
         strengths = []
         weaknesses = []
         recommendations = []
+        features = self.app.build_features()
         
         # Check HP
-        hp_percent = self.app.current_health / self.app.max_health if self.app.max_health > 0 else 1.0
+        hp_percent = features['hp_percent']
         if hp_percent >= 0.8:
             score += 15
             strengths.append("✅ HP is high")
@@ -454,16 +443,16 @@ class BossPrepAdvisor:
             recommendations.append("🏥 Prioritize healing before boss!")
         
         # Check death defiances
-        if self.app.death_defiances_remaining >= 2:
+        if features['dd_remaining'] >= 2:
             score += 10
             strengths.append("✅ 2+ Death Defiances")
-        elif self.app.death_defiances_remaining == 0:
+        elif features['dd_remaining'] == 0:
             score -= 15
             weaknesses.append("❌ No Death Defiances left")
             recommendations.append("💀 Play very carefully!")
         
         # Check DPS
-        current_dps = self.app.calculate_detailed_dps()['total']
+        current_dps = features['dps_total']
         expected_dps = {
             'Tartarus': 80,
             'Asphodel': 130,
@@ -480,7 +469,7 @@ class BossPrepAdvisor:
             recommendations.append("⚔️ Upgrade damage boons!")
         
         # Check boon count
-        boon_count = len(self.app.acquired_boons)
+        boon_count = features['boon_count']
         expected_boons = {'Tartarus': 4, 'Asphodel': 6, 'Elysium': 8, 'Temple of Styx': 10}
         
         if boon_count >= expected_boons.get(region, 4):
@@ -491,7 +480,7 @@ class BossPrepAdvisor:
             recommendations.append("🎁 Get more boons!")
         
         # Check for defensive options
-        has_dash = any('Dash' in b for b in self.app.acquired_boons)
+        has_dash = features['has_dash']
         has_deflect = any('Deflect' in b or 'Athena' in str(self.app.selected_gods) for b in self.app.acquired_boons)
         
         if has_dash or has_deflect:
@@ -507,12 +496,6 @@ class BossPrepAdvisor:
             'weaknesses': weaknesses,
             'recommendations': recommendations
         }
-class BossPrepAdvisor:
-    """Help prepare for upcoming boss fights."""
-    # ... existing code ...
-
-
-# ADD THIS CLASS HERE:
 class UniversalDoorAdvisor:
     """Score ALL door types (boons, hammers, poms, etc.)."""
     
@@ -541,12 +524,9 @@ class UniversalDoorAdvisor:
         
         hp_percent = self.app.current_health / self.app.max_health if self.app.max_health > 0 else 1.0
         boon_count = len(self.app.acquired_boons)
-        room = self.app.room_number
-        region = self.app.current_region
         has_hammer = len(self.app.hammer_upgrades) > 0
         
-        boss_rooms = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        rooms_to_boss = boss_rooms.get(region, 14) - room
+        rooms_to_boss = self.app.build_features()['rooms_to_boss']
         
         if door_type == "God Boon":
             return self.score_god_boon(door, boon_count, rooms_to_boss, hp_percent)
@@ -603,6 +583,15 @@ class UniversalDoorAdvisor:
             score += 10
             reasons.append(f"⚔️ Boss in {rooms_to_boss} rooms")
         
+        # HISTORY: how this god has done alongside the current gods
+        if door.get('god'):
+            pairing = self.app.analytics.get_pairing_win_rate(door['god'], list(self.app.selected_gods))
+            if pairing and pairing[1] >= 3:
+                win_rate, runs = pairing
+                delta = win_rate - self.app.analytics.get_win_rate()
+                score += int(max(-10, min(10, delta / 2)))
+                reasons.append(f"📊 {win_rate:.0f}% win rate in {runs} past runs")
+        
         return {
             'score': min(score, 100),
             'priority': priority if 'priority' in locals() else 'HIGH',
@@ -774,7 +763,7 @@ class UniversalDoorAdvisor:
 
 # THEN your main class starts:
 
-class HadesHelperUltimate(ctk.CTk):
+class HadesHelperUltimate(BuildViewMixin, ctk.CTk):
     """v15.0 ULTIMATE - ALL FEATURES"""
     
     def __init__(self):
@@ -784,13 +773,8 @@ class HadesHelperUltimate(ctk.CTk):
         self.geometry("1600x900")
         self.minsize(1500, 850)
         
-        # Core State
-        self.selected_gods: Set[str] = set()
-        self.acquired_boons: Set[str] = set()
-        self.selected_weapon: Optional[str] = None
-        self.selected_aspect: Optional[str] = None
-        self.pom_levels: Dict[str, int] = {}
-        self.hammer_upgrades: List[str] = []
+        # Core State (weapon, boons, gods, poms, hammers, room, DD)
+        self.build = BuildState()
         self.last_boon_added: Optional[str] = None
         
         # Mirror
@@ -798,11 +782,9 @@ class HadesHelperUltimate(ctk.CTk):
             "Death Defiance": 3, "Greater Reflex": 1, "Shadow Presence": 2,
             "Boiling Blood": 1, "Thick Skin": 5, "Fiery Presence": 0
         }
-        self.death_defiances_remaining = 3
         
         # Run tracking
         self.current_region = "Tartarus"
-        self.room_number = 1
         self.current_health = 100
         self.max_health = 100
         self.gold = 0
@@ -815,33 +797,40 @@ class HadesHelperUltimate(ctk.CTk):
         self.update_scheduled = False
         self.update_timer_id = None
         
-        # DPS Cache
-        self._dps_cache = None
-        self._dps_cache_key = None
-        
-        # Win Probability Cache
-        self._win_cache = None
-        self._win_cache_key = None
+        # DPS / win probability / build strength cache (LRU, keyed by build)
+        self.build_cache = BuildCache(max_entries=256)
         # === END OPTIMIZATION ===
         
         # Systems
         self.timeline = RunTimeline()
         self.notifications = NotificationSystem()
-        self.analytics = RunAnalytics()
+        self.persistence = PersistenceWorker()
+        self.analytics = RunAnalytics(backend="binary", lazy=True, writer=self.persistence)
         self.synergy_analyzer = SynergyAnalyzer()
+        self.build_analyzer = BuildAnalyzer()
         self.run_stats = RunStatistics()
         self.duo_intelligence = DuoIntelligence()
         self.advanced_dps = AdvancedDPSCalculator()
         self.door_advisor = SmartDoorAdvisor()
+        self.door_planner = DoorPlanner(time_budget=0.05)
         self.keepsake_engine = KeepsakeStrategyEngine()
         self.heat_manager = HeatManagementSystem()
         self.recommendation_engine = SmartRecommendationEngine(self)
         
+        # Derived values (DPS, strength, duos, doors, recommendations) keyed by their inputs
+        self.store = ReactiveStore()
+        self.build.listener = self.store.touch
+        self.rec_god = "Zeus"
+        self.setup_derived_values()
+        
         self.setup_keyboard_shortcuts()
         self.create_modern_layout()
+        self.watch_sidebar()
         self.add_initial_actions()
         
         self.update_all()
+        self.after(250, self._watch_history_loading)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
         print("✓ Hades Helper v15.0 ULTIMATE loaded - ALL FEATURES!")
 
@@ -859,18 +848,31 @@ class HadesHelperUltimate(ctk.CTk):
         for i, god in enumerate(gods_list[:9], 1):
             self.bind(f"<Key-{i}>", lambda e, g=god: self.instant_god_select(g))
 
+    def on_close(self):
+        """Write out queued saves before the window goes away."""
+        self.persistence.stop(timeout=10)
+        self.destroy()
+
+    def _watch_history_loading(self):
+        """Poll the background run history load and announce when it is ready."""
+        if self.analytics.loading:
+            self.after(250, self._watch_history_loading)
+            return
+        self.update_all('history')
+        self.notifications.add(f"📊 Run history ready ({self.analytics.get_total_runs()} runs)", "info")
+
     def add_initial_actions(self):
         self.timeline.add_event(0, "start", "v15.0 ULTIMATE - ALL FEATURES!", "important")
         self.notifications.add("🚀 v15.0 ULTIMATE! All Phase 1-3 features", "info")
 
     def increment_room(self):
         """SPACE - increment room with alerts."""
-        self.room_number += 1
+        self.build.set_room(self.room_number + 1)
         if hasattr(self, 'room_entry'):
             self.room_entry.delete(0, 'end')
             self.room_entry.insert(0, str(self.room_number))
         
-        dps = self.calculate_detailed_dps()['total']
+        dps = self.store.get('dps')['total']
         self.dps_history.append({'room': self.room_number, 'dps': dps})
         
         # Check for alerts
@@ -878,8 +880,7 @@ class HadesHelperUltimate(ctk.CTk):
         if hp_percent < 0.3:
             self.show_toast("🚨 CRITICAL HP!", COLORS['danger'])
         
-        boss_rooms_map = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        rooms_to_boss = boss_rooms_map.get(self.current_region, 14) - self.room_number
+        rooms_to_boss = self.build_features()['rooms_to_boss']
         if rooms_to_boss <= 3:
             self.show_toast(f"⚔️ Boss in {rooms_to_boss} rooms!", COLORS['warning'])
         
@@ -1048,6 +1049,8 @@ class HadesHelperUltimate(ctk.CTk):
                                           fg_color=(COLORS['light'], "#0F172A"))
         self.main_container.grid(row=0, column=1, sticky="nsew")
         
+        # Each view is built on its first visit, then hidden and shown
+        self.views: Dict[str, ctk.CTkFrame] = {}
         self.current_view = None
         self.switch_view("dashboard")
     
@@ -1056,12 +1059,12 @@ class HadesHelperUltimate(ctk.CTk):
         if self.current_view == view_name:
             return
         
+        # Hide the old view; its watchers wait until it is shown again
+        if self.current_view is not None:
+            self.views[self.current_view].pack_forget()
+            self.store.suspend_scope(self.current_view)
         self.current_view = view_name
         
-        # Clear main container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        
         # Update navigation buttons
         for key, btn in self.nav_buttons.items():
             if key == view_name:
@@ -1069,22 +1072,25 @@ class HadesHelperUltimate(ctk.CTk):
             else:
                 btn.configure(fg_color="transparent")
         
-        # Create appropriate view
-        if view_name == "dashboard":
-            self.create_enhanced_dashboard()
-        elif view_name == "build":
-            self.create_build_manager_view()
-            self.restore_build_manager_state()
-        elif view_name == "duo":
-            self.create_duo_tracker_view()
-        elif view_name == "choice":
-            self.create_choice_helper_view()
-        elif view_name == "boss":
-            self.create_boss_prep_view()
-        elif view_name == "status":
-            self.create_status_view()
-        elif view_name == "tools":
-            self.create_tools_view()
+        view = self.views.get(view_name)
+        if view is None:
+            builders = {
+                "dashboard": self.create_enhanced_dashboard,
+                "build": self.create_build_manager_view,
+                "duo": self.create_duo_tracker_view,
+                "choice": self.create_choice_helper_view,
+                "boss": self.create_boss_prep_view,
+                "status": self.create_status_view,
+                "tools": self.create_tools_view,
+            }
+            view = ctk.CTkFrame(self.main_container, corner_radius=0, fg_color="transparent")
+            builders[view_name](view)
+            self.views[view_name] = view
+        view.pack(fill="both", expand=True)
+        
+        # Bring the view's watched widgets up to date now rather than on the next change
+        self.store.resume_scope(view_name)
+        self.store.flush()
 
 
     # === ENHANCED DASHBOARD (PHASE 1) ===
@@ -1092,16 +1098,16 @@ class HadesHelperUltimate(ctk.CTk):
     
         # === SMART FEATURES - UNIVERSAL CHOICE HELPER ===
     
-    def create_choice_helper_view(self):
+    def create_choice_helper_view(self, view):
         """Universal helper for ANY door choices."""
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="🚪 Universal Door Helper", 
                     font=ctk.CTkFont(size=24, weight="bold")).pack(side="left")
         
         # Instructions card
-        inst_card = ctk.CTkFrame(self.main_container, 
+        inst_card = ctk.CTkFrame(view, 
                                 fg_color=(COLORS['gold'], "#D97706"),
                                 corner_radius=12)
         inst_card.pack(fill="x", padx=20, pady=(0, 20))
@@ -1111,7 +1117,7 @@ class HadesHelperUltimate(ctk.CTk):
                     text_color="white").pack(pady=12)
         
         # Input frame
-        input_frame = ctk.CTkFrame(self.main_container, 
+        input_frame = ctk.CTkFrame(view, 
                                   fg_color=(COLORS['light'], "#1F2937"),
                                   corner_radius=12)
         input_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -1208,7 +1214,7 @@ class HadesHelperUltimate(ctk.CTk):
                      fg_color=COLORS['success']).pack(pady=12)
         
         # Results frame
-        self.universal_results_frame = ctk.CTkScrollableFrame(self.main_container)
+        self.universal_results_frame = ctk.CTkScrollableFrame(view)
         self.universal_results_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
     
     def analyze_universal_doors(self):
@@ -1236,6 +1242,13 @@ class HadesHelperUltimate(ctk.CTk):
         advisor = UniversalDoorAdvisor(self)
         scored_doors = advisor.score_all_doors(doors)
         
+        # Lookahead value of each door until the biome boss (50 ms budget)
+        plan = self.door_planner.plan(PlanState.from_app(self),
+                                      [DoorPlanner.door_offering(door) for door in scored_doors])
+        for door, value in zip(scored_doors, plan['values']):
+            door['lookahead'] = round(value, 1)
+        planned = scored_doors[plan['best']]
+        
         # Show winner
         winner = scored_doors[0]
         winner_card = ctk.CTkFrame(
@@ -1265,6 +1278,16 @@ class HadesHelperUltimate(ctk.CTk):
                     text_color="white",
                     wraplength=700).pack(padx=20, pady=(4, 12))
         
+        if plan['depth'] > 0:
+            lookahead_text = f"🔭 Looking {plan['depth']} of {plan['rooms_left']} rooms ahead: "
+            if planned is winner:
+                lookahead_text += "also the best door until the boss"
+            else:
+                lookahead_text += f"{self.format_door_display(planned)} sets up the biome better"
+            ctk.CTkLabel(winner_card, text=lookahead_text,
+                        font=ctk.CTkFont(size=12, weight="bold"),
+                        text_color=COLORS['gold']).pack(padx=20, pady=(0, 12))
+        
         # Show all doors ranked
         ctk.CTkLabel(self.universal_results_frame, text="📊 ALL DOORS RANKED",
                     font=ctk.CTkFont(size=14, weight="bold")).pack(pady=12)
@@ -1285,7 +1308,7 @@ class HadesHelperUltimate(ctk.CTk):
                         font=ctk.CTkFont(size=13, weight="bold"),
                         text_color="white").pack(side="left")
             
-            ctk.CTkLabel(header, text=f"{door['score']}/100",
+            ctk.CTkLabel(header, text=f"{door['score']}/100 • 🔭 {door['lookahead']}",
                         font=ctk.CTkFont(size=12, weight="bold"),
                         text_color="white").pack(side="right")
             
@@ -1310,31 +1333,39 @@ class HadesHelperUltimate(ctk.CTk):
 
     # === SMART FEATURES - BOSS PREP ===
     
-    def create_boss_prep_view(self):
+    def create_boss_prep_view(self, view):
         """Boss preparation view."""
-        advisor = BossPrepAdvisor(self)
-        advice = advisor.get_boss_advice()
-        
         # Header
-        header = ctk.CTkFrame(self.main_container, height=100, 
+        header = ctk.CTkFrame(view, height=100, 
                              fg_color=(COLORS['danger'], "#DC2626"))
         header.pack(fill="x")
         header.pack_propagate(False)
         
-        ctk.CTkLabel(header, text=f"⚔️ PREPARE FOR {advice['boss'].upper()}",
+        self.boss_title_label = ctk.CTkLabel(header, text="",
                     font=ctk.CTkFont(size=20, weight="bold"),
-                    text_color="white").pack(pady=15)
+                    text_color="white")
+        self.boss_title_label.pack(pady=15)
+        
+        self.boss_readiness_label = ctk.CTkLabel(header, text="",
+                    font=ctk.CTkFont(size=14, weight="bold"))
+        self.boss_readiness_label.pack()
+        
+        self.boss_prep_scroll = ctk.CTkScrollableFrame(view)
+        self.boss_prep_scroll.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        self.store.watch('boss_advice', self.update_boss_prep, scope="boss")
+    
+    def update_boss_prep(self, advice: Dict):
+        self.boss_title_label.configure(text=f"⚔️ PREPARE FOR {advice['boss'].upper()}")
         
         # Readiness score
         score = advice['readiness_score']
         score_color = COLORS['gold'] if score >= 70 else "white"
+        self.boss_readiness_label.configure(text=f"Readiness: {score}/100", text_color=score_color)
         
-        ctk.CTkLabel(header, text=f"Readiness: {score}/100",
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=score_color).pack()
-        
-        scroll = ctk.CTkScrollableFrame(self.main_container)
-        scroll.pack(fill="both", expand=True, padx=20, pady=20)
+        scroll = self.boss_prep_scroll
+        for widget in scroll.winfo_children():
+            widget.destroy()
         
         # Boss tips
         tips_card = ctk.CTkFrame(scroll, fg_color=(COLORS['info'], "#2563EB"), corner_radius=12)
@@ -1402,9 +1433,9 @@ class HadesHelperUltimate(ctk.CTk):
 
         # === ENHANCED DASHBOARD (PHASE 1) - FIXED ===
     
-    def create_enhanced_dashboard(self):
+    def create_enhanced_dashboard(self, view):
         """Enhanced mission control dashboard with weapon/aspect selection."""
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="🎮 Mission Control", 
@@ -1420,7 +1451,7 @@ class HadesHelperUltimate(ctk.CTk):
                      width=80, height=36, fg_color=COLORS['success']).pack(side="left", padx=4)
         
         # WEAPON SELECTION
-        weapon_frame = ctk.CTkFrame(self.main_container, 
+        weapon_frame = ctk.CTkFrame(view, 
                                    fg_color=(COLORS['primary'], COLORS['primary']),
                                    corner_radius=12)
         weapon_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -1432,68 +1463,43 @@ class HadesHelperUltimate(ctk.CTk):
         weapon_btns = ctk.CTkFrame(weapon_frame, fg_color="transparent")
         weapon_btns.pack(pady=(0, 12))
         
+        self.weapon_buttons = {}
         for weapon in WEAPON_SHORT.keys():
-            is_selected = (weapon == self.selected_weapon)
-            btn_fg = COLORS['success'] if is_selected else "white"
-            
-            ctk.CTkButton(weapon_btns, text=WEAPON_SHORT[weapon],
-                         command=lambda w=weapon: self.select_weapon_inline(w),
-                         width=100, height=40,
-                         fg_color=btn_fg,
-                         text_color=COLORS['primary'] if not is_selected else "white").pack(side="left", padx=4)
-        
-        # ASPECT SELECTION (inline)
-        self.aspect_selection_frame = ctk.CTkFrame(self.main_container, 
+            btn = ctk.CTkButton(weapon_btns, text=WEAPON_SHORT[weapon],
+                               command=lambda w=weapon: self.select_weapon_inline(w),
+                               width=100, height=40)
+            btn.pack(side="left", padx=4)
+            self.weapon_buttons[weapon] = btn
+        
+        # ASPECT SELECTION (inline, filled by refresh_weapon_selection)
+        self.weapon_frame = weapon_frame
+        self.aspect_selection_frame = ctk.CTkFrame(view, 
                                                   fg_color=(COLORS['light'], "#1F2937"),
                                                   corner_radius=12)
         
-        # Only show if weapon selected but no aspect yet
-        if self.selected_weapon and not self.selected_aspect:
-            self.aspect_selection_frame.pack(fill="x", padx=20, pady=(0, 20))
-            
-            ctk.CTkLabel(self.aspect_selection_frame, 
-                        text=f"🎯 SELECT {WEAPON_SHORT[self.selected_weapon].upper()} ASPECT", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=12)
-            
-            aspects_grid = ctk.CTkFrame(self.aspect_selection_frame, fg_color="transparent")
-            aspects_grid.pack(padx=16, pady=(0, 16))
-            
-            if self.selected_weapon in WEAPON_ASPECTS:
-                aspects = list(WEAPON_ASPECTS[self.selected_weapon].keys())
-                
-                for i, aspect_name in enumerate(aspects):
-                    col = i % 4
-                    
-                    aspect_btn = ctk.CTkButton(aspects_grid, 
-                                              text=aspect_name,
-                                              command=lambda a=aspect_name: self.select_aspect_inline(a),
-                                              width=150, height=50,
-                                              fg_color=COLORS['success'])
-                    aspect_btn.grid(row=0, column=col, padx=6, pady=6)
-        
-        # PRIORITY CARD
-        context_recs = self.recommendation_engine.get_context_aware_recommendations()
-        priority = context_recs['immediate_priority']
+        self.store.watch('weapon_choice', self.refresh_weapon_selection, scope="dashboard")
         
-        priority_card = ctk.CTkFrame(self.main_container,
-                                    fg_color=(priority['color'], priority['color']),
-                                    corner_radius=12)
-        priority_card.pack(fill="x", padx=20, pady=(0, 20))
+        # PRIORITY CARD (filled by refresh_priority_card)
+        self.priority_card = ctk.CTkFrame(view, corner_radius=12)
+        self.priority_card.pack(fill="x", padx=20, pady=(0, 20))
         
-        ctk.CTkLabel(priority_card, text=f"🎯 {priority['priority']} PRIORITY", 
+        self.priority_title = ctk.CTkLabel(self.priority_card, text="", 
                     font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color="white").pack(pady=(12, 4))
+                    text_color="white")
+        self.priority_title.pack(pady=(12, 4))
         
-        ctk.CTkLabel(priority_card, text=priority['text'], 
+        self.priority_text = ctk.CTkLabel(self.priority_card, text="", 
                     font=ctk.CTkFont(size=18, weight="bold"),
-                    text_color="white").pack(pady=4)
+                    text_color="white")
+        self.priority_text.pack(pady=4)
         
-        ctk.CTkLabel(priority_card, text=f"💡 {priority['action']}", 
+        self.priority_action = ctk.CTkLabel(self.priority_card, text="", 
                     font=ctk.CTkFont(size=12),
-                    text_color="white").pack(pady=(4, 12))
+                    text_color="white")
+        self.priority_action.pack(pady=(4, 12))
         
         # 3-COLUMN STATS
-        columns = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        columns = ctk.CTkFrame(view, fg_color="transparent")
         columns.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         columns.grid_columnconfigure(0, weight=1)
@@ -1508,18 +1514,12 @@ class HadesHelperUltimate(ctk.CTk):
         ctk.CTkLabel(left_col, text="⚔️ BOSS COUNTDOWN", 
                     font=ctk.CTkFont(size=14, weight="bold")).pack(pady=12)
         
-        boss_rooms_map = {'Tartarus': 14, 'Asphodel': 24, 'Elysium': 36, 'Temple of Styx': 45}
-        total = boss_rooms_map.get(self.current_region, 14)
-        progress = self.room_number / total
-        rooms_to_boss = total - self.room_number
-        
-        progress_bar = ctk.CTkProgressBar(left_col, width=200, height=20)
-        progress_bar.pack(padx=16, pady=8)
-        progress_bar.set(progress)
+        self.boss_progress_bar = ctk.CTkProgressBar(left_col, width=200, height=20)
+        self.boss_progress_bar.pack(padx=16, pady=8)
         
-        ctk.CTkLabel(left_col, text=f"{rooms_to_boss} rooms", 
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    text_color=COLORS['danger'] if rooms_to_boss <= 3 else COLORS['success']).pack(pady=8)
+        self.rooms_to_boss_label = ctk.CTkLabel(left_col, text="", 
+                    font=ctk.CTkFont(size=16, weight="bold"))
+        self.rooms_to_boss_label.pack(pady=8)
         
         # Center: Quick stats
         center_col = ctk.CTkFrame(columns, fg_color=(COLORS['light'], "#1F2937"), corner_radius=12)
@@ -1528,21 +1528,20 @@ class HadesHelperUltimate(ctk.CTk):
         ctk.CTkLabel(center_col, text="📊 QUICK STATS", 
                     font=ctk.CTkFont(size=14, weight="bold")).pack(pady=12)
         
-        stats = [
-            ("🗺️ Region", self.current_region),
-            ("🚪 Room", str(self.room_number)),
-            ("🎁 Boons", str(len(self.acquired_boons))),
-            ("❤️ HP", f"{self.current_health}/{self.max_health}"),
-        ]
-        
-        for label, value in stats:
+        self.quick_stat_labels = {}
+        for key, label in [('region', "🗺️ Region"), ('room', "🚪 Room"),
+                           ('boons', "🎁 Boons"), ('hp', "❤️ HP")]:
             stat_row = ctk.CTkFrame(center_col, fg_color="transparent")
             stat_row.pack(fill="x", padx=16, pady=6)
             
             ctk.CTkLabel(stat_row, text=label, font=ctk.CTkFont(size=11),
                         anchor="w").pack(side="left")
-            ctk.CTkLabel(stat_row, text=value, font=ctk.CTkFont(size=11, weight="bold"),
-                        anchor="e").pack(side="right")
+            value_label = ctk.CTkLabel(stat_row, text="", font=ctk.CTkFont(size=11, weight="bold"),
+                                      anchor="e")
+            value_label.pack(side="right")
+            self.quick_stat_labels[key] = value_label
+        
+        self.store.watch('run_progress', self.refresh_run_progress, scope="dashboard")
         
         # Right: Door priorities
         right_col = ctk.CTkFrame(columns, fg_color=(COLORS['warning'], "#D97706"), corner_radius=12)
@@ -1552,8 +1551,74 @@ class HadesHelperUltimate(ctk.CTk):
                     font=ctk.CTkFont(size=14, weight="bold"),
                     text_color="white").pack(pady=12)
         
+        self.door_priorities_frame = ctk.CTkFrame(right_col, fg_color="transparent")
+        self.door_priorities_frame.pack(fill="both", expand=True)
+        
+        self.store.watch('context_recommendations', self.refresh_priority_card, scope="dashboard")
+        self.store.watch('context_recommendations', self.refresh_door_priorities, scope="dashboard")
+    
+    def refresh_weapon_selection(self, choice: Tuple[Optional[str], Optional[str]]):
+        weapon, aspect = choice
+        for name, btn in self.weapon_buttons.items():
+            is_selected = (name == weapon)
+            btn.configure(fg_color=COLORS['success'] if is_selected else "white",
+                          text_color=COLORS['primary'] if not is_selected else "white")
+        
+        for widget in self.aspect_selection_frame.winfo_children():
+            widget.destroy()
+        
+        # Only show if weapon selected but no aspect yet
+        if not weapon or aspect:
+            self.aspect_selection_frame.pack_forget()
+            return
+        
+        self.aspect_selection_frame.pack(fill="x", padx=20, pady=(0, 20), after=self.weapon_frame)
+        
+        ctk.CTkLabel(self.aspect_selection_frame, 
+                    text=f"🎯 SELECT {WEAPON_SHORT[weapon].upper()} ASPECT", 
+                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=12)
+        
+        aspects_grid = ctk.CTkFrame(self.aspect_selection_frame, fg_color="transparent")
+        aspects_grid.pack(padx=16, pady=(0, 16))
+        
+        if weapon in WEAPON_ASPECTS:
+            aspects = list(WEAPON_ASPECTS[weapon].keys())
+            
+            for i, aspect_name in enumerate(aspects):
+                col = i % 4
+                
+                aspect_btn = ctk.CTkButton(aspects_grid, 
+                                          text=aspect_name,
+                                          command=lambda a=aspect_name: self.select_aspect_inline(a),
+                                          width=150, height=50,
+                                          fg_color=COLORS['success'])
+                aspect_btn.grid(row=0, column=col, padx=6, pady=6)
+    
+    def refresh_run_progress(self, progress: Dict):
+        rooms_to_boss = progress['rooms_to_boss']
+        self.boss_progress_bar.set(progress['boss_progress'])
+        self.rooms_to_boss_label.configure(
+            text=f"{rooms_to_boss} rooms",
+            text_color=COLORS['danger'] if rooms_to_boss <= 3 else COLORS['success'])
+        
+        self.quick_stat_labels['region'].configure(text=progress['region'])
+        self.quick_stat_labels['room'].configure(text=str(progress['room']))
+        self.quick_stat_labels['boons'].configure(text=str(progress['boons']))
+        self.quick_stat_labels['hp'].configure(text=f"{progress['health']}/{progress['max_health']}")
+    
+    def refresh_priority_card(self, context_recs: Dict):
+        priority = context_recs['immediate_priority']
+        self.priority_card.configure(fg_color=(priority['color'], priority['color']))
+        self.priority_title.configure(text=f"🎯 {priority['priority']} PRIORITY")
+        self.priority_text.configure(text=priority['text'])
+        self.priority_action.configure(text=f"💡 {priority['action']}")
+    
+    def refresh_door_priorities(self, context_recs: Dict):
+        for widget in self.door_priorities_frame.winfo_children():
+            widget.destroy()
+        
         for suggestion in context_recs['door_suggestions']:
-            sug_card = ctk.CTkFrame(right_col, fg_color="white", corner_radius=8)
+            sug_card = ctk.CTkFrame(self.door_priorities_frame, fg_color="white", corner_radius=8)
             sug_card.pack(fill="x", padx=12, pady=6)
             
             ctk.CTkLabel(sug_card, text=f"{suggestion['priority']}: {suggestion['type']}", 
@@ -1565,39 +1630,36 @@ class HadesHelperUltimate(ctk.CTk):
                         text_color="gray").pack(padx=12, pady=(0, 8))
     
     def select_weapon_inline(self, weapon: str):
-        self.selected_weapon = weapon
-        self.selected_aspect = None
+        self.build.set_weapon(weapon)
+        self.build.set_aspect(None)
         self.notifications.add(f"⚔️ {WEAPON_SHORT[weapon]} selected", "info")
         self.show_toast(f"Weapon: {WEAPON_SHORT[weapon]}", COLORS['primary'])
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        self.create_enhanced_dashboard()
         self.update_all()
     
     def select_aspect_inline(self, aspect: str):
-        self.selected_aspect = aspect
+        self.build.set_aspect(aspect)
         self.notifications.add(f"🎯 {aspect} selected!", "info")
         self.show_toast(f"Aspect: {aspect}", COLORS['gold'])
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        self.create_enhanced_dashboard()
         self.update_all()
     # === DUO TRACKER (PHASE 1) ===
     
-    def create_duo_tracker_view(self):
+    def create_duo_tracker_view(self, view):
         """Visual duo tracker."""
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="🌟 Duo Boon Tracker", 
                     font=ctk.CTkFont(size=24, weight="bold")).pack(side="left")
         
-        scroll = ctk.CTkScrollableFrame(self.main_container)
-        scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.duo_scroll = ctk.CTkScrollableFrame(view)
+        self.duo_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        duo_progress = self.synergy_analyzer.get_duo_progress(
-            self.acquired_boons, self.selected_gods
-        )
+        self.store.watch('duo_tracker', self.update_duo_tracker, scope="duo")
+    
+    def update_duo_tracker(self, duo_progress: List[Dict]):
+        scroll = self.duo_scroll
+        for widget in scroll.winfo_children():
+            widget.destroy()
         
         if not duo_progress:
             ctk.CTkLabel(scroll, text="Add 2+ gods to see duo possibilities!",
@@ -1659,6 +1721,12 @@ class HadesHelperUltimate(ctk.CTk):
         progress_bar.pack(padx=16, pady=8)
         progress_bar.set(progress / 100)
         
+        odds = duo.get('odds')
+        if odds:
+            ctk.CTkLabel(card, text=f"🎲 {odds['biome']:.0%} before the boss • {odds['run']:.0%} this run",
+                        font=ctk.CTkFont(size=11, weight="bold"),
+                        text_color="white").pack(padx=16, pady=(0, 4))
+        
         if duo.get('missing_boons'):
             ctk.CTkLabel(card, text=f"Missing: {', '.join(duo['missing_boons'])}", 
                         font=ctk.CTkFont(size=10),
@@ -1666,14 +1734,14 @@ class HadesHelperUltimate(ctk.CTk):
     
     # === BUILD MANAGER (Same as v13.1 with recommendations) ===
     
-    def create_build_manager_view(self):
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+    def create_build_manager_view(self, view):
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="🎁 Build Manager", 
                     font=ctk.CTkFont(size=24, weight="bold")).pack(side="left")
         
-        columns = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        columns = ctk.CTkFrame(view, fg_color="transparent")
         columns.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         columns.grid_columnconfigure(0, weight=1)
@@ -1742,6 +1810,12 @@ class HadesHelperUltimate(ctk.CTk):
         self.build_items_scroll = ctk.CTkScrollableFrame(left_col, height=300)
         self.build_items_scroll.pack(fill="both", expand=True, padx=16, pady=(0, 16))
         
+        # One row per boon; a pom only relabels its row
+        self.build_items_list = KeyedListRenderer(
+            self._create_build_item_row, self._update_build_item_row,
+            create_empty=self._create_build_items_placeholder,
+            pack_options={'fill': "x", 'pady': 4, 'padx': 8})
+        
         right_col = ctk.CTkFrame(columns, fg_color=(COLORS['purple'], "#7C3AED"),
                                 corner_radius=12)
         right_col.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
@@ -1757,10 +1831,10 @@ class HadesHelperUltimate(ctk.CTk):
                     font=ctk.CTkFont(size=11),
                     text_color="white").pack(side="left", padx=8)
         
-        self.rec_god_var = ctk.StringVar(value="Zeus")
+        self.rec_god_var = ctk.StringVar(value=self.rec_god)
         rec_god_menu = ctk.CTkOptionMenu(rec_selector, values=sorted(GODS_DATA.keys()),
                                         variable=self.rec_god_var,
-                                        command=lambda g: self.update_recommendations(),
+                                        command=self.on_rec_god_change,
                                         width=150, height=32,
                                         fg_color="white",
                                         text_color=COLORS['purple'])
@@ -1769,22 +1843,21 @@ class HadesHelperUltimate(ctk.CTk):
         self.recommendations_scroll = ctk.CTkScrollableFrame(right_col)
         self.recommendations_scroll.pack(fill="both", expand=True, padx=16, pady=(0, 16))
         
-        self.update_recommendations()
+        self.store.watch('recommendations', self.update_recommendations, scope="build")
+        self.store.watch('build_items', self.update_build_items_display, scope="build")
+        self.store.watch('boon_count',
+                         lambda count: self.build_items_count.configure(text=f"({count})"),
+                         scope="build")
 
-    def restore_build_manager_state(self):
-        if hasattr(self, 'recommendations_scroll'):
-            self.update_recommendations()
-        if hasattr(self, 'build_items_scroll'):
-            self.update_build_items_display()
-        if hasattr(self, 'build_items_count'):
-            self.build_items_count.configure(text=f"({len(self.acquired_boons)})")
+    def on_rec_god_change(self, god: str):
+        self.rec_god = god
+        self.update_all('rec_god')
 
-    def update_recommendations(self):
+    def update_recommendations(self, recommendations: List[Dict]):
         for widget in self.recommendations_scroll.winfo_children():
             widget.destroy()
         
-        god = self.rec_god_var.get()
-        recommendations = self.recommendation_engine.recommend_boon_from_god(god)
+        god = self.rec_god
         
         if not recommendations:
             ctk.CTkLabel(self.recommendations_scroll, 
@@ -1838,32 +1911,24 @@ class HadesHelperUltimate(ctk.CTk):
                      text_color=color[0]).pack(pady=(4, 8))
 
     def quick_add_recommended_boon(self, god: str, boon: str):
-        self.acquired_boons.add(boon)
-        self.selected_gods.add(god)
-        self.pom_levels[boon] = 1
+        self.build.add_boon(boon, god)
         self.last_boon_added = boon
         
-        # Clear cache
-        self._dps_cache = None
-        self._win_cache = None
-        
         self.notifications.add(f"✅ {boon}!", "info")
         self.show_toast(f"Added {boon}", COLORS['success'])
         self.update_all()
-        if hasattr(self, 'recommendations_scroll'):
-            self.update_recommendations()
 
     
     # === STATUS VIEW ===
     
-    def create_status_view(self):
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+    def create_status_view(self, view):
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="📊 Run Status", 
                     font=ctk.CTkFont(size=24, weight="bold")).pack(side="left")
         
-        grid_frame = ctk.CTkFrame(self.main_container,
+        grid_frame = ctk.CTkFrame(view,
                                  fg_color=(COLORS['light'], "#1F2937"),
                                  corner_radius=12)
         grid_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -1898,7 +1963,7 @@ class HadesHelperUltimate(ctk.CTk):
         self.heat_entry.bind("<KeyRelease>", lambda e: self.save_heat_value())
         self.heat_entry.grid(row=2, column=1, padx=12, pady=8)
         
-        hp_frame = ctk.CTkFrame(self.main_container,
+        hp_frame = ctk.CTkFrame(view,
                                fg_color=(COLORS['danger'], "#DC2626"),
                                corner_radius=12)
         hp_frame.pack(fill="x", padx=20, pady=(0, 20))
@@ -1939,7 +2004,7 @@ class HadesHelperUltimate(ctk.CTk):
 
     def save_room_value(self):
         try:
-            self.room_number = int(self.room_entry.get())
+            self.build.set_room(int(self.room_entry.get()))
             self.update_all()
         except:
             pass
@@ -1947,39 +2012,39 @@ class HadesHelperUltimate(ctk.CTk):
     def save_heat_value(self):
         try:
             self.heat_level = int(self.heat_entry.get())
-            self.update_all()
+            self.update_all('heat')
         except:
             pass
 
     def save_hp_value(self):
         try:
             self.current_health = int(self.hp_entry.get())
-            self.update_all()
+            self.update_all('health')
         except:
             pass
 
     def save_max_hp_value(self):
         try:
             self.max_health = int(self.max_hp_entry.get())
-            self.update_all()
+            self.update_all('health')
         except:
             pass
 
     def on_region_change(self, region: str):
         self.current_region = region
         self.notifications.add(f"🗺️ {region}", "info")
-        self.update_all()
+        self.update_all('region')
     
     # === TOOLS VIEW (PHASE 3) ===
     
-    def create_tools_view(self):
-        header = ctk.CTkFrame(self.main_container, fg_color="transparent")
+    def create_tools_view(self, view):
+        header = ctk.CTkFrame(view, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=20)
         
         ctk.CTkLabel(header, text="⚙️ Tools", 
                     font=ctk.CTkFont(size=24, weight="bold")).pack(side="left")
         
-        tools_grid = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        tools_grid = ctk.CTkFrame(view, fg_color="transparent")
         tools_grid.pack(expand=True)
         
         tools = [
@@ -2076,12 +2141,8 @@ class HadesHelperUltimate(ctk.CTk):
                     'gods': list(self.selected_gods),
                 }
                 
-                template_dir = DATA_DIR / "templates"
-                template_dir.mkdir(exist_ok=True)
-                template_file = template_dir / f"{name}.json"
-                
-                with open(template_file, 'w') as f:
-                    json.dump(build_data, f, indent=2)
+                template_file = DATA_DIR / "templates" / f"{name}.json"
+                self.persistence.write_json(template_file, build_data, indent=2)
                 
                 tkmb.showinfo("Saved", f"'{name}' saved!")
                 self.show_toast(f"Saved: {name}", COLORS['success'])
@@ -2094,15 +2155,13 @@ class HadesHelperUltimate(ctk.CTk):
         if name:
             try:
                 template_file = DATA_DIR / "templates" / f"{name}.json"
+                self.persistence.flush(timeout=2)
                 if template_file.exists():
                     with open(template_file, 'r') as f:
                         data = json.load(f)
                     
-                    self.selected_weapon = data.get('weapon')
-                    self.selected_aspect = data.get('aspect')
-                    self.acquired_boons = set(data.get('boons', []))
-                    self.pom_levels = data.get('pom_levels', {})
-                    self.selected_gods = set(data.get('gods', []))
+                    self.build.load(data.get('weapon'), data.get('aspect'), data.get('boons', []),
+                                    data.get('pom_levels', {}), data.get('gods', []))
                     
                     self.update_all()
                     tkmb.showinfo("Loaded", f"'{name}' loaded!")
@@ -2201,23 +2260,26 @@ SPACE - Room +1 (with alerts!)
     
     # === CORE METHODS ===
     
+    def build_fingerprint(self) -> int:
+        """Canonical key of the current build for the build cache (kept incrementally)."""
+        return self.build.fingerprint
+    
     def calculate_detailed_dps(self) -> Dict:
         """Calculate DPS with caching."""
-        cache_key = (
-            self.selected_weapon,
-            self.selected_aspect,
-            frozenset(self.acquired_boons),
-            tuple(sorted(self.pom_levels.items()))
-        )
-        
-        if self._dps_cache_key == cache_key and self._dps_cache is not None:
-            return self._dps_cache
-        
-        result = self._calculate_dps_internal()
-        self._dps_cache = result
-        self._dps_cache_key = cache_key
-        
-        return result
+        return self.build_cache.get(('dps', self.build_fingerprint()), self._calculate_dps_internal)
+    
+    def build_context_key(self) -> Tuple:
+        """Build fingerprint plus the run context not in it (room and Death Defiances are)."""
+        return (self.build_fingerprint(), self.current_health, self.max_health, self.current_region)
+    
+    def build_features(self) -> Dict:
+        """Feature vector of the current build and run context, shared by every advisor (cached)."""
+        return self.build_cache.get(('features',) + self.build_context_key(), self._extract_build_features)
+    
+    def calculate_build_strength(self) -> Dict:
+        """BuildAnalyzer strength of the current build (cached)."""
+        return self.build_cache.get(('strength',) + self.build_context_key(),
+                                    lambda: self.build_analyzer.calculate_build_strength(self.build_features()))
     
     def _calculate_dps_internal(self) -> Dict:
         """Internal DPS calculation."""
@@ -2225,39 +2287,7 @@ SPACE - Room +1 (with alerts!)
         if not self.selected_weapon:
             return breakdown
         
-        weapon_data = {
-            'Stygian Blade': {'attack': 20, 'speed': 0.45},
-            'Heart-Seeking Bow': {'attack': 10, 'speed': 0.7},
-            'Shield of Chaos': {'attack': 25, 'speed': 0.5},
-            'Eternal Spear': {'attack': 25, 'speed': 0.55},
-            'Twin Fists': {'attack': 12, 'speed': 0.3},
-            'Adamant Rail': {'attack': 10, 'speed': 0.15}
-        }.get(self.selected_weapon, {'attack': 20, 'speed': 0.5})
-        
-        base_attack = weapon_data['attack']
-        attack_speed = weapon_data['speed']
-        aspect_mult = 1.0
-        
-        if self.selected_aspect:
-            aspect_mults = {
-                'Zagreus': 1.05, 'Nemesis': 1.10, 'Poseidon': 1.05,
-                'Arthur': 1.20, 'Talos': 1.05, 'Demeter': 1.10,
-                'Gilgamesh': 1.15, 'Chaos': 1.10, 'Hera': 1.05,
-                'Achilles': 1.15, 'Eris': 1.10
-            }
-            aspect_mult = aspect_mults.get(self.selected_aspect, 1.0)
-        
-        attack_damage = base_attack * aspect_mult
-        additive_bonus = 0
-        
-        for boon in self.acquired_boons:
-            if 'Strike' in boon or 'Flourish' in boon or 'Shot' in boon:
-                level = self.pom_levels.get(boon, 1)
-                additive_bonus += 40 + (8 * (level - 1))
-        
-        attack_damage = attack_damage * (1 + additive_bonus / 100)
-        attacks_per_sec = 1 / attack_speed
-        total_dps = attack_damage * attacks_per_sec
+        total_dps = self.calculate_detailed_dps_value()
         
         breakdown['total'] = int(total_dps)
         
@@ -2271,32 +2301,13 @@ SPACE - Room +1 (with alerts!)
             breakdown['rating'] = "📊"
         
         return breakdown
-
-    
-    def analyze_boon_synergies(self, boon_name: str) -> Dict:
-        synergy_data = {'synergy_score': 0, 'synergies': [], 'duo_potential': []}
-        boon_data = BOON_NAME_TO_DATA.get(boon_name)
-        if not boon_data:
-            return synergy_data
-        
-        god = boon_data.get('god')
-        duos = self.synergy_analyzer.get_duo_progress(
-            self.acquired_boons | {boon_name}, self.selected_gods | {god}
-        )
-        
-        for duo in duos:
-            if duo['progress'] > 0:
-                synergy_data['duo_potential'].append({
-                    'name': duo['name'],
-                    'progress': duo['progress'],
-                    'ready': duo.get('ready', False)
-                })
-                if duo.get('ready'):
-                    synergy_data['synergy_score'] += 50
-        
-        return synergy_data
     
     def calculate_win_probability(self) -> Dict:
+        """Win chance of the current build (cached; history changes refresh it)."""
+        key = ('win', self.build_fingerprint(), self.analytics.get_total_runs(), self.analytics.loading)
+        return self.build_cache.get(key, self._calculate_win_probability_internal)
+    
+    def _calculate_win_probability_internal(self) -> Dict:
         base_prob = 50
         boon_count = len(self.acquired_boons)
         room = self.room_number
@@ -2310,6 +2321,12 @@ SPACE - Room +1 (with alerts!)
         dd_bonus = self.death_defiances_remaining * 7 - 10
         base_prob += dd_bonus
         
+        # Lean on past runs with the same gods once there are enough of them
+        if self.selected_gods:
+            history = self.analytics.get_combo_summary(list(self.selected_gods))
+            if history and history['runs'] >= 5:
+                base_prob = base_prob * 0.7 + history['win_rate'] * 0.3
+        
         final_prob = max(5, min(95, base_prob))
         return {'percentage': int(final_prob)}
     
@@ -2318,15 +2335,9 @@ SPACE - Room +1 (with alerts!)
         available = [b for b in BOONS_DATA if b['god'] == god and b['name'] not in self.acquired_boons]
         if available:
             boon = available[0]['name']
-            self.acquired_boons.add(boon)
-            self.selected_gods.add(god)
-            self.pom_levels[boon] = 1
+            self.build.add_boon(boon, god)
             self.last_boon_added = boon
             
-            # Clear cache
-            self._dps_cache = None
-            self._win_cache = None
-            
             self.notifications.add(f"✅ {boon}", "info")
             self.show_toast(f"Added {boon}", COLORS['success'])
             self.update_all()
@@ -2345,29 +2356,18 @@ SPACE - Room +1 (with alerts!)
             tkmb.showwarning("Missing", "Select god and boon")
             return
         
-        self.acquired_boons.add(boon)
-        self.selected_gods.add(god)
-        self.pom_levels[boon] = 1
+        self.build.add_boon(boon, god)
         self.last_boon_added = boon
         
-        # Clear cache
-        self._dps_cache = None
-        self._win_cache = None
-        
         self.notifications.add(f"✅ {boon}!", "info")
         self.show_toast(f"Added {boon}", COLORS['success'])
         self.update_all()
-        if hasattr(self, 'recommendations_scroll'):
-            self.update_recommendations()
     
     def quick_pom_boon(self, boon: str):
         if boon in self.acquired_boons:
             current = self.pom_levels.get(boon, 1)
             new_level = min(current + 1, 10)
-            self.pom_levels[boon] = new_level
-            
-            # Clear DPS cache (pom affects DPS)
-            self._dps_cache = None
+            self.build.set_pom(boon, new_level)
             
             self.notifications.add(f"📈 {boon} Lv.{new_level}", "info")
             self.update_all()
@@ -2375,11 +2375,8 @@ SPACE - Room +1 (with alerts!)
     
     def clear_all(self):
         if tkmb.askyesno("Clear", "Clear all boons?"):
-            self.acquired_boons.clear()
-            self.pom_levels.clear()
+            self.build.clear_boons()
             self.update_all()
-            if hasattr(self, 'recommendations_scroll'):
-                self.update_recommendations()
     
     def quick_adjust_health(self, amount: int):
         current = self.current_health
@@ -2389,93 +2386,146 @@ SPACE - Room +1 (with alerts!)
         if hasattr(self, 'hp_entry'):
             self.hp_entry.delete(0, 'end')
             self.hp_entry.insert(0, str(new_hp))
-        self.update_all()
+        self.update_all('health')
     
     def use_death_defiance(self):
         if self.death_defiances_remaining > 0:
-            self.death_defiances_remaining -= 1
-            self.update_dd_display()
+            self.build.set_death_defiances(self.death_defiances_remaining - 1)
             self.notifications.add(f"💀 {self.death_defiances_remaining} DD left!", "warning")
             self.show_toast(f"{self.death_defiances_remaining} Death Defiances left", COLORS['danger'])
             self.update_all()
     
-    def update_dd_display(self):
-        hearts = "❤️" * self.death_defiances_remaining
-        empty = "🖤" * (3 - self.death_defiances_remaining)
+    def update_dd_display(self, remaining: int):
+        hearts = "❤️" * remaining
+        empty = "🖤" * (3 - remaining)
         self.sidebar_dd.configure(text=f"💀 {hearts}{empty}")
     
-    def update_all(self):
-        """Debounced update - prevents multiple rapid updates."""
+    def update_all(self, *inputs: str):
+        """
+        Debounced update - prevents multiple rapid updates.
+        
+        Build changes reach the store through ``self.build.listener``; pass
+        the names of any other changed inputs ('health', 'region', 'heat',
+        'history', 'rec_god').
+        """
+        self.store.touch(*inputs)
         if self.update_timer_id is not None:
             self.after_cancel(self.update_timer_id)
         
         self.update_timer_id = self.after(50, self._do_update_all)
     
     def _do_update_all(self):
-        """Actual update implementation (debounced)."""
+        """Actual update implementation (debounced): refresh widgets whose values changed."""
         self.update_timer_id = None
         
         try:
-            score = min(len(self.acquired_boons) * 10, 100)
-            dps_data = self.calculate_detailed_dps()
-            prob_data = self.calculate_win_probability()
-            
-            self.sidebar_score.configure(text=str(score))
-            self.sidebar_dps.configure(text=str(dps_data['total']))
-            self.sidebar_winrate.configure(text=f"{prob_data['percentage']}%")
-            
-            self.update_dd_display()
-            
-            if hasattr(self, 'sidebar_weapon'):
-                weapon_text = WEAPON_SHORT.get(self.selected_weapon, "No weapon") if self.selected_weapon else "No weapon"
-                self.sidebar_weapon.configure(text=f"⚔️ {weapon_text}")
-            
-            if hasattr(self, 'sidebar_aspect'):
-                aspect_text = self.selected_aspect if self.selected_aspect else "No aspect"
-                self.sidebar_aspect.configure(text=f"🎯 {aspect_text}")
-            
-            if hasattr(self, 'sidebar_boons'):
-                boon_count = len(self.acquired_boons)
-                self.sidebar_boons.configure(text=f"🎁 {boon_count} boons")
-            
-            if hasattr(self, 'build_items_count'):
-                self.build_items_count.configure(text=f"({len(self.acquired_boons)})")
-            
-            if hasattr(self, 'build_items_scroll') and self.current_view == "build":
-                self.update_build_items_display()
-            
+            self.store.flush()
         except Exception as e:
             print(f"Update error: {e}")
     
-    def update_build_items_display(self):
-        for widget in self.build_items_scroll.winfo_children():
-            widget.destroy()
-        
-        if not self.acquired_boons:
-            ctk.CTkLabel(self.build_items_scroll, text="No boons yet").pack(pady=20)
-            return
-        
+    # === DERIVED VALUES ===
+    
+    def setup_derived_values(self):
+        """Declare every derived value with the inputs it is computed from."""
+        store = self.store
+        store.derive('score', ['boons'], lambda: min(len(self.acquired_boons) * 10, 100))
+        store.derive('boon_count', ['boons'], lambda: len(self.acquired_boons))
+        store.derive('weapon_text', ['weapon'],
+                     lambda: WEAPON_SHORT.get(self.selected_weapon, "No weapon") if self.selected_weapon else "No weapon")
+        store.derive('aspect_text', ['aspect'], lambda: self.selected_aspect if self.selected_aspect else "No aspect")
+        store.derive('death_defiances', ['dd'], lambda: self.death_defiances_remaining)
+        
+        store.derive('dps', ['weapon', 'aspect', 'boons', 'poms', 'hammers'], self.calculate_detailed_dps)
+        store.derive('win_probability', ['boons', 'gods', 'room', 'dd', 'history'],
+                     self.calculate_win_probability)
+        store.derive('build_strength',
+                     ['weapon', 'boons', 'gods', 'poms', 'hammers', 'room', 'health', 'region'],
+                     self.calculate_build_strength)
+        store.derive('duo_progress', ['boons', 'gods'],
+                     lambda: self.synergy_analyzer.get_duo_progress(self.acquired_boons, self.selected_gods))
+        store.derive('duo_odds', ['boons', 'gods', 'room', 'region'],
+                     lambda: self.duo_intelligence.odds.evaluate(self.acquired_boons, self.selected_gods,
+                                                                 self.room_number, self.current_region))
+        store.derive('duo_tracker', ['duo_progress', 'duo_odds'], self._duo_tracker)
+        store.derive('context_recommendations', ['room', 'health', 'boons', 'dd', 'region'],
+                     self.recommendation_engine.get_context_aware_recommendations)
+        store.derive('recommendations', ['boons', 'gods', 'weapon', 'rec_god'],
+                     lambda: self.recommendation_engine.recommend_boon_from_god(self.rec_god))
+        store.derive('build_items', ['boons', 'poms'], self._build_items)
+        store.derive('weapon_choice', ['weapon', 'aspect'], lambda: (self.selected_weapon, self.selected_aspect))
+        store.derive('run_progress', ['region', 'room', 'boons', 'health'], self._run_progress)
+        store.derive('boss_advice', ['region', 'health', 'dd', 'boons', 'gods', 'dps'],
+                     lambda: BossPrepAdvisor(self).get_boss_advice())
+    
+    def _duo_tracker(self) -> List[Dict]:
+        """Duo progress with the odds of taking each duo this biome and this run."""
+        odds = self.store.get('duo_odds')
+        return [dict(duo, odds=odds[duo['name']]) for duo in self.store.get('duo_progress')]
+    
+    def _run_progress(self) -> Dict:
+        """Boss countdown and quick stats shown on the dashboard."""
+        total = BIOME_ENDS.get(self.current_region, 14)
+        return {
+            'region': self.current_region,
+            'room': self.room_number,
+            'boons': len(self.acquired_boons),
+            'health': self.current_health,
+            'max_health': self.max_health,
+            'boss_progress': self.room_number / total,
+            'rooms_to_boss': total - self.room_number,
+        }
+    
+    def _build_items(self) -> List[Tuple[str, int, str]]:
+        """(boon, pom level, god) rows of the build list, sorted by boon."""
+        items = []
         for boon in sorted(self.acquired_boons):
             boon_data = BOON_NAME_TO_DATA.get(boon)
-            if not boon_data:
-                continue
-            
-            card = ctk.CTkFrame(self.build_items_scroll, fg_color=(COLORS['light'], "#1F2937"), corner_radius=8)
-            card.pack(fill="x", pady=4, padx=8)
-            
-            level = self.pom_levels.get(boon, 1)
-            
-            info = ctk.CTkFrame(card, fg_color="transparent")
-            info.pack(side="left", fill="x", expand=True, padx=12, pady=8)
-            
-            ctk.CTkLabel(info, text=f"{boon} Lv.{level}", font=ctk.CTkFont(size=12, weight="bold"), anchor="w").pack(anchor="w")
-            ctk.CTkLabel(info, text=boon_data['god'], font=ctk.CTkFont(size=9), text_color="gray", anchor="w").pack(anchor="w")
-            
-            btns = ctk.CTkFrame(card, fg_color="transparent")
-            btns.pack(side="right", padx=8)
-            
-            ctk.CTkButton(btns, text="📈", command=lambda b=boon: self.quick_pom_boon(b), width=50, height=28, fg_color=COLORS['purple']).pack(side="left", padx=2)
-
+            if boon_data:
+                items.append((boon, self.pom_levels.get(boon, 1), boon_data['god']))
+        return items
+    
+    def watch_sidebar(self):
+        """Sidebar widgets live for the whole session, so their watchers are unscoped."""
+        store = self.store
+        store.watch('score', lambda score: self.sidebar_score.configure(text=str(score)))
+        store.watch('dps', lambda dps: self.sidebar_dps.configure(text=str(dps['total'])))
+        store.watch('win_probability',
+                    lambda prob: self.sidebar_winrate.configure(text=f"{prob['percentage']}%"))
+        store.watch('death_defiances', self.update_dd_display)
+        store.watch('weapon_text', lambda text: self.sidebar_weapon.configure(text=f"⚔️ {text}"))
+        store.watch('aspect_text', lambda text: self.sidebar_aspect.configure(text=f"🎯 {text}"))
+        store.watch('boon_count', lambda count: self.sidebar_boons.configure(text=f"🎁 {count} boons"))
+    
+    def update_build_items_display(self, items: List[Tuple[str, int, str]]):
+        self.build_items_list.render((boon, (level, god)) for boon, level, god in items)
+    
+    def _create_build_items_placeholder(self):
+        placeholder = ctk.CTkLabel(self.build_items_scroll, text="No boons yet")
+        placeholder.pack(pady=20)
+        return placeholder
+    
+    def _create_build_item_row(self, boon: str, item: Tuple[int, str]):
+        level, god = item
+        card = ctk.CTkFrame(self.build_items_scroll, fg_color=(COLORS['light'], "#1F2937"), corner_radius=8)
+        
+        info = ctk.CTkFrame(card, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True, padx=12, pady=8)
+        
+        name_label = ctk.CTkLabel(info, text=f"{boon} Lv.{level}", font=ctk.CTkFont(size=12, weight="bold"), anchor="w")
+        name_label.pack(anchor="w")
+        god_label = ctk.CTkLabel(info, text=god, font=ctk.CTkFont(size=9), text_color="gray", anchor="w")
+        god_label.pack(anchor="w")
+        
+        btns = ctk.CTkFrame(card, fg_color="transparent")
+        btns.pack(side="right", padx=8)
+        
+        ctk.CTkButton(btns, text="📈", command=lambda b=boon: self.quick_pom_boon(b), width=50, height=28, fg_color=COLORS['purple']).pack(side="left", padx=2)
+        return card, {'name': name_label, 'god': god_label}
+    
+    def _update_build_item_row(self, boon: str, refs: Dict, item: Tuple[int, str]):
+        level, god = item
+        refs['name'].configure(text=f"{boon} Lv.{level}")
+        refs['god'].configure(text=god)
 
 if __name__ == "__main__":
     print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
@@ -0,0 +1,189 @@
+"""
+Hades Build Helper - Parallel Module
+Process-pool sharding for simulation and analytics batches.
+
+Results are identical for any process count; the speedup from more cores
+has not been measured yet (development ran on a single core).
+"""
+
+import hashlib
+import multiprocessing
+import os
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple
+
+from run_aggregates import RunAggregates
+from run_simulator import Policy, SimulationTally, simulate
+
+
+SHARD_RUNS = 2000  # runs per shard; fixed so results do not depend on the core count
+
+# A shard is (index, start, stop, seed) over items [start, stop)
+Shard = Tuple[int, int, int, int]
+
+# Task run in each worker: task(start, stop, seed) -> partial aggregate
+ShardTask = Callable[[int, int, int], Any]
+
+_TASK: Optional[ShardTask] = None
+
+
+def shard_seed(seed: int, index: int) -> int:
+    """Independent 64-bit RNG seed for shard ``index`` of a batch seeded with ``seed``."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def make_shards(total: int, seed: Optional[int] = None, shard_size: int = SHARD_RUNS) -> List[Shard]:
+    """Split ``total`` items into fixed-size shards with deterministic seeds."""
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    if seed is None:
+        seed = int.from_bytes(os.urandom(8), 'little')
+    return [
+        (index, start, min(start + shard_size, total), shard_seed(seed, index))
+        for index, start in enumerate(range(0, total, shard_size))
+    ]
+
+
+def _install(task: ShardTask) -> None:
+    global _TASK
+    _TASK = task
+
+
+def _run_shard(shard: Shard) -> Any:
+    _, start, stop, seed = shard
+    return _TASK(start, stop, seed)
+
+
+def _pool_context(start_method: Optional[str] = None):
+    """
+    Fork where the platform has it, unless ``start_method`` says otherwise.
+
+    Forked workers inherit the task and everything the parent already
+    loaded (BOONS_DATA, CATALOG, a run list) copy-on-write, so nothing is
+    pickled per task.  With spawn (Windows, macOS) the task is pickled once
+    per worker, so it and its policy must be module-level objects.
+    """
+    if start_method is None:
+        methods = multiprocessing.get_all_start_methods()
+        start_method = "fork" if "fork" in methods else "spawn"
+    return multiprocessing.get_context(start_method)
+
+
+def map_shards(task: ShardTask, shards: Sequence[Shard], processes: Optional[int] = None,
+               start_method: Optional[str] = None) -> List[Any]:
+    """
+    Run ``task`` on every shard across a process pool.
+
+    Results come back in shard order.  Fork from a process without other
+    live threads (a script, not the Tk app): a forked child only gets the
+    calling thread, and locks other threads held stay locked.
+    """
+    processes = min(processes or os.cpu_count() or 1, len(shards))
+    if processes <= 1:
+        return [task(start, stop, seed) for _, start, stop, seed in shards]
+
+    with _pool_context(start_method).Pool(processes, initializer=_install, initargs=(task,)) as pool:
+        return pool.map(_run_shard, shards, chunksize=1)
+
+
+def merge_partials(partials: Sequence[Any]) -> Any:
+    """
+    Combine partial aggregates in order.
+
+    Objects with a ``merge`` method (SimulationTally, RunAggregates,
+    GodComboCube) merge into the first; numbers add; lists (histograms)
+    add element-wise; dicts merge key by key.
+    """
+    if not partials:
+        return None
+    merged = partials[0]
+    for partial in partials[1:]:
+        merged = _merge(merged, partial)
+    return merged
+
+
+def _merge(a: Any, b: Any) -> Any:
+    if hasattr(a, 'merge'):
+        return a.merge(b)
+    if isinstance(a, dict):
+        merged = dict(a)
+        for key, value in b.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+    if isinstance(a, list):
+        longer, shorter = (a, b) if len(a) >= len(b) else (b, a)
+        return [x + y for x, y in zip(longer, shorter)] + longer[len(shorter):]
+    return a + b
+
+
+def run_sharded(task: ShardTask, total: int, seed: Optional[int] = None,
+                processes: Optional[int] = None, shard_size: int = SHARD_RUNS,
+                start_method: Optional[str] = None) -> Any:
+    """Shard ``total`` items, run ``task`` on each shard and merge the partials."""
+    return merge_partials(map_shards(task, make_shards(total, seed, shard_size), processes, start_method))
+
+
+# === SIMULATION ===
+
+class _SimulateShard:
+    """Shard task playing ``stop - start`` runs of one policy."""
+
+    def __init__(self, policy: Policy, weapon: Optional[str]):
+        self.policy = policy
+        self.weapon = weapon
+
+    def __call__(self, start: int, stop: int, seed: int) -> SimulationTally:
+        return simulate(self.policy, stop - start, seed, self.weapon)
+
+
+def simulate_parallel(policy: Policy, runs: int, seed: Optional[int] = None,
+                      processes: Optional[int] = None, weapon: Optional[str] = None,
+                      shard_size: int = SHARD_RUNS, start_method: Optional[str] = None) -> SimulationTally:
+    """
+    ``run_simulator.simulate`` spread over all cores.
+
+    The tally depends only on ``seed``, ``runs`` and ``shard_size``, not on
+    how many processes played it.  Under spawn ``policy`` must pickle: use
+    the module-level policies of run_simulator (DoorAdvisorPolicy,
+    BoonAdvisorPolicy, ...), not closures.  How well this scales with
+    cores is unverified.
+    """
+    tally = run_sharded(_SimulateShard(policy, weapon), runs, seed, processes, shard_size, start_method)
+    return tally if tally is not None else SimulationTally()
+
+
+def compare_policies_parallel(policies: Dict[str, Policy], runs: int, seed: Optional[int] = None,
+                              processes: Optional[int] = None,
+                              weapon: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """run_simulator.compare_policies with every policy sharded across cores."""
+    return {
+        name: simulate_parallel(policy, runs, seed, processes, weapon).report()
+        for name, policy in policies.items()
+    }
+
+
+# === ANALYTICS ===
+
+class _AggregateShard:
+    """Shard task folding a slice of a run list into RunAggregates."""
+
+    def __init__(self, runs: Sequence[Dict[str, Any]]):
+        self.runs = runs
+
+    def __call__(self, start: int, stop: int, seed: int) -> RunAggregates:
+        aggregates = RunAggregates()
+        for run in self.runs[start:stop]:
+            aggregates.add(run)
+        return aggregates
+
+
+def aggregate_runs_parallel(runs: Sequence[Dict[str, Any]], processes: Optional[int] = None,
+                            shard_size: int = SHARD_RUNS * 10) -> RunAggregates:
+    """
+    RunAggregates over a large run history, sharded across cores.
+
+    Shards are merged in order, so streaks match ``RunAggregates.rebuild``.
+    With fork the run list is inherited by the workers, not pickled.
+    """
+    aggregates = run_sharded(_AggregateShard(runs), len(runs), 0, processes, shard_size)
+    return aggregates if aggregates is not None else RunAggregates()
@@ -0,0 +1,129 @@
+"""
+Hades Build Helper - Persistence Module
+Single background writer so file saves never block the Tk main loop.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> None:
+    """Write a file through a temporary sibling and ``os.replace``."""
+    path = str(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class PersistenceWorker:
+    """
+    Runs queued write jobs one at a time on a daemon thread.
+
+    Jobs are keyed.  Submitting a job whose key is still waiting replaces
+    the waiting one and moves it to the back of the queue, so rapid saves
+    of the same file collapse into one write of the latest data while
+    ordering against other jobs is preserved.  Jobs submitted with
+    ``coalesce=False`` (such as run appends) always run.
+
+    The queue is bounded: when ``max_pending`` jobs are waiting,
+    ``submit`` blocks until the writer catches up.
+    """
+
+    def __init__(self, max_pending: int = 1024):
+        self.max_pending = max_pending
+        self._pending: 'OrderedDict[Any, Callable[[], None]]' = OrderedDict()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._stopped = False
+        self._sequence = 0
+        self._thread = threading.Thread(target=self._run, name="persistence-writer", daemon=True)
+        self._thread.start()
+
+    # === QUEUE ===
+
+    def submit(self, key: Any, job: Callable[[], None], coalesce: bool = True) -> None:
+        """Queue a write job; runs inline once the worker has been stopped."""
+        with self._condition:
+            if coalesce:
+                self._pending.pop(key, None)
+            else:
+                self._sequence += 1
+                key = (key, self._sequence)
+            while len(self._pending) >= self.max_pending and not self._stopped:
+                self._condition.wait()
+            run_inline = self._stopped
+            if not run_inline:
+                self._pending[key] = job
+                self._condition.notify_all()
+        if run_inline:
+            self._execute(key, job)
+
+    def write_text(self, path: Union[str, Path], text: str) -> None:
+        """Queue an atomic write of ``text`` to ``path`` (coalesced per path)."""
+        self.submit(str(path), lambda: atomic_write_text(path, text))
+
+    def write_json(self, path: Union[str, Path], data: Any, **dump_kwargs) -> None:
+        """
+        Queue an atomic JSON write (coalesced per path).
+
+        The data is serialized immediately, so callers may keep mutating it.
+        """
+        self.write_text(path, json.dumps(data, **dump_kwargs))
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    # === WORKER ===
+
+    @staticmethod
+    def _execute(key: Any, job: Callable[[], None]) -> None:
+        try:
+            job()
+        except Exception as e:
+            print(f"⚠ Error writing {key}: {e}")
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                key, job = self._pending.popitem(last=False)
+                self._busy = True
+                self._condition.notify_all()
+
+            self._execute(key, job)
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued job has been written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Write out everything still queued, then end the worker thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
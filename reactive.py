@@ -0,0 +1,149 @@
+"""
+Hades Build Helper - Reactive Store Module
+Derived values that declare their inputs and recompute only when those change.
+"""
+
+from typing import Dict, List, Any, Callable, Hashable, Iterable, Optional, Set, Tuple
+
+
+class ReactiveStore:
+    """
+    Named derived values over named inputs.
+
+    ``derive(name, depends_on, compute)`` registers a value whose
+    ``depends_on`` may list inputs (plain names such as ``"boons"``) or
+    other derived values.  ``touch(*inputs)`` marks everything downstream
+    of those inputs stale; nothing is computed until the value is read
+    with ``get`` or refreshed by ``flush``.  ``watch`` attaches a widget
+    refresh callback, and ``flush`` recomputes only stale watched values
+    and calls a callback only when its value actually changed.
+
+    Watchers can be registered under a scope (e.g. a view name).
+    ``suspend_scope`` holds back a hidden view's refreshes until
+    ``resume_scope``, and ``unwatch_scope`` drops them when their widgets
+    are destroyed.
+    """
+
+    _MISSING = object()
+
+    def __init__(self):
+        self._computes: Dict[str, Callable[[], Any]] = {}
+        self._depends_on: Dict[str, Tuple[str, ...]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._values: Dict[str, Any] = {}
+        self._stale: Set[str] = set()
+        self._watchers: Dict[str, List[List[Any]]] = {}
+        self._pending: Set[str] = set()
+        self._suspended: Set[Hashable] = set()
+        self.recomputes: Dict[str, int] = {}
+
+    # === DECLARATION ===
+
+    def derive(self, name: str, depends_on: Iterable[str], compute: Callable[[], Any]) -> None:
+        """Register a derived value (its dependencies must already be known or be inputs)."""
+        if name in self._computes:
+            raise ValueError(f"{name!r} is already derived")
+        depends_on = tuple(depends_on)
+        self._computes[name] = compute
+        self._depends_on[name] = depends_on
+        for dependency in depends_on:
+            self._dependents.setdefault(dependency, []).append(name)
+        self._stale.add(name)
+        self.recomputes[name] = 0
+
+    def dependencies(self, name: str) -> Tuple[str, ...]:
+        return self._depends_on.get(name, ())
+
+    # === INVALIDATION ===
+
+    def touch(self, *inputs: str) -> Set[str]:
+        """Mark everything downstream of ``inputs`` stale; returns the stale names."""
+        stale: Set[str] = set()
+        stack = list(inputs)
+        while stack:
+            for dependent in self._dependents.get(stack.pop(), ()):
+                if dependent not in stale:
+                    stale.add(dependent)
+                    stack.append(dependent)
+        self._stale |= stale
+        self._pending |= {name for name in stale if name in self._watchers}
+        return stale
+
+    def is_stale(self, name: str) -> bool:
+        return name in self._stale
+
+    # === READING ===
+
+    def get(self, name: str) -> Any:
+        """Current value, recomputed first if any of its inputs changed."""
+        if name in self._stale or name not in self._values:
+            self._values[name] = self._computes[name]()
+            self._stale.discard(name)
+            self.recomputes[name] += 1
+        return self._values[name]
+
+    # === WATCHERS ===
+
+    def watch(self, name: str, callback: Callable[[Any], None],
+              scope: Optional[Hashable] = None) -> None:
+        """Call ``callback(value)`` on the next flush and whenever the value changes."""
+        if name not in self._computes:
+            raise KeyError(name)
+        # [callback, scope, value the callback last saw]
+        self._watchers.setdefault(name, []).append([callback, scope, self._MISSING])
+        self._pending.add(name)
+
+    def unwatch_scope(self, scope: Hashable) -> None:
+        """Drop every watcher registered under ``scope``."""
+        for name in list(self._watchers):
+            kept = [watcher for watcher in self._watchers[name] if watcher[1] != scope]
+            if kept:
+                self._watchers[name] = kept
+            else:
+                del self._watchers[name]
+                self._pending.discard(name)
+
+    def suspend_scope(self, scope: Hashable) -> None:
+        """Skip ``scope``'s watchers on flush (their values are still marked stale)."""
+        self._suspended.add(scope)
+
+    def resume_scope(self, scope: Hashable) -> None:
+        """Let ``scope``'s watchers catch up on the next flush."""
+        self._suspended.discard(scope)
+        for name, watchers in self._watchers.items():
+            if any(watcher[1] == scope for watcher in watchers):
+                self._pending.add(name)
+
+    def flush(self) -> List[str]:
+        """
+        Recompute stale watched values and notify their watchers.
+
+        A watcher is called only when the value differs from the one it
+        last saw (new watchers always get the current value), and never
+        while its scope is suspended.  Returns the names whose watchers ran.
+        """
+        pending, self._pending = self._pending, set()
+        notified = []
+        for name in sorted(pending):
+            watchers = [watcher for watcher in self._watchers.get(name, ())
+                        if watcher[1] not in self._suspended]
+            if not watchers:
+                continue
+            try:
+                value = self.get(name)
+            except Exception as e:
+                print(f"⚠ Error computing {name}: {e}")
+                continue
+            ran = False
+            for watcher in watchers:
+                if watcher[2] is not self._MISSING and watcher[2] == value:
+                    continue
+                watcher[2] = value
+                ran = True
+                try:
+                    watcher[0](value)
+                except Exception as e:
+                    print(f"⚠ Error refreshing {name}: {e}")
+            if ran:
+                notified.append(name)
+        return notified
@@ -0,0 +1,275 @@
+"""
+Hades Build Helper - Run Aggregates Module
+Running statistics over run history, updated in O(1) per added run.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+
+from combo_cube import GodComboCube
+
+
+class RunAggregates:
+    """
+    Keeps the counters behind every RunAnalytics statistic.
+
+    Each added run updates the weapon, god, combo, boon and streak
+    counters once, so reading a statistic no longer rescans the history.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all counters."""
+        self.total_runs = 0
+        self.wins = 0
+        self.total_score = 0
+        self.total_heat = 0
+        self.best_run: Optional[Dict[str, Any]] = None
+        self.best_score = 0
+
+        self.weapon_counters: Dict[str, Dict[str, Any]] = {}
+        self.god_counters: Dict[str, Dict[str, int]] = {}
+        self.combo_counters: Dict[str, Dict[str, int]] = {}
+        self.boon_counters: Dict[str, Dict[str, int]] = {}
+        self.cube = GodComboCube()
+
+        self.current_streak = 0
+        self.best_win_streak = 0
+        self.worst_loss_streak = 0
+        # Streak the history opens with (positive wins, negative losses);
+        # only needed to merge aggregates of consecutive run batches
+        self.first_streak = 0
+
+    def rebuild(self, runs: List[Dict[str, Any]]) -> None:
+        """Recompute all counters from scratch."""
+        self.reset()
+        for run in runs:
+            self.add(run)
+
+    def add(self, run: Dict[str, Any]) -> None:
+        """Fold a single run into the counters."""
+        victory = run.get('victory', False)
+        score = run.get('build_score', 0)
+        heat = run.get('heat_level', 0)
+        gods = run.get('gods', [])
+
+        # Totals
+        self.total_runs += 1
+        self.total_score += score
+        self.total_heat += heat
+        if victory:
+            self.wins += 1
+        if self.best_run is None or score > self.best_score:
+            self.best_run = run
+            self.best_score = score
+
+        # Weapon
+        weapon = run.get('weapon', 'Unknown')
+        stats = self.weapon_counters.get(weapon)
+        if stats is None:
+            stats = {'runs': 0, 'wins': 0, 'total_score': 0, 'total_heat': 0,
+                     'best_score': 0, 'aspects_used': {}}
+            self.weapon_counters[weapon] = stats
+        stats['runs'] += 1
+        stats['total_score'] += score
+        stats['total_heat'] += heat
+        aspect = run.get('aspect', 'Unknown')
+        stats['aspects_used'][aspect] = stats['aspects_used'].get(aspect, 0) + 1
+        if victory:
+            stats['wins'] += 1
+        if score > stats['best_score']:
+            stats['best_score'] = score
+
+        # Gods
+        for god in gods:
+            stats = self.god_counters.setdefault(god, {'runs': 0, 'wins': 0, 'total_score': 0})
+            stats['runs'] += 1
+            stats['total_score'] += score
+            if victory:
+                stats['wins'] += 1
+
+        # God combos (sorted, top 3)
+        sorted_gods = sorted(gods)
+        if len(sorted_gods) >= 2:
+            combo = " + ".join(sorted_gods[:3])
+            stats = self.combo_counters.setdefault(combo, {'runs': 0, 'wins': 0})
+            stats['runs'] += 1
+            if victory:
+                stats['wins'] += 1
+
+        # God subsets up to size 4
+        self.cube.add(run)
+
+        # Boons
+        for boon in run.get('boons', []):
+            stats = self.boon_counters.setdefault(boon, {'runs': 0, 'wins': 0})
+            stats['runs'] += 1
+            if victory:
+                stats['wins'] += 1
+
+        # Streaks (current streak ends at the latest run)
+        if victory:
+            self.current_streak = self.current_streak + 1 if self.current_streak > 0 else 1
+            self.best_win_streak = max(self.best_win_streak, self.current_streak)
+        else:
+            self.current_streak = self.current_streak - 1 if self.current_streak < 0 else -1
+            self.worst_loss_streak = max(self.worst_loss_streak, -self.current_streak)
+        if abs(self.current_streak) == self.total_runs:
+            self.first_streak = self.current_streak
+
+    def merge(self, later: 'RunAggregates') -> 'RunAggregates':
+        """
+        Fold in the aggregates of the runs that come right after these.
+
+        Counters add up; streaks join across the boundary, so merging the
+        aggregates of consecutive batches in order equals one rebuild.
+        """
+        if later.total_runs == 0:
+            return self
+        if self.total_runs == 0:
+            self.__dict__.update(RunAggregates.from_dict(later.to_dict()).__dict__)
+            return self
+
+        self.total_runs += later.total_runs
+        self.wins += later.wins
+        self.total_score += later.total_score
+        self.total_heat += later.total_heat
+        if self.best_run is None or (later.best_run is not None and later.best_score > self.best_score):
+            self.best_run = later.best_run
+            self.best_score = later.best_score
+
+        for weapon, counters in later.weapon_counters.items():
+            stats = self.weapon_counters.get(weapon)
+            if stats is None:
+                self.weapon_counters[weapon] = {**counters, 'aspects_used': dict(counters['aspects_used'])}
+                continue
+            for field in ('runs', 'wins', 'total_score', 'total_heat'):
+                stats[field] += counters[field]
+            stats['best_score'] = max(stats['best_score'], counters['best_score'])
+            for aspect, count in counters['aspects_used'].items():
+                stats['aspects_used'][aspect] = stats['aspects_used'].get(aspect, 0) + count
+
+        for mine, theirs in ((self.god_counters, later.god_counters),
+                             (self.combo_counters, later.combo_counters),
+                             (self.boon_counters, later.boon_counters)):
+            for key, counters in theirs.items():
+                stats = mine.get(key)
+                if stats is None:
+                    mine[key] = dict(counters)
+                else:
+                    for field, value in counters.items():
+                        stats[field] += value
+        self.cube.merge(later.cube)
+
+        # Streaks across the boundary
+        joined = self.current_streak + later.first_streak
+        same_side = (self.current_streak > 0) == (later.first_streak > 0)
+        if same_side:
+            if joined > 0:
+                self.best_win_streak = max(self.best_win_streak, joined)
+            else:
+                self.worst_loss_streak = max(self.worst_loss_streak, -joined)
+            if abs(self.first_streak) == self.total_runs - later.total_runs:
+                self.first_streak = joined
+        self.best_win_streak = max(self.best_win_streak, later.best_win_streak)
+        self.worst_loss_streak = max(self.worst_loss_streak, later.worst_loss_streak)
+        if abs(later.current_streak) == later.total_runs and same_side:
+            self.current_streak = joined
+        else:
+            self.current_streak = later.current_streak
+        return self
+
+    # === SNAPSHOTS ===
+
+    SNAPSHOT_FIELDS = (
+        'total_runs', 'wins', 'total_score', 'total_heat', 'best_run', 'best_score',
+        'weapon_counters', 'god_counters', 'combo_counters', 'boon_counters',
+        'current_streak', 'best_win_streak', 'worst_loss_streak', 'first_streak'
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable copy of every counter."""
+        data = {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
+        data['cube'] = self.cube.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunAggregates':
+        """Restore counters saved with to_dict."""
+        aggregates = cls()
+        for field in cls.SNAPSHOT_FIELDS:
+            if field in data:
+                setattr(aggregates, field, data[field])
+        if 'cube' in data:
+            aggregates.cube = GodComboCube.from_dict(data['cube'])
+        return aggregates
+
+    # === DERIVED VIEWS ===
+
+    def weapon_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-weapon statistics in the RunAnalytics.get_weapon_stats shape."""
+        result = {}
+        for weapon, counters in self.weapon_counters.items():
+            runs = counters['runs']
+            result[weapon] = {
+                'runs': runs,
+                'wins': counters['wins'],
+                'defeats': runs - counters['wins'],
+                'win_rate': (counters['wins'] / runs) * 100,
+                'avg_score': counters['total_score'] / runs,
+                'total_score': counters['total_score'],
+                'avg_heat': counters['total_heat'] / runs,
+                'total_heat': counters['total_heat'],
+                'best_score': counters['best_score'],
+                'aspects_used': defaultdict(int, counters['aspects_used'])
+            }
+        return result
+
+    def god_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-god statistics in the RunAnalytics.get_god_stats shape."""
+        result = {}
+        for god, counters in self.god_counters.items():
+            runs = counters['runs']
+            result[god] = {
+                'runs': runs,
+                'wins': counters['wins'],
+                'defeats': runs - counters['wins'],
+                'win_rate': (counters['wins'] / runs) * 100,
+                'avg_score': counters['total_score'] / runs,
+                'total_score': counters['total_score']
+            }
+        return result
+
+    def combo_stats(self, min_runs: int) -> List[Tuple[str, int, int, float]]:
+        """God combo rows filtered by run count, best win rate first."""
+        combo_list = []
+        for combo, counters in self.combo_counters.items():
+            if counters['runs'] >= min_runs:
+                win_rate = counters['wins'] / counters['runs'] * 100
+                combo_list.append((combo, counters['runs'], counters['wins'], win_rate))
+        combo_list.sort(key=lambda x: (x[3], x[1]), reverse=True)
+        return combo_list
+
+    def boon_usage(self, limit: int) -> List[Tuple[str, int]]:
+        """Most used boons with their run counts."""
+        usage = [(boon, counters['runs']) for boon, counters in self.boon_counters.items()]
+        usage.sort(key=lambda x: x[1], reverse=True)
+        return usage[:limit]
+
+    def boon_win_rates(self, min_runs: int = 3) -> Dict[str, float]:
+        """Win rate per boon used in at least ``min_runs`` runs."""
+        return {
+            boon: (counters['wins'] / counters['runs']) * 100
+            for boon, counters in self.boon_counters.items()
+            if counters['runs'] >= min_runs
+        }
+
+    def streak_data(self) -> Dict[str, int]:
+        """Current and best win/loss streaks."""
+        return {
+            'current_streak': self.current_streak,
+            'best_win_streak': self.best_win_streak,
+            'worst_loss_streak': self.worst_loss_streak
+        }
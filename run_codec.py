@@ -0,0 +1,289 @@
+"""
+Hades Build Helper - Run Codec Module
+Compact binary encoding of run records.
+"""
+
+import json
+import struct
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+
+from data import GODS_DATA, WEAPONS_DATA, BOONS_DATA, DUO_BOONS_DATA, LEGENDARY_BOONS_DATA
+from room_tracker import RunTracker
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def default_name_table() -> List[str]:
+    """Every god, weapon, aspect, boon and region name from the data tables."""
+    names = list(GODS_DATA)
+    names += list(WEAPONS_DATA)
+    for weapon in WEAPONS_DATA.values():
+        names += list(weapon.get('aspects', {}))
+    names += [boon['name'] for boon in BOONS_DATA]
+    names += [boon['name'] for boon in DUO_BOONS_DATA]
+    names += [boon['name'] for boon in LEGENDARY_BOONS_DATA]
+    names += list(RunTracker.REGIONS) + ["Hades"]
+    return list(dict.fromkeys(names))
+
+
+# === VARINTS ===
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class RunCodec:
+    """
+    Encodes run dicts as compact binary records and back.
+
+    Layout of a record::
+
+        fixed block  flags uint32, run_number uint32, timestamp int64
+                     (microseconds since 1970-01-01), build_score and
+                     heat_level as int64 or float64 (flag bits say which)
+        names        weapon, aspect, boss_reached, then gods and boons as
+                     varint count + names
+        extras       varint length + compact JSON of every other key
+
+    Absent fixed fields are zero-filled and marked absent in the flags.
+    A name is a varint: 0 followed by a length-prefixed UTF-8 string for
+    names missing from the table, otherwise its table position + 1.
+    ``date`` is not stored when it equals the minute prefix of the
+    timestamp (``"%Y-%m-%d %H:%M"``).  Any known field whose value does not
+    fit its slot (a timestamp that is not canonical ISO, a float run
+    number, ...) is kept in the extras blob instead, so decoding always
+    returns a dict equal to the one that was encoded.
+    """
+
+    # Presence bits
+    RUN_NUMBER = 1 << 0
+    TIMESTAMP = 1 << 1
+    DATE = 1 << 2
+    WEAPON = 1 << 3
+    ASPECT = 1 << 4
+    GODS = 1 << 5
+    BOONS = 1 << 6
+    BUILD_SCORE = 1 << 7
+    HEAT_LEVEL = 1 << 8
+    VICTORY = 1 << 9
+    BOSS_REACHED = 1 << 10
+    EXTRAS = 1 << 11
+    # Value bits
+    VICTORY_TRUE = 1 << 16
+    BUILD_SCORE_FLOAT = 1 << 17
+    HEAT_LEVEL_FLOAT = 1 << 18
+
+    FIXED = {
+        0: struct.Struct('<IIqqq'),
+        BUILD_SCORE_FLOAT: struct.Struct('<IIqdq'),
+        HEAT_LEVEL_FLOAT: struct.Struct('<IIqqd'),
+        BUILD_SCORE_FLOAT | HEAT_LEVEL_FLOAT: struct.Struct('<IIqdd'),
+    }
+    FLOAT_BITS = BUILD_SCORE_FLOAT | HEAT_LEVEL_FLOAT
+    FIXED_SIZE = 32
+
+    def __init__(self, names: Optional[List[str]] = None):
+        self.names = names if names is not None else default_name_table()
+        self.codes = {name: code for code, name in enumerate(self.names)}
+        # Index 0 is the inline-string escape; codes below 0x80 fit one byte
+        self._short_names = [None] + self.names[:0x7F]
+
+    # === NAME TABLE ===
+
+    def table_bytes(self) -> bytes:
+        """Serialized name table, stored once per file next to the records."""
+        return zlib.compress("\n".join(self.names).encode('utf-8'))
+
+    @classmethod
+    def from_table_bytes(cls, blob: bytes) -> 'RunCodec':
+        text = zlib.decompress(blob).decode('utf-8')
+        return cls(text.split("\n") if text else [])
+
+    # === FIELD HELPERS ===
+
+    def _write_name(self, out: bytearray, name: str) -> None:
+        code = self.codes.get(name)
+        if code is not None:
+            _write_varint(out, code + 1)
+            return
+        raw = name.encode('utf-8')
+        _write_varint(out, 0)
+        _write_varint(out, len(raw))
+        out += raw
+
+    def _write_name_list(self, out: bytearray, values: List[str]) -> None:
+        """
+        Varint ``count * 2`` followed by one byte per name when every name
+        has a one-byte code, else varint ``count * 2 + 1`` and full names.
+        """
+        codes = [self.codes.get(name) for name in values]
+        if all(code is not None and code < 0x7F for code in codes):
+            _write_varint(out, len(values) * 2)
+            out += bytes(code + 1 for code in codes)
+            return
+        _write_varint(out, len(values) * 2 + 1)
+        for name in values:
+            self._write_name(out, name)
+
+    def _read_name_list(self, buf: bytes, pos: int) -> Tuple[List[str], int]:
+        header, pos = _read_varint(buf, pos)
+        count = header >> 1
+        if not header & 1:
+            end = pos + count
+            return list(map(self._short_names.__getitem__, buf[pos:end])), end
+        values = []
+        for _ in range(count):
+            name, pos = self._read_name(buf, pos)
+            values.append(name)
+        return values, pos
+
+    def _read_name(self, buf: bytes, pos: int) -> Tuple[str, int]:
+        byte = buf[pos]
+        if 0 < byte < 0x80:
+            return self._short_names[byte], pos + 1
+        code, pos = _read_varint(buf, pos)
+        if code:
+            return self.names[code - 1], pos
+        length, pos = _read_varint(buf, pos)
+        return buf[pos:pos + length].decode('utf-8'), pos + length
+
+    @staticmethod
+    def _is_int(value: Any) -> bool:
+        return type(value) is int and -(1 << 63) <= value < (1 << 63)
+
+    @staticmethod
+    def _is_name_list(value: Any) -> bool:
+        return type(value) is list and all(type(item) is str for item in value)
+
+    @staticmethod
+    def _timestamp_micros(value: Any) -> Optional[int]:
+        """Microseconds for a canonical naive ISO timestamp, else None."""
+        if type(value) is not str:
+            return None
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        if moment.tzinfo is not None or moment.isoformat() != value:
+            return None
+        return (moment - EPOCH) // timedelta(microseconds=1)
+
+    @staticmethod
+    def _minute(timestamp: str) -> str:
+        """``date`` as RunAnalytics.add_run writes it, from an ISO timestamp."""
+        return timestamp[:10] + " " + timestamp[11:16]
+
+    # === ENCODE / DECODE ===
+
+    def encode(self, run: Dict[str, Any]) -> bytes:
+        extras = dict(run)
+        flags = 0
+        run_number = micros = 0
+        numbers = [0, 0]
+        names = bytearray()
+
+        value = extras.get('run_number')
+        if self._is_int(value) and 0 <= value < (1 << 32):
+            flags |= self.RUN_NUMBER
+            run_number = extras.pop('run_number')
+
+        micros_value = self._timestamp_micros(extras.get('timestamp'))
+        if micros_value is not None:
+            flags |= self.TIMESTAMP
+            micros = micros_value
+            if extras.get('date') == self._minute(extras.pop('timestamp')):
+                flags |= self.DATE
+                del extras['date']
+
+        for slot, (key, bit, float_bit) in enumerate((
+                ('build_score', self.BUILD_SCORE, self.BUILD_SCORE_FLOAT),
+                ('heat_level', self.HEAT_LEVEL, self.HEAT_LEVEL_FLOAT))):
+            value = extras.get(key)
+            if self._is_int(value):
+                flags |= bit
+                numbers[slot] = extras.pop(key)
+            elif type(value) is float:
+                flags |= bit | float_bit
+                numbers[slot] = extras.pop(key)
+
+        if type(extras.get('victory')) is bool:
+            flags |= self.VICTORY
+            if extras.pop('victory'):
+                flags |= self.VICTORY_TRUE
+
+        for key, bit in (('weapon', self.WEAPON), ('aspect', self.ASPECT),
+                         ('boss_reached', self.BOSS_REACHED)):
+            if type(extras.get(key)) is str:
+                flags |= bit
+                self._write_name(names, extras.pop(key))
+
+        for key, bit in (('gods', self.GODS), ('boons', self.BOONS)):
+            if self._is_name_list(extras.get(key)):
+                flags |= bit
+                self._write_name_list(names, extras.pop(key))
+
+        if extras:
+            flags |= self.EXTRAS
+            raw = json.dumps(extras, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            _write_varint(names, len(raw))
+            names += raw
+
+        fixed = self.FIXED[flags & self.FLOAT_BITS]
+        return fixed.pack(flags, run_number, micros, numbers[0], numbers[1]) + bytes(names)
+
+    def decode(self, buf: bytes) -> Dict[str, Any]:
+        flags = buf[0] | buf[1] << 8 | buf[2] << 16
+        _, run_number, micros, build_score, heat_level = self.FIXED[flags & self.FLOAT_BITS].unpack_from(buf, 0)
+        pos = self.FIXED_SIZE
+        read_name = self._read_name
+        run: Dict[str, Any] = {}
+
+        if flags & self.RUN_NUMBER:
+            run['run_number'] = run_number
+        if flags & self.TIMESTAMP:
+            timestamp = (EPOCH + timedelta(microseconds=micros)).isoformat()
+            run['timestamp'] = timestamp
+            if flags & self.DATE:
+                run['date'] = self._minute(timestamp)
+        if flags & self.BUILD_SCORE:
+            run['build_score'] = build_score
+        if flags & self.HEAT_LEVEL:
+            run['heat_level'] = heat_level
+        if flags & self.VICTORY:
+            run['victory'] = bool(flags & self.VICTORY_TRUE)
+
+        if flags & self.WEAPON:
+            run['weapon'], pos = read_name(buf, pos)
+        if flags & self.ASPECT:
+            run['aspect'], pos = read_name(buf, pos)
+        if flags & self.BOSS_REACHED:
+            run['boss_reached'], pos = read_name(buf, pos)
+
+        if flags & self.GODS:
+            run['gods'], pos = self._read_name_list(buf, pos)
+        if flags & self.BOONS:
+            run['boons'], pos = self._read_name_list(buf, pos)
+
+        if flags & self.EXTRAS:
+            length, pos = _read_varint(buf, pos)
+            run.update(json.loads(buf[pos:pos + length].decode('utf-8')))
+
+        return run
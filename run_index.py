@@ -0,0 +1,108 @@
+"""
+Hades Build Helper - Run Index Module
+Inverted indexes (posting lists) from run attributes to run ids.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Iterable
+
+
+def _contains(posting: List[int], run_id: int) -> bool:
+    position = bisect_left(posting, run_id)
+    return position < len(posting) and posting[position] == run_id
+
+
+def intersect_postings(postings: List[List[int]]) -> List[int]:
+    """
+    Intersect ascending posting lists, starting from the shortest one.
+
+    Each remaining candidate is binary-searched in the longer lists, so the
+    cost follows the size of the smallest list rather than the history.
+    """
+    if not postings:
+        return []
+    ordered = sorted(postings, key=len)
+    result = list(ordered[0])
+    for other in ordered[1:]:
+        if not result:
+            break
+        result = [run_id for run_id in result if _contains(other, run_id)]
+    return result
+
+
+class RunIndex:
+    """
+    Posting lists keyed by god, boon, weapon, aspect, boss_reached and victory.
+
+    A run id is the run's position in ``RunAnalytics.runs``; ids are added in
+    increasing order so every posting list stays sorted without extra work.
+    """
+
+    FIELDS = ('god', 'boon', 'weapon', 'aspect', 'boss_reached', 'victory')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all postings."""
+        self.size = 0
+        self.postings: Dict[str, Dict[Any, List[int]]] = {field: {} for field in self.FIELDS}
+
+    def rebuild(self, runs: List[Dict[str, Any]]) -> None:
+        """Recreate the index from a run list."""
+        self.reset()
+        for run in runs:
+            self.add(run)
+
+    def _post(self, field: str, key: Any, run_id: int) -> None:
+        self.postings[field].setdefault(key, []).append(run_id)
+
+    def add(self, run: Dict[str, Any]) -> int:
+        """
+        Index one run.
+
+        Returns:
+            The id assigned to the run
+        """
+        run_id = self.size
+        for god in set(run.get('gods', [])):
+            self._post('god', god, run_id)
+        for boon in set(run.get('boons', [])):
+            self._post('boon', boon, run_id)
+        self._post('weapon', run.get('weapon'), run_id)
+        self._post('aspect', run.get('aspect'), run_id)
+        self._post('boss_reached', run.get('boss_reached'), run_id)
+        self._post('victory', bool(run.get('victory', False)), run_id)
+        self.size += 1
+        return run_id
+
+    def posting(self, field: str, key: Any) -> List[int]:
+        """Run ids for a single field value (empty if never seen)."""
+        return self.postings[field].get(key, [])
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        """Number of runs per value of a field."""
+        return {key: len(ids) for key, ids in self.postings[field].items()}
+
+    def lookup(self, gods: Iterable[str] = (), boons: Iterable[str] = (),
+               weapon: Optional[str] = None, aspect: Optional[str] = None,
+               boss_reached: Optional[str] = None, victory: Optional[bool] = None) -> List[int]:
+        """
+        Run ids matching every given criterion, by posting list intersection.
+
+        With no criteria at all every run id is returned.
+        """
+        postings = [self.posting('god', g) for g in gods]
+        postings += [self.posting('boon', b) for b in boons]
+        if weapon is not None:
+            postings.append(self.posting('weapon', weapon))
+        if aspect is not None:
+            postings.append(self.posting('aspect', aspect))
+        if boss_reached is not None:
+            postings.append(self.posting('boss_reached', boss_reached))
+        if victory is not None:
+            postings.append(self.posting('victory', victory))
+
+        if not postings:
+            return list(range(self.size))
+        return intersect_postings(postings)
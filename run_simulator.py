@@ -0,0 +1,444 @@
+"""
+Hades Build Helper - Run Simulator Module
+Headless Monte Carlo runs for measuring door and boon policies.
+"""
+
+import random
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
+
+from data import GODS_DATA, BOONS_DATA, BOON_NAME_TO_DATA
+from aspect_data import WEAPON_ASPECTS
+from boon_catalog import CATALOG
+from build_state import BuildState
+from build_view import BuildViewMixin
+from build_analyzer import BuildAnalyzer
+from synergy_analyzer import SynergyAnalyzer
+from dps_engine import LIVE_ENGINE, LIVE_WEAPONS, ADD_BOON, POM, HAMMER
+from reactive import ReactiveStore
+from room_tracker import RunTracker
+
+
+# === OFFERING MODEL ===
+# Same rules as the interactive room offerings of 1/1.py
+# (HadesBuildHelperApp._generate_room_offerings), plus a hammer item.
+
+ROOM_ITEMS = ["Pom of Power", "Gold (50)", "Centaur Heart", "Nectar", "Daedalus Hammer"]
+INITIAL_GOD_CHOICES = 3
+NUM_ROOM_OFFERINGS = 3
+SELECTABLE_GODS = sorted(god for god in GODS_DATA if god != "Chaos")
+
+# Boons a god can offer directly (no status curses or legendaries)
+OFFERABLE_BOONS: Dict[str, List[Dict[str, Any]]] = {
+    god: [b for b in BOONS_DATA if b['god'] == god and b['type'] not in ("Status Curse", "Legendary")]
+    for god in GODS_DATA
+}
+
+# Room number -> region, from the region lengths of RunTracker
+ROOM_REGIONS: List[str] = [
+    region for region, info in RunTracker.REGIONS.items() for _ in range(info['rooms'])
+]
+RUN_LENGTH = len(ROOM_REGIONS)
+
+# Door types understood by UniversalDoorAdvisor.score_door
+ITEM_DOOR_TYPES = {
+    "Pom of Power": "Pom of Power",
+    "Gold (50)": "Gold (Coin Bag)",
+    "Centaur Heart": "Centaur Heart",
+    "Nectar": "Nectar",
+    "Daedalus Hammer": "Daedalus Hammer",
+}
+
+# Worst damage taken per room; a build at DAMAGE_DPS_SCALE DPS takes up to
+# this much, a build with no DPS up to twice as much
+ROOM_DAMAGE = {'Tartarus': 18, 'Asphodel': 24, 'Elysium': 30, 'Temple of Styx': 36, 'Final Boss': 90}
+DAMAGE_DPS_SCALE = 80.0
+STRENGTH_BUCKETS = 11  # 0-9, 10-19, ..., 100
+
+# An offering is (kind, name) with kind "boon", "new_god" or "item"
+Offering = Tuple[str, str]
+
+
+def generate_offerings(rng: random.Random, active_gods: Set[str], acquired: Set[str]) -> List[Offering]:
+    """
+    Offerings for one room.
+
+    Every active god puts one boon of each core type it has not given yet,
+    plus random boons up to three, in the pool; inactive gods and the room
+    items are added, and NUM_ROOM_OFFERINGS are drawn.  The pool is sorted
+    (not set-ordered) so a seeded ``rng`` replays the same run.
+    """
+    options: Set[Offering] = set()
+    for god in sorted(active_gods):
+        available = [b for b in OFFERABLE_BOONS.get(god, ()) if b['name'] not in acquired]
+        core_types = GODS_DATA[god]['core_boon_types']
+        acquired_types = {b['type'] for b in OFFERABLE_BOONS[god] if b['name'] in acquired}
+
+        pool: List[Dict[str, Any]] = []
+        for core_type in core_types:
+            if core_type in acquired_types:
+                continue
+            candidates = [b for b in available if b['type'] == core_type and b not in pool]
+            if candidates:
+                pool.append(rng.choice(candidates))
+
+        remaining = [b for b in available if b not in pool]
+        pool.extend(rng.sample(remaining, max(0, min(len(remaining), 3 - len(pool)))))
+        options.update(("boon", b['name']) for b in pool)
+
+    options.update(("new_god", god) for god in SELECTABLE_GODS if god not in active_gods)
+    options.update(("item", item) for item in ROOM_ITEMS)
+
+    pool_list = sorted(options)
+    return rng.sample(pool_list, min(NUM_ROOM_OFFERINGS, len(pool_list)))
+
+
+def offering_to_door(offering: Offering) -> Dict[str, Any]:
+    """Door dict in the shape UniversalDoorAdvisor.score_all_doors expects."""
+    kind, name = offering
+    if kind == "boon":
+        return {'type': "God Boon", 'god': BOON_NAME_TO_DATA[name]['god'], 'boon': name}
+    if kind == "new_god":
+        return {'type': "God Boon", 'god': name}
+    return {'type': ITEM_DOOR_TYPES.get(name, name)}
+
+
+# === TRANSITIONS ===
+# Shared by SimulatedRun and door_planner.PlanState.  ``run`` has ``build``
+# (a BuildState), ``active_gods``, ``current_health``, ``max_health``,
+# ``gold``, ``alive`` and ``what_if_dps``.
+
+def apply_offering(run: Any, offering: Offering) -> None:
+    """Take one offering."""
+    kind, name = offering
+    if kind == "boon":
+        god = BOON_NAME_TO_DATA[name]['god']
+        run.build.add_boon(name, god)
+        run.active_gods.add(god)
+    elif kind == "new_god":
+        run.active_gods.add(name)
+    elif name == "Pom of Power":
+        pom_best_boon(run)
+    elif name == "Gold (50)":
+        run.gold += 50
+    elif name == "Centaur Heart":
+        run.max_health += 25
+        run.current_health += 25
+    elif name == "Fountain":
+        run.current_health = min(run.max_health, run.current_health + run.max_health * 4 // 10)
+    elif name == "Daedalus Hammer":
+        run.build.add_hammer(f"Hammer {len(run.build.hammers) + 1}")
+
+
+def pom_best_boon(run: Any) -> None:
+    """Pom the boon that gains the most DPS (the first boon if none gains)."""
+    boons = sorted(run.build.boons)
+    if not boons:
+        return
+    gains = run.what_if_dps([(POM, boon) for boon in boons])
+    best = max(range(len(boons)), key=lambda i: gains[i])
+    run.build.set_pom(boons[best], run.build.pom_levels.get(boons[best], 1) + 1)
+
+
+def room_damage(dps: float, roll: float) -> int:
+    """Damage for a room roll in [0, ROOM_DAMAGE cap]; half the cap is the expected roll."""
+    return int(roll * 2 * DAMAGE_DPS_SCALE / (DAMAGE_DPS_SCALE + dps))
+
+
+def take_hit(run: Any, damage: int) -> None:
+    """Lose HP; a death spends a Death Defiance or ends the run."""
+    run.current_health -= damage
+    if run.current_health <= 0:
+        if run.build.death_defiances > 0:
+            run.build.set_death_defiances(run.build.death_defiances - 1)
+            run.current_health = run.max_health // 2
+        else:
+            run.current_health = 0
+            run.alive = False
+
+
+# === SIMULATED RUN ===
+
+class _NoHistory:
+    """Stands in for RunAnalytics: simulated runs have no past runs to lean on."""
+
+    def get_pairing_win_rate(self, god: str, gods: List[str]) -> Optional[Tuple[float, int]]:
+        return None
+
+    def get_win_rate(self) -> float:
+        return 0.0
+
+
+NO_HISTORY = _NoHistory()
+_SYNERGY = SynergyAnalyzer()
+
+
+class SimulatedRun(BuildViewMixin):
+    """
+    One headless run.
+
+    Exposes the attributes and methods the main.py advisors read from the
+    app (``acquired_boons``, ``room_number``, ``current_health``, ``store``,
+    ``what_if_dps``, ``analyze_boon_synergies`` ...), so an advisor can be
+    constructed with a SimulatedRun in place of the app and used unchanged
+    as a policy.
+    """
+
+    def __init__(self, rng: random.Random, weapon: Optional[str] = None, aspect: Optional[str] = None):
+        self.rng = rng
+        self.build = BuildState()
+        self.store = ReactiveStore()
+        self.build.listener = self.store.touch
+        self.store.derive('dps', ['weapon', 'aspect', 'boons', 'poms', 'hammers'],
+                          lambda: {'total': int(self.calculate_detailed_dps_value())})
+        self.store.derive('features',
+                          ['weapon', 'aspect', 'boons', 'gods', 'poms', 'hammers', 'room', 'health',
+                           'region', 'dd'],
+                          self._extract_build_features)
+        self.store.derive('build_strength', ['features'],
+                          lambda: self.build_analyzer.calculate_build_strength(self.build_features()))
+        self.build_analyzer = BuildAnalyzer()
+        self.synergy_analyzer = _SYNERGY
+        self.analytics = NO_HISTORY
+
+        self.current_region = ROOM_REGIONS[0]
+        self.current_health = 100
+        self.max_health = 100
+        self.gold = 0
+        self.heat_level = 0
+        self.active_gods: Set[str] = set(rng.sample(SELECTABLE_GODS, INITIAL_GOD_CHOICES))
+        self.alive = True
+
+        weapon = weapon or rng.choice(sorted(LIVE_WEAPONS))
+        if aspect is None and weapon in WEAPON_ASPECTS:
+            aspect = rng.choice(list(WEAPON_ASPECTS[weapon]))
+        self.build.set_weapon(weapon)
+        self.build.set_aspect(aspect)
+
+    def build_features(self) -> Dict[str, Any]:
+        return self.store.get('features')
+
+    # === RUN STEPS ===
+
+    def offerings(self) -> List[Offering]:
+        return generate_offerings(self.rng, self.active_gods, self.build.boons)
+
+    def apply(self, offering: Offering) -> None:
+        """Take one offering."""
+        health = (self.current_health, self.max_health)
+        apply_offering(self, offering)
+        if (self.current_health, self.max_health) != health:
+            self.store.touch('health')
+
+    def take_damage(self) -> None:
+        """Room damage, lower for higher DPS; a death spends a Death Defiance or ends the run."""
+        dps = self.store.get('dps')['total']
+        cap = ROOM_DAMAGE.get(self.current_region, 20)
+        take_hit(self, room_damage(dps, self.rng.randint(0, cap)))
+        self.store.touch('health')
+
+    def enter_room(self, room: int) -> None:
+        region = ROOM_REGIONS[room - 1]
+        if region != self.current_region:
+            self.current_region = region
+            self.store.touch('region')
+        self.build.set_room(room)
+
+
+# === POLICIES ===
+# A policy picks the index of one offering: policy(run, offerings) -> int
+
+Policy = Callable[[SimulatedRun, List[Offering]], int]
+
+
+def random_policy(run: SimulatedRun, offerings: List[Offering]) -> int:
+    return run.rng.randrange(len(offerings))
+
+
+def dps_greedy_policy(run: SimulatedRun, offerings: List[Offering]) -> int:
+    """Take whatever raises DPS most (boon, pom or hammer); ties go to the first offer."""
+    boons = sorted(run.acquired_boons)
+    deltas = []
+    for kind, name in offerings:
+        if kind == "boon":
+            deltas.append((ADD_BOON, name))
+        elif name == "Daedalus Hammer":
+            deltas.append((HAMMER,))
+        else:
+            deltas.append(None)
+    scores = [0.0] * len(offerings)
+    real = [(i, delta) for i, delta in enumerate(deltas) if delta is not None]
+    if real:
+        for (i, _), dps in zip(real, run.what_if_dps([delta for _, delta in real])):
+            scores[i] = dps
+    for i, (kind, name) in enumerate(offerings):
+        if name == "Pom of Power" and boons:
+            scores[i] = max(run.what_if_dps([(POM, boon) for boon in boons]))
+    return max(range(len(offerings)), key=lambda i: scores[i])
+
+
+class DoorAdvisorPolicy:
+    """
+    Policy from a door advisor such as main.UniversalDoorAdvisor.
+
+    ``advisor_class(run)`` must return an object with
+    ``score_all_doors(doors)``; the highest scored door is taken.  A
+    module-level class rather than a closure, so it pickles for spawned
+    worker processes.
+    """
+
+    def __init__(self, advisor_class: Callable[[Any], Any]):
+        self.advisor_class = advisor_class
+
+    def __call__(self, run: SimulatedRun, offerings: List[Offering]) -> int:
+        doors = [dict(offering_to_door(offering), index=i) for i, offering in enumerate(offerings)]
+        return self.advisor_class(run).score_all_doors(doors)[0]['index']
+
+
+class BoonAdvisorPolicy:
+    """
+    Policy from a boon advisor such as main.IntelligentBoonAdvisor.
+
+    When boons are offered, ``advisor_class(run).get_smart_choice(boons)``
+    picks one of them; rooms without boons are left to ``fallback``.
+    """
+
+    def __init__(self, advisor_class: Callable[[Any], Any], fallback: Policy = random_policy):
+        self.advisor_class = advisor_class
+        self.fallback = fallback
+
+    def __call__(self, run: SimulatedRun, offerings: List[Offering]) -> int:
+        boons = [name for kind, name in offerings if kind == "boon"]
+        if not boons:
+            return self.fallback(run, offerings)
+        choice = self.advisor_class(run).get_smart_choice(boons)['recommended']
+        return offerings.index(("boon", choice))
+
+
+def door_advisor_policy(advisor_class: Callable[[Any], Any]) -> Policy:
+    """DoorAdvisorPolicy for ``advisor_class``."""
+    return DoorAdvisorPolicy(advisor_class)
+
+
+def boon_advisor_policy(advisor_class: Callable[[Any], Any], fallback: Policy = random_policy) -> Policy:
+    """BoonAdvisorPolicy for ``advisor_class``."""
+    return BoonAdvisorPolicy(advisor_class, fallback)
+
+
+# === RESULTS ===
+
+class SimulationTally:
+    """
+    Counts, sums and histograms over simulated runs.
+
+    Tallies of separate batches combine with ``merge`` into the same
+    totals as one big batch, so runs can be split up freely.
+    """
+
+    def __init__(self):
+        self.runs = 0
+        self.wins = 0
+        self.duo_runs = 0
+        self.legendary_runs = 0
+        self.total_duos = 0
+        self.total_legendaries = 0
+        self.total_strength = 0
+        self.total_dps = 0
+        self.total_boons = 0
+        self.total_rooms = 0
+        self.duo_hits: Dict[str, int] = {}
+        self.legendary_hits: Dict[str, int] = {}
+        self.strength_histogram = [0] * STRENGTH_BUCKETS
+
+    def add(self, run: SimulatedRun, rooms_cleared: int) -> None:
+        """Fold one finished run into the tally."""
+        boon_mask = CATALOG.boon_mask(run.acquired_boons)
+        god_mask = CATALOG.god_mask(run.selected_gods)
+        duos = [d.name for d in CATALOG.duos if CATALOG.requirements_met(d, boon_mask, god_mask)]
+        legendaries = [l.name for l in CATALOG.legendaries if CATALOG.requirements_met(l, boon_mask, god_mask)]
+        strength = run.store.get('build_strength')['total']
+
+        self.runs += 1
+        self.wins += 1 if run.alive else 0
+        self.duo_runs += 1 if duos else 0
+        self.legendary_runs += 1 if legendaries else 0
+        self.total_duos += len(duos)
+        self.total_legendaries += len(legendaries)
+        self.total_strength += strength
+        self.total_dps += run.store.get('dps')['total']
+        self.total_boons += len(run.acquired_boons)
+        self.total_rooms += rooms_cleared
+        for name in duos:
+            self.duo_hits[name] = self.duo_hits.get(name, 0) + 1
+        for name in legendaries:
+            self.legendary_hits[name] = self.legendary_hits.get(name, 0) + 1
+        self.strength_histogram[min(int(strength) // 10, STRENGTH_BUCKETS - 1)] += 1
+
+    def merge(self, other: 'SimulationTally') -> 'SimulationTally':
+        """Add another tally's runs into this one."""
+        for field in ('runs', 'wins', 'duo_runs', 'legendary_runs', 'total_duos', 'total_legendaries',
+                      'total_strength', 'total_dps', 'total_boons', 'total_rooms'):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        for name, count in other.duo_hits.items():
+            self.duo_hits[name] = self.duo_hits.get(name, 0) + count
+        for name, count in other.legendary_hits.items():
+            self.legendary_hits[name] = self.legendary_hits.get(name, 0) + count
+        self.strength_histogram = [a + b for a, b in zip(self.strength_histogram, other.strength_histogram)]
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        """Rates and averages (percentages for rates)."""
+        runs = self.runs or 1
+        return {
+            'runs': self.runs,
+            'win_rate': self.wins / runs * 100,
+            'duo_hit_rate': self.duo_runs / runs * 100,
+            'legendary_hit_rate': self.legendary_runs / runs * 100,
+            'avg_duos': self.total_duos / runs,
+            'avg_legendaries': self.total_legendaries / runs,
+            'avg_build_strength': self.total_strength / runs,
+            'avg_dps': self.total_dps / runs,
+            'avg_boons': self.total_boons / runs,
+            'avg_rooms': self.total_rooms / runs,
+            'duo_hits': dict(sorted(self.duo_hits.items(), key=lambda x: x[1], reverse=True)),
+            'legendary_hits': dict(sorted(self.legendary_hits.items(), key=lambda x: x[1], reverse=True)),
+            'strength_histogram': list(self.strength_histogram),
+        }
+
+
+# === SIMULATION ===
+
+def play_run(policy: Policy, rng: random.Random, weapon: Optional[str] = None,
+             aspect: Optional[str] = None) -> Tuple[SimulatedRun, int]:
+    """Play one run to the end (or to death); returns the run and rooms cleared."""
+    run = SimulatedRun(rng, weapon, aspect)
+    rooms_cleared = 0
+    for room in range(1, RUN_LENGTH + 1):
+        run.enter_room(room)
+        offerings = run.offerings()
+        if offerings:
+            run.apply(offerings[policy(run, offerings)])
+        run.take_damage()
+        if not run.alive:
+            break
+        rooms_cleared = room
+    return run, rooms_cleared
+
+
+def simulate(policy: Policy, runs: int, seed: Optional[int] = None,
+             weapon: Optional[str] = None, aspect: Optional[str] = None) -> SimulationTally:
+    """Play ``runs`` runs under one policy (same ``seed`` -> same tally)."""
+    rng = random.Random(seed)
+    tally = SimulationTally()
+    for _ in range(runs):
+        run, rooms_cleared = play_run(policy, rng, weapon, aspect)
+        tally.add(run, rooms_cleared)
+    return tally
+
+
+def compare_policies(policies: Dict[str, Policy], runs: int, seed: Optional[int] = None,
+                     weapon: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Report per policy, every policy played from the same seed."""
+    return {
+        name: simulate(policy, runs, seed, weapon).report()
+        for name, policy in policies.items()
+    }
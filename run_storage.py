@@ -0,0 +1,488 @@
+"""
+Hades Build Helper - Run Storage Module
+Segmented append-only stores for run history (JSON-Lines and binary).
+"""
+
+import codecs
+import gc
+import json
+import os
+import struct
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
+
+from run_codec import RunCodec
+
+
+class RunLogStore:
+    """
+    Stores runs as JSON-Lines records spread over numbered segment files.
+
+    Adding a run appends a single line to the active segment, so the cost
+    of a save does not depend on how many runs are already recorded.
+    Sealed segments are periodically merged into one by compaction.
+
+    Segments written by compaction or a full rewrite start with a header
+    line ``{"_segment": {"supersedes": N}}``; every segment numbered below
+    N is stale and is ignored (and removed) on load.  This keeps both
+    operations crash-safe: the replacement is made visible with a single
+    ``os.replace`` and leftovers are recognised afterwards.
+    """
+
+    SEGMENT_PREFIX = "segment_"
+    SEGMENT_SUFFIX = ".jsonl"
+    MAX_SEGMENT_RECORDS = 1000
+    COMPACT_AFTER_SEGMENTS = 16
+
+    def __init__(self, directory: str, legacy_file: Optional[str] = None):
+        self.directory = directory
+        self.legacy_file = legacy_file
+        self._active_index = 0
+        self._active_records = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    # === SEGMENT FILES ===
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.directory, f"{self.SEGMENT_PREFIX}{index:06d}{self.SEGMENT_SUFFIX}")
+
+    def _segment_indexes(self) -> List[int]:
+        """List segment numbers present on disk, in ascending order."""
+        indexes = []
+        for name in os.listdir(self.directory):
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.SEGMENT_SUFFIX):
+                number = name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]
+                if number.isdigit():
+                    indexes.append(int(number))
+        return sorted(indexes)
+
+    def _read_segment(self, index: int, repair: bool = False) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """
+        Read one segment.
+
+        Returns:
+            Tuple of (supersedes bound from the header or None, records)
+        """
+        path = self._segment_path(index)
+        supersedes = None
+        records = []
+        good_offset = 0
+
+        with open(path, 'rb') as f:
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    break  # Torn write from a crash mid-append
+                try:
+                    record = json.loads(raw_line.decode('utf-8'))
+                except ValueError:
+                    break
+                good_offset += len(raw_line)
+                if isinstance(record, dict) and '_segment' in record:
+                    supersedes = record['_segment'].get('supersedes')
+                    continue
+                records.append(record)
+
+        if repair and good_offset < os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(good_offset)
+            print(f"⚠ Discarded torn record at end of {os.path.basename(path)}")
+
+        return supersedes, records
+
+    def _read_header(self, index: int) -> Optional[int]:
+        """Supersedes bound from a segment's first line, without reading the rest."""
+        with open(self._segment_path(index), 'rb') as f:
+            first_line = f.readline()
+        if not first_line.endswith(b'\n'):
+            return None
+        try:
+            record = json.loads(first_line.decode('utf-8'))
+        except ValueError:
+            return None
+        if isinstance(record, dict) and '_segment' in record:
+            return record['_segment'].get('supersedes')
+        return None
+
+    def _write_segment(self, index: int, runs: List[Dict[str, Any]], supersedes: int) -> None:
+        """Atomically write a complete segment with a supersedes header."""
+        path = self._segment_path(index)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'_segment': {'supersedes': supersedes}}) + '\n')
+            for run in runs:
+                f.write(json.dumps(run, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _append_records(self, path: str, runs: List[Dict[str, Any]]) -> None:
+        """Durably append records to a segment file with a single fsync."""
+        lines = ''.join(json.dumps(run, ensure_ascii=False) + '\n' for run in runs)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _remove_segments_below(self, bound: int) -> None:
+        for index in self._segment_indexes():
+            if index < bound:
+                os.remove(self._segment_path(index))
+
+    # === PUBLIC API ===
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load every stored run, recovering from interrupted writes."""
+        runs = []
+        for chunk in self.iter_runs():
+            runs.extend(chunk)
+        return runs
+
+    def iter_runs(self, chunk_size: int = MAX_SEGMENT_RECORDS) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream stored runs in order, ``chunk_size`` records at a time.
+
+        Only segment headers are read up front to find the supersedes
+        floor; record lines are then parsed one segment at a time, so the
+        first chunk is available without reading the whole history.
+        """
+        indexes = self._segment_indexes()
+        floor = 0
+        for index in indexes:
+            supersedes = self._read_header(index)
+            if supersedes is not None:
+                floor = max(floor, supersedes)
+
+        if floor:
+            self._remove_segments_below(floor)
+        live = [index for index in indexes if index >= floor]
+
+        self._active_index = live[-1] if live else 0
+        self._active_records = 0
+
+        for position, index in enumerate(live):
+            is_last = position == len(live) - 1
+            _, records = self._read_segment(index, repair=is_last)
+            if is_last:
+                self._active_records = len(records)
+            for start in range(0, len(records), chunk_size):
+                yield records[start:start + chunk_size]
+
+    def append(self, run: Dict[str, Any]) -> None:
+        """Append a single run; O(1) I/O regardless of history size."""
+        self.append_many([run])
+
+    def append_many(self, runs: List[Dict[str, Any]]) -> None:
+        """Append a batch of runs, filling and rolling over segments as needed."""
+        position = 0
+        while position < len(runs):
+            if self._active_index == 0 or self._active_records >= self.MAX_SEGMENT_RECORDS:
+                self._active_index += 1
+                self._active_records = 0
+
+            batch = runs[position:position + self.MAX_SEGMENT_RECORDS - self._active_records]
+            self._append_records(self._segment_path(self._active_index), batch)
+            self._active_records += len(batch)
+            position += len(batch)
+
+        if len(self._segment_indexes()) > self.COMPACT_AFTER_SEGMENTS:
+            self.compact()
+
+    def rewrite(self, runs: List[Dict[str, Any]]) -> None:
+        """Replace the whole history (used after imports and clears)."""
+        indexes = self._segment_indexes()
+        new_index = (indexes[-1] if indexes else 0) + 1
+        self._write_segment(new_index, runs, supersedes=new_index)
+        self._remove_segments_below(new_index)
+        self._active_index = new_index
+        self._active_records = len(runs)
+
+    def compact(self) -> None:
+        """Merge all sealed segments into a single segment."""
+        indexes = self._segment_indexes()
+        sealed = [i for i in indexes if i != self._active_index]
+        if len(sealed) < 2:
+            return
+
+        merged = []
+        for index in sealed:
+            _, records = self._read_segment(index)
+            merged.extend(records)
+
+        target = sealed[-1]
+        self._write_segment(target, merged, supersedes=target)
+        self._remove_segments_below(target)
+        print(f"✓ Compacted {len(sealed)} run segments")
+
+    def migrate_legacy(self) -> bool:
+        """
+        One-time import of the old single-file JSON history.
+
+        Only runs when the store is still empty; the legacy file is left
+        untouched so it remains available as a backup.
+
+        Returns:
+            True if runs were migrated
+        """
+        if not self.legacy_file or not os.path.exists(self.legacy_file):
+            return False
+        if self._segment_indexes():
+            return False
+
+        with open(self.legacy_file, 'r', encoding='utf-8') as f:
+            runs = json.load(f)
+
+        self.rewrite(runs)
+        print(f"✓ Migrated {len(runs)} runs from {self.legacy_file}")
+        return True
+
+
+class BinaryRunLogStore(RunLogStore):
+    """
+    RunLogStore variant whose segments hold RunCodec binary records.
+
+    Segment layout::
+
+        magic       b"HRUN"
+        supersedes  int32 (-1 when the segment supersedes nothing)
+        table       uint32 length + RunCodec name table
+        records     uint32 length + encoded run, repeated
+
+    Each segment carries the name table it was written with, so records
+    stay decodable when the data tables change; appends never add records
+    to a segment written with another table, and rewrites and compaction
+    re-encode against the current table.
+    """
+
+    SEGMENT_SUFFIX = ".bin"
+    MAGIC = b"HRUN"
+    SEGMENT_HEADER = struct.Struct('<4siI')
+    RECORD_LENGTH = struct.Struct('<I')
+
+    def __init__(self, directory: str, legacy_file: Optional[str] = None,
+                 log_dir: Optional[str] = None):
+        """
+        Args:
+            directory: Directory holding the binary segments
+            legacy_file: Old single-file JSON history to migrate from
+            log_dir: JSON-Lines run log directory to migrate from
+        """
+        super().__init__(directory, legacy_file)
+        self.log_dir = log_dir
+        self.codec = RunCodec()
+        self._table = self.codec.table_bytes()
+        self._table_checked = 0
+
+    # === SEGMENT FILES ===
+
+    def _segment_table(self, index: int) -> Optional[bytes]:
+        """Name table stored in a segment's header (None if the header is unreadable)."""
+        with open(self._segment_path(index), 'rb') as f:
+            raw = f.read(self.SEGMENT_HEADER.size)
+            if len(raw) < self.SEGMENT_HEADER.size:
+                return None
+            magic, _, table_length = self.SEGMENT_HEADER.unpack(raw)
+            table = f.read(table_length)
+        if magic != self.MAGIC or len(table) < table_length:
+            return None
+        return table
+
+    def _header_bytes(self, supersedes: Optional[int]) -> bytes:
+        marker = -1 if supersedes is None else supersedes
+        return self.SEGMENT_HEADER.pack(self.MAGIC, marker, len(self._table)) + self._table
+
+    def _read_header(self, index: int) -> Optional[int]:
+        with open(self._segment_path(index), 'rb') as f:
+            raw = f.read(self.SEGMENT_HEADER.size)
+        if len(raw) < self.SEGMENT_HEADER.size:
+            return None
+        magic, supersedes, _ = self.SEGMENT_HEADER.unpack(raw)
+        if magic != self.MAGIC or supersedes < 0:
+            return None
+        return supersedes
+
+    def _read_segment(self, index: int, repair: bool = False) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        path = self._segment_path(index)
+        with open(path, 'rb') as f:
+            buf = f.read()
+
+        supersedes = None
+        records = []
+        good_offset = 0
+        header_size = self.SEGMENT_HEADER.size
+
+        if len(buf) >= header_size:
+            magic, marker, table_length = self.SEGMENT_HEADER.unpack_from(buf, 0)
+            table_end = header_size + table_length
+            if magic == self.MAGIC and len(buf) >= table_end:
+                supersedes = marker if marker >= 0 else None
+                codec = RunCodec.from_table_bytes(buf[header_size:table_end])
+                decode = codec.decode
+                pos = good_offset = table_end
+                # Decoding only allocates acyclic dicts and lists; pausing the
+                # cyclic collector roughly halves the time spent here
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    while pos + self.RECORD_LENGTH.size <= len(buf):
+                        (length,) = self.RECORD_LENGTH.unpack_from(buf, pos)
+                        start = pos + self.RECORD_LENGTH.size
+                        if start + length > len(buf):
+                            break  # Torn write from a crash mid-append
+                        records.append(decode(buf[start:start + length]))
+                        pos = good_offset = start + length
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+
+        if repair and good_offset < len(buf):
+            with open(path, 'r+b') as f:
+                f.truncate(good_offset)
+            print(f"⚠ Discarded torn record at end of {os.path.basename(path)}")
+
+        return supersedes, records
+
+    def _write_segment(self, index: int, runs: List[Dict[str, Any]], supersedes: int) -> None:
+        path = self._segment_path(index)
+        tmp_path = path + ".tmp"
+        encode = self.codec.encode
+        with open(tmp_path, 'wb') as f:
+            f.write(self._header_bytes(supersedes))
+            for run in runs:
+                record = encode(run)
+                f.write(self.RECORD_LENGTH.pack(len(record)) + record)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _append_records(self, path: str, runs: List[Dict[str, Any]]) -> None:
+        encode = self.codec.encode
+        with open(path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(self._header_bytes(None))
+            for run in runs:
+                record = encode(run)
+                f.write(self.RECORD_LENGTH.pack(len(record)) + record)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append_many(self, runs: List[Dict[str, Any]]) -> None:
+        """
+        Append a batch of runs.
+
+        Records are encoded with the current name table, so an active
+        segment written with another table (by an older version, before a
+        restart) is sealed first and the runs go to a fresh segment.
+        """
+        index = self._active_index
+        if index and index != self._table_checked:
+            if (os.path.exists(self._segment_path(index))
+                    and self._segment_table(index) != self._table):
+                self._active_records = self.MAX_SEGMENT_RECORDS
+            self._table_checked = index
+        super().append_many(runs)
+
+    # === MIGRATION ===
+
+    def migrate_legacy(self) -> bool:
+        """
+        One-time import from the JSON-Lines run log, else the old JSON file.
+
+        Returns:
+            True if runs were migrated
+        """
+        if self._segment_indexes() or not self.log_dir or not os.path.isdir(self.log_dir):
+            return super().migrate_legacy()
+
+        runs = RunLogStore(self.log_dir).load()
+        if not runs:
+            return super().migrate_legacy()
+
+        self.rewrite(runs)
+        print(f"✓ Migrated {len(runs)} runs from {self.log_dir}")
+        return True
+
+
+# === STREAMING FILE READS ===
+
+def iter_run_file(path: str, chunk_size: int = 500,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  read_size: int = 1 << 16) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream runs from an exported JSON array (or a JSON-Lines file).
+
+    The file is read ``read_size`` bytes at a time and array items are
+    parsed one by one with ``JSONDecoder.raw_decode``, so memory use is
+    bounded by the chunk size rather than the file size.
+
+    Args:
+        path: File to read
+        chunk_size: Runs per yielded chunk
+        progress: Called as progress(bytes_read, total_bytes) after each chunk
+        read_size: Bytes read from disk per step
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    total_bytes = os.path.getsize(path)
+    bytes_read = 0
+    buffer = ''
+    pos = 0
+    eof = False
+    in_array = None
+    chunk: List[Dict[str, Any]] = []
+
+    with open(path, 'rb') as f:
+        def fill() -> bool:
+            nonlocal buffer, pos, bytes_read, eof
+            if eof:
+                return False
+            raw = f.read(read_size)
+            bytes_read += len(raw)
+            eof = not raw
+            buffer = buffer[pos:] + text_decoder.decode(raw, final=eof)
+            pos = 0
+            return not eof
+
+        while True:
+            # Skip whitespace and item separators
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,\ufeff':
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    break
+
+            if pos >= len(buffer):
+                if in_array:
+                    raise ValueError("Unterminated JSON array")
+                break
+
+            if in_array is None:
+                in_array = buffer[pos] == '['
+                if in_array:
+                    pos += 1
+                continue
+
+            if in_array and buffer[pos] == ']':
+                break
+
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    if fill():
+                        continue
+                    raise
+                if end == len(buffer) and fill():
+                    continue  # A number could continue in the next block
+                break
+            pos = end
+            chunk.append(item)
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+                if progress:
+                    progress(bytes_read, total_bytes)
+
+    if chunk:
+        yield chunk
+    if progress:
+        progress(total_bytes, total_bytes)
@@ -0,0 +1,197 @@
+"""
+Hades Build Helper - Columnar Run Table
+Column-oriented copy of the run history for vectorized queries (needs NumPy).
+"""
+
+from typing import Dict, List, Any, Optional, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; RunAnalytics falls back to list scans
+    np = None
+
+
+class ColumnarRunTable:
+    """
+    Stores run history as NumPy columns.
+
+    - victory, build_score and heat_level are plain numeric arrays
+    - weapon and aspect are dictionary-encoded integer codes
+    - gods and boons are bitset matrices (one uint64 word per 64 names)
+
+    Rows are kept in the same order as ``RunAnalytics.runs`` so a row index
+    is also an index into the run list.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("ColumnarRunTable requires NumPy")
+        self.reset()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether NumPy is installed."""
+        return np is not None
+
+    def reset(self) -> None:
+        """Drop all rows and dictionaries."""
+        self.size = 0
+        self._capacity = self.INITIAL_CAPACITY
+
+        self.victory = np.zeros(self._capacity, dtype=bool)
+        self.build_score = np.zeros(self._capacity, dtype=np.float64)
+        self.heat_level = np.zeros(self._capacity, dtype=np.float64)
+        self.weapon = np.zeros(self._capacity, dtype=np.int32)
+        self.aspect = np.zeros(self._capacity, dtype=np.int32)
+        self.gods = np.zeros((self._capacity, 1), dtype=np.uint64)
+        self.boons = np.zeros((self._capacity, 1), dtype=np.uint64)
+
+        self.weapon_codes: Dict[str, int] = {}
+        self.aspect_codes: Dict[str, int] = {}
+        self.god_codes: Dict[str, int] = {}
+        self.boon_codes: Dict[str, int] = {}
+
+    def rebuild(self, runs: List[Dict[str, Any]]) -> None:
+        """Recreate all columns from a run list."""
+        self.reset()
+        for run in runs:
+            self.append(run)
+
+    # === ENCODING ===
+
+    @staticmethod
+    def _code(name: str, codes: Dict[str, int]) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = len(codes)
+            codes[name] = code
+        return code
+
+    def _grow_rows(self) -> None:
+        self._capacity *= 2
+        for column in ('victory', 'build_score', 'heat_level', 'weapon', 'aspect', 'gods', 'boons'):
+            old = getattr(self, column)
+            new = np.zeros((self._capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def _set_bits(self, column: str, codes: Dict[str, int], names: Iterable[str], row: int) -> None:
+        matrix = getattr(self, column)
+        for name in names:
+            code = self._code(name, codes)
+            word, bit = divmod(code, 64)
+            if word >= matrix.shape[1]:
+                wider = np.zeros((self._capacity, word + 1), dtype=np.uint64)
+                wider[:, :matrix.shape[1]] = matrix
+                matrix = wider
+                setattr(self, column, matrix)
+            matrix[row, word] |= np.uint64(1) << np.uint64(bit)
+
+    def append(self, run: Dict[str, Any]) -> None:
+        """Add one run as a new row."""
+        if self.size >= self._capacity:
+            self._grow_rows()
+
+        row = self.size
+        self.victory[row] = bool(run.get('victory', False))
+        self.build_score[row] = run.get('build_score', 0)
+        self.heat_level[row] = run.get('heat_level', 0)
+        self.weapon[row] = self._code(run.get('weapon'), self.weapon_codes)
+        self.aspect[row] = self._code(run.get('aspect'), self.aspect_codes)
+        self._set_bits('gods', self.god_codes, run.get('gods', []), row)
+        self._set_bits('boons', self.boon_codes, run.get('boons', []), row)
+        self.size += 1
+
+    # === MASKS ===
+
+    def all_rows(self) -> 'np.ndarray':
+        return np.ones(self.size, dtype=bool)
+
+    def mask_rows(self, rows: List[int]) -> 'np.ndarray':
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def mask_victory(self, victory: bool = True) -> 'np.ndarray':
+        rows = self.victory[:self.size]
+        return rows if victory else ~rows
+
+    def mask_weapon(self, weapon: str) -> 'np.ndarray':
+        code = self.weapon_codes.get(weapon)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        return self.weapon[:self.size] == code
+
+    def mask_aspect(self, aspect: str) -> 'np.ndarray':
+        code = self.aspect_codes.get(aspect)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        return self.aspect[:self.size] == code
+
+    def _mask_bit(self, column: str, codes: Dict[str, int], name: str) -> 'np.ndarray':
+        code = codes.get(name)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        word, bit = divmod(code, 64)
+        return (getattr(self, column)[:self.size, word] & (np.uint64(1) << np.uint64(bit))) != 0
+
+    def mask_god(self, god: str) -> 'np.ndarray':
+        return self._mask_bit('gods', self.god_codes, god)
+
+    def mask_boon(self, boon: str) -> 'np.ndarray':
+        return self._mask_bit('boons', self.boon_codes, boon)
+
+    def mask(self, weapon: Optional[str] = None, aspect: Optional[str] = None,
+             gods: Iterable[str] = (), boons: Iterable[str] = (),
+             victory: Optional[bool] = None, min_score: Optional[float] = None,
+             min_heat: Optional[float] = None) -> 'np.ndarray':
+        """Combine filters into a single boolean row mask."""
+        mask = self.all_rows()
+        if weapon is not None:
+            mask &= self.mask_weapon(weapon)
+        if aspect is not None:
+            mask &= self.mask_aspect(aspect)
+        for god in gods:
+            mask &= self.mask_god(god)
+        for boon in boons:
+            mask &= self.mask_boon(boon)
+        if victory is not None:
+            mask &= self.mask_victory(victory)
+        if min_score is not None:
+            mask &= self.build_score[:self.size] >= min_score
+        if min_heat is not None:
+            mask &= self.heat_level[:self.size] >= min_heat
+        return mask
+
+    # === QUERIES ===
+
+    def rows(self, mask: 'np.ndarray') -> List[int]:
+        """Row indexes selected by a mask."""
+        return np.flatnonzero(mask).tolist()
+
+    def best_row(self, mask: Optional['np.ndarray'] = None) -> Optional[int]:
+        """Row with the highest build score (first one on ties)."""
+        if self.size == 0:
+            return None
+        scores = self.build_score[:self.size]
+        if mask is not None:
+            if not mask.any():
+                return None
+            scores = np.where(mask, scores, -np.inf)
+        return int(np.argmax(scores))
+
+    def summarize(self, mask: 'np.ndarray') -> Dict[str, Any]:
+        """Run count, wins, win rate and averages over the selected rows."""
+        runs = int(mask.sum())
+        if runs == 0:
+            return {'runs': 0, 'wins': 0, 'win_rate': 0.0, 'avg_score': 0.0, 'avg_heat': 0.0}
+        wins = int((mask & self.victory[:self.size]).sum())
+        return {
+            'runs': runs,
+            'wins': wins,
+            'win_rate': wins / runs * 100,
+            'avg_score': float(self.build_score[:self.size][mask].mean()),
+            'avg_heat': float(self.heat_level[:self.size][mask].mean())
+        }
@@ -0,0 +1,343 @@
+"""
+Hades Build Helper - SQLite Run Storage
+Run history backend on stdlib sqlite3 with aggregate queries done in SQL.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from collections import defaultdict
+
+from run_storage import RunLogStore
+
+
+class SQLiteRunStore:
+    """
+    Stores runs in normalized SQLite tables.
+
+    Every run keeps its full record as JSON in ``runs.data`` so loading is
+    lossless, while weapon, gods, boons and rooms are also split out into
+    indexed columns and tables that the aggregate queries run against.
+    Exposes the same load/append/rewrite interface as RunLogStore.
+
+    The one connection is shared by the lazy loader thread, the
+    persistence writer and Tk-thread queries, so every use of it holds
+    ``self.lock``.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            run_number INTEGER,
+            timestamp TEXT,
+            weapon TEXT,
+            aspect TEXT,
+            build_score NUMERIC NOT NULL DEFAULT 0,
+            victory INTEGER NOT NULL DEFAULT 0,
+            boss_reached TEXT,
+            heat_level NUMERIC NOT NULL DEFAULT 0,
+            god_combo TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS run_gods (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            god TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS run_boons (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            boon TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS rooms (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            room_number INTEGER,
+            region TEXT,
+            room_type TEXT,
+            reward_offered TEXT,
+            reward_chosen TEXT,
+            god_chosen TEXT,
+            boon_chosen TEXT,
+            reroll_used INTEGER NOT NULL DEFAULT 0,
+            timestamp TEXT,
+            notes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS boon_timeline (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            room INTEGER NOT NULL,
+            boon TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_weapon ON runs(weapon);
+        CREATE INDEX IF NOT EXISTS idx_runs_god_combo ON runs(god_combo);
+        CREATE INDEX IF NOT EXISTS idx_run_gods_god ON run_gods(god);
+        CREATE INDEX IF NOT EXISTS idx_run_gods_run ON run_gods(run_id);
+        CREATE INDEX IF NOT EXISTS idx_run_boons_boon ON run_boons(boon);
+        CREATE INDEX IF NOT EXISTS idx_run_boons_run ON run_boons(run_id);
+        CREATE INDEX IF NOT EXISTS idx_rooms_run ON rooms(run_id);
+        CREATE INDEX IF NOT EXISTS idx_boon_timeline_boon ON boon_timeline(boon);
+    """
+
+    # === PREPARED STATEMENTS ===
+
+    INSERT_RUN = """
+        INSERT INTO runs (run_number, timestamp, weapon, aspect, build_score, victory,
+                          boss_reached, heat_level, god_combo, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    INSERT_GOD = "INSERT INTO run_gods (run_id, position, god) VALUES (?, ?, ?)"
+    INSERT_BOON = "INSERT INTO run_boons (run_id, position, boon) VALUES (?, ?, ?)"
+    INSERT_ROOM = """
+        INSERT INTO rooms (run_id, position, room_number, region, room_type, reward_offered,
+                           reward_chosen, god_chosen, boon_chosen, reroll_used, timestamp, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    INSERT_TIMELINE = "INSERT INTO boon_timeline (run_id, position, room, boon) VALUES (?, ?, ?, ?)"
+
+    SELECT_RUNS = "SELECT data FROM runs ORDER BY id"
+    SELECT_RUNS_AFTER = "SELECT id, data FROM runs WHERE id > ? ORDER BY id LIMIT ?"
+    COUNT_RUNS = "SELECT COUNT(*) FROM runs"
+
+    WEAPON_STATS = """
+        SELECT COALESCE(weapon, 'Unknown'), COUNT(*), SUM(victory), SUM(build_score),
+               SUM(heat_level), MAX(build_score)
+        FROM runs GROUP BY COALESCE(weapon, 'Unknown') ORDER BY MIN(id)
+    """
+    WEAPON_ASPECTS = """
+        SELECT COALESCE(weapon, 'Unknown'), COALESCE(aspect, 'Unknown'), COUNT(*)
+        FROM runs GROUP BY COALESCE(weapon, 'Unknown'), COALESCE(aspect, 'Unknown')
+        ORDER BY MIN(id)
+    """
+    GOD_COMBO_STATS = """
+        SELECT god_combo, COUNT(*), SUM(victory)
+        FROM runs WHERE god_combo IS NOT NULL
+        GROUP BY god_combo HAVING COUNT(*) >= ? ORDER BY MIN(id)
+    """
+    ROOM_TOTALS = """
+        SELECT COUNT(*), COALESCE(SUM(reroll_used), 0) FROM rooms
+    """
+    ROOM_REWARDS = """
+        SELECT reward_chosen, COUNT(*) FROM rooms
+        WHERE reward_chosen IS NOT NULL AND reward_chosen != ''
+        GROUP BY reward_chosen ORDER BY MIN(rowid)
+    """
+    ROOM_GODS = """
+        SELECT god_chosen, COUNT(*) FROM rooms
+        WHERE god_chosen IS NOT NULL AND god_chosen != ''
+        GROUP BY god_chosen ORDER BY MIN(rowid)
+    """
+    BOON_PATTERNS = """
+        SELECT boon, COUNT(*), AVG(room), MIN(room), MAX(room)
+        FROM boon_timeline GROUP BY boon ORDER BY MIN(rowid)
+    """
+
+    def __init__(self, path: str, legacy_file: Optional[str] = None,
+                 log_dir: Optional[str] = None):
+        """
+        Args:
+            path: SQLite database file
+            legacy_file: Old single-file JSON history to migrate from
+            log_dir: JSON-Lines run log directory to migrate from
+        """
+        self.path = path
+        self.legacy_file = legacy_file
+        self.log_dir = log_dir
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+    # === WRITES ===
+
+    @staticmethod
+    def _god_combo(gods: List[str]) -> Optional[str]:
+        """Combo key used by RunAnalytics.get_god_combo_stats (sorted, top 3)."""
+        sorted_gods = sorted(gods)
+        if len(sorted_gods) < 2:
+            return None
+        return " + ".join(sorted_gods[:3])
+
+    def _insert(self, run: Dict[str, Any]) -> None:
+        gods = run.get('gods', [])
+        cursor = self.conn.execute(self.INSERT_RUN, (
+            run.get('run_number'),
+            run.get('timestamp'),
+            run.get('weapon'),
+            run.get('aspect'),
+            run.get('build_score', 0),
+            1 if run.get('victory', False) else 0,
+            run.get('boss_reached'),
+            run.get('heat_level', 0),
+            self._god_combo(gods),
+            json.dumps(run, ensure_ascii=False)
+        ))
+        run_id = cursor.lastrowid
+
+        self.conn.executemany(self.INSERT_GOD, [(run_id, i, g) for i, g in enumerate(gods)])
+        self.conn.executemany(self.INSERT_BOON,
+                              [(run_id, i, b) for i, b in enumerate(run.get('boons', []))])
+
+        room_prog = run.get('room_progression') or {}
+        self.conn.executemany(self.INSERT_ROOM, [
+            (run_id, i, room.get('room_number'), room.get('region'), room.get('room_type'),
+             room.get('reward_offered'), room.get('reward_chosen'), room.get('god_chosen'),
+             room.get('boon_chosen'), 1 if room.get('reroll_used') else 0,
+             room.get('timestamp'), room.get('notes'))
+            for i, room in enumerate(room_prog.get('rooms', []))
+        ])
+        self.conn.executemany(self.INSERT_TIMELINE, [
+            (run_id, i, entry['room'], entry['boon'])
+            for i, entry in enumerate(room_prog.get('boon_timeline', []))
+        ])
+
+    def append(self, run: Dict[str, Any]) -> None:
+        """Insert a single run in its own transaction."""
+        with self.lock, self.conn:
+            self._insert(run)
+
+    def append_many(self, runs: List[Dict[str, Any]]) -> None:
+        """Insert a batch of runs in one transaction."""
+        with self.lock, self.conn:
+            for run in runs:
+                self._insert(run)
+
+    def rewrite(self, runs: List[Dict[str, Any]]) -> None:
+        """Replace the whole history in one transaction."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM runs")
+            for run in runs:
+                self._insert(run)
+
+    def compact(self) -> None:
+        """Checkpoint the WAL and reclaim free pages."""
+        with self.lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conn.execute("VACUUM")
+
+    # === READS ===
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """All rows of a query, fetched while holding the lock."""
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def count(self) -> int:
+        return self._query(self.COUNT_RUNS)[0][0]
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load every stored run in insertion order."""
+        return [json.loads(data) for (data,) in self._query(self.SELECT_RUNS)]
+
+    def iter_runs(self, chunk_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream stored runs in insertion order, ``chunk_size`` records at a time.
+
+        Each chunk is its own keyed query, so no cursor stays open on the
+        shared connection between chunks.
+        """
+        last_id = 0
+        while True:
+            rows = self._query(self.SELECT_RUNS_AFTER, (last_id, chunk_size))
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            yield [json.loads(data) for _, data in rows]
+
+    def migrate_legacy(self) -> bool:
+        """
+        One-time import from the JSON-Lines run log or the old JSON file.
+
+        Only runs when the database is still empty; sources are left untouched.
+
+        Returns:
+            True if runs were migrated
+        """
+        with self.lock:
+            return self._migrate_legacy()
+
+    def _migrate_legacy(self) -> bool:
+        if self.count() > 0:
+            return False
+
+        if self.log_dir and os.path.isdir(self.log_dir):
+            runs = RunLogStore(self.log_dir).load()
+            source = self.log_dir
+        elif self.legacy_file and os.path.exists(self.legacy_file):
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                runs = json.load(f)
+            source = self.legacy_file
+        else:
+            return False
+
+        self.rewrite(runs)
+        print(f"✓ Migrated {len(runs)} runs from {source}")
+        return True
+
+    # === AGGREGATE QUERIES ===
+
+    def weapon_stats(self) -> Dict[str, Dict[str, Any]]:
+        """SQL version of RunAnalytics.get_weapon_stats."""
+        aspects = defaultdict(lambda: defaultdict(int))
+        for weapon, aspect, count in self._query(self.WEAPON_ASPECTS):
+            aspects[weapon][aspect] = count
+
+        stats = {}
+        for weapon, runs, wins, total_score, total_heat, best in self._query(self.WEAPON_STATS):
+            stats[weapon] = {
+                'runs': runs,
+                'wins': wins,
+                'defeats': runs - wins,
+                'win_rate': (wins / runs) * 100,
+                'avg_score': total_score / runs,
+                'total_score': total_score,
+                'avg_heat': total_heat / runs,
+                'total_heat': total_heat,
+                'best_score': max(best, 0),
+                'aspects_used': aspects[weapon]
+            }
+        return stats
+
+    def god_combo_stats(self, min_runs: int = 2) -> List[Tuple[str, int, int, float]]:
+        """SQL version of RunAnalytics.get_god_combo_stats."""
+        combo_list = [
+            (combo, runs, wins, wins / runs * 100)
+            for combo, runs, wins in self._query(self.GOD_COMBO_STATS, (min_runs,))
+        ]
+        combo_list.sort(key=lambda x: (x[3], x[1]), reverse=True)
+        return combo_list
+
+    def room_statistics(self) -> Dict[str, Any]:
+        """SQL version of RunAnalytics.get_room_statistics."""
+        with self.lock:
+            total_rooms, reroll_usage = self._query(self.ROOM_TOTALS)[0]
+            run_count = self.count()
+            reward_preferences = dict(self._query(self.ROOM_REWARDS))
+            god_encounter_frequency = dict(self._query(self.ROOM_GODS))
+        return {
+            'total_rooms_cleared': total_rooms,
+            'reward_preferences': reward_preferences,
+            'god_encounter_frequency': god_encounter_frequency,
+            'reroll_usage': reroll_usage,
+            'avg_rooms_per_run': total_rooms / run_count if run_count else 0
+        }
+
+    def boon_acquisition_patterns(self) -> Dict[str, Dict[str, Any]]:
+        """SQL version of RunAnalytics.get_boon_acquisition_patterns."""
+        return {
+            boon: {
+                'times_taken': times,
+                'avg_room_number': avg_room,
+                'earliest': earliest,
+                'latest': latest
+            }
+            for boon, times, avg_room, earliest, latest in self._query(self.BOON_PATTERNS)
+        }
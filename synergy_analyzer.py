@@ -3,7 +3,8 @@ Boon synergy analysis system
 """
 
 from typing import List, Dict, Set
-from data import DUO_BOONS_DATA, BOON_NAME_TO_DATA
+from data import BOON_NAME_TO_DATA
+from boon_catalog import CATALOG
 
 class SynergyAnalyzer:
     """Analyzes boon synergies and anti-synergies."""
@@ -104,19 +105,18 @@ class SynergyAnalyzer:
         if boon_data:
             boon_god = boon_data['god']
             
-            for duo in DUO_BOONS_DATA:
-                if boon_god in duo['gods']:
-                    # Check if this boon is part of the duo prerequisites
-                    for prereq_god, prereq_boon in duo['prerequisites']:
-                        if prereq_boon == boon_name:
-                            # Check if we have the other god
-                            other_gods = [g for g in duo['gods'] if g != boon_god]
-                            if any(g in selected_gods for g in other_gods):
-                                result['potential_duos'].append({
-                                    'name': duo['name'],
-                                    'other_god': other_gods[0] if other_gods else None,
-                                    'still_needed': [b for _, b in duo['prerequisites'] if b not in acquired_boons]
-                                })
+            # Only duos this boon is a prerequisite of
+            for duo in CATALOG.duos_for_boon(boon_name):
+                gods = duo.data['gods']
+                if boon_god in gods:
+                    # Check if we have the other god
+                    other_gods = [g for g in gods if g != boon_god]
+                    if any(g in selected_gods for g in other_gods):
+                        result['potential_duos'].append({
+                            'name': duo.name,
+                            'other_god': other_gods[0] if other_gods else None,
+                            'still_needed': [b for b, _ in duo.prerequisites if b not in acquired_boons]
+                        })
         
         # Calculate synergy score
         score = 0
@@ -131,24 +131,26 @@ class SynergyAnalyzer:
     def get_duo_progress(self, acquired_boons: Set[str], selected_gods: Set[str]) -> List[Dict]:
         """Get progress toward all possible duo boons."""
         duos = []
+        boon_mask = CATALOG.boon_mask(acquired_boons)
+        god_mask = CATALOG.god_mask(selected_gods)
         
-        for duo in DUO_BOONS_DATA:
+        for duo in CATALOG.duos:
             # Check if we have both required gods
-            if all(g in selected_gods for g in duo['gods']):
-                prereq_list = [b for _, b in duo['prerequisites']]
-                acquired_prereqs = [b for b in prereq_list if b in acquired_boons]
-                needed = [b for b in prereq_list if b not in acquired_boons]
+            if god_mask & duo.god_mask == duo.god_mask:
+                held = boon_mask & duo.requires_mask
+                acquired_prereqs = [name for name, bit in duo.prerequisites if held & bit]
+                needed = [name for name, bit in duo.prerequisites if not held & bit]
                 
-                progress = (len(acquired_prereqs) / len(prereq_list)) * 100
+                progress = (len(acquired_prereqs) / len(duo.prerequisites)) * 100
                 
                 duos.append({
-                    'name': duo['name'],
-                    'gods': duo['gods'],
-                    'description': duo.get('description', ''),
+                    'name': duo.name,
+                    'gods': duo.data['gods'],
+                    'description': duo.data.get('description', ''),
                     'progress': progress,
                     'acquired': acquired_prereqs,
                     'needed': needed,
-                    'ready': len(needed) == 0
+                    'ready': held == duo.requires_mask
                 })
         
         # Sort by progress
@@ -0,0 +1,47 @@
+import threading
+
+from analytics import RunAnalytics
+from persistence import PersistenceWorker
+
+
+def make_run(weapon, gods, victory):
+    return {
+        'weapon': weapon,
+        'aspect': "Zagreus",
+        'gods': gods,
+        'boons': ["Lightning Strike"],
+        'victory': victory,
+        'build_score': 50,
+        'room_progression': {
+            'rooms': [{'reward_chosen': "Boon", 'god_chosen': gods[0]}],
+            'boon_timeline': [{'boon': "Lightning Strike", 'room': 2}],
+        },
+    }
+
+
+def test_sqlite_reads_see_runs_queued_behind_a_busy_writer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    writer = PersistenceWorker()
+    analytics = RunAnalytics(backend="sqlite", writer=writer)
+    release = threading.Event()
+    writer.submit("busy", release.wait)
+
+    analytics.add_run(make_run("Stygian Blade", ["Zeus", "Ares"], True))
+    analytics.add_run(make_run("Stygian Blade", ["Zeus", "Ares"], False))
+    analytics.add_run(make_run("Eternal Spear", ["Athena", "Zeus"], True))
+
+    # Answered from memory while the appends are still queued
+    assert analytics.get_total_runs() == 3
+    weapons = analytics.get_weapon_stats()
+    assert weapons["Stygian Blade"]['runs'] == 2 and weapons["Eternal Spear"]['runs'] == 1
+    assert analytics.get_god_combo_stats(min_runs=2) == [("Ares + Zeus", 2, 1, 50.0)]
+
+    # SQL reads wait for the writer to catch up
+    threading.Timer(0.1, release.set).start()
+    rooms = analytics.get_room_statistics()
+    assert rooms['total_rooms_cleared'] == 3
+    assert rooms['god_encounter_frequency'] == {"Zeus": 2, "Athena": 1}
+    assert analytics.get_boon_acquisition_patterns()["Lightning Strike"]['times_taken'] == 3
+
+    writer.stop()
+    analytics.store.close()
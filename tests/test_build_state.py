@@ -0,0 +1,79 @@
+import random
+
+from build_state import BuildState
+
+
+BOONS = [f"Boon {i}" for i in range(10)]
+GODS = ["Zeus", "Poseidon", "Athena", "Ares"]
+WEAPONS = [None, "Stygian Blade", "Heart-Seeking Bow"]
+ASPECTS = [None, "Zagreus", "Nemesis"]
+
+
+def random_step(rng, state):
+    """Apply one random mutation; returns its name."""
+    op = rng.choice(['add_boon', 'remove_boon', 'set_pom', 'clear_boons', 'load', 'add_hammer',
+                     'set_room', 'set_weapon', 'set_aspect', 'add_god', 'clear_pom',
+                     'set_death_defiances'])
+    if op == 'add_boon':
+        state.add_boon(rng.choice(BOONS), rng.choice(GODS + [None]), rng.randint(1, 4))
+    elif op == 'remove_boon':
+        state.remove_boon(rng.choice(BOONS))
+    elif op == 'set_pom':
+        state.set_pom(rng.choice(BOONS), rng.randint(1, 4))
+    elif op == 'clear_pom':
+        state.clear_pom(rng.choice(BOONS))
+    elif op == 'clear_boons':
+        state.clear_boons()
+    elif op == 'load':
+        boons = rng.sample(BOONS, rng.randint(0, 5))
+        poms = {boon: rng.randint(1, 4) for boon in boons if rng.random() < 0.5}
+        state.load(rng.choice(WEAPONS), rng.choice(ASPECTS), boons, poms,
+                   rng.sample(GODS, rng.randint(0, 3)))
+    elif op == 'add_hammer':
+        state.add_hammer(f"Hammer {rng.randint(1, 3)}")
+    elif op == 'set_room':
+        state.set_room(rng.randint(1, 45))
+    elif op == 'set_weapon':
+        state.set_weapon(rng.choice(WEAPONS))
+    elif op == 'set_aspect':
+        state.set_aspect(rng.choice(ASPECTS))
+    elif op == 'add_god':
+        state.add_god(rng.choice(GODS))
+    else:
+        state.set_death_defiances(rng.randint(0, 3))
+    return op
+
+
+def test_fingerprint_matches_recompute_after_every_step():
+    rng = random.Random(17)
+    for _ in range(200):
+        state = BuildState()
+        for _ in range(40):
+            op = random_step(rng, state)
+            assert state.fingerprint == state.compute_fingerprint(), op
+
+
+def test_equal_builds_share_a_fingerprint():
+    rng = random.Random(4)
+    for _ in range(200):
+        state = BuildState()
+        for _ in range(20):
+            random_step(rng, state)
+        rebuilt = BuildState()
+        rebuilt.load(state.weapon, state.aspect, state.boons, state.pom_levels, state.gods)
+        for hammer in state.hammers:
+            rebuilt.add_hammer(hammer)
+        rebuilt.set_room(state.room)
+        rebuilt.set_death_defiances(state.death_defiances)
+        assert rebuilt.fingerprint == state.fingerprint
+
+
+def test_copy_is_independent():
+    state = BuildState()
+    state.add_boon("Boon 1", "Zeus")
+    copy = state.copy()
+    copy.add_boon("Boon 2", "Ares")
+    copy.set_pom("Boon 1", 3)
+    assert state.boons == {"Boon 1"} and state.pom_levels == {"Boon 1": 1}
+    assert state.fingerprint == state.compute_fingerprint()
+    assert copy.fingerprint == copy.compute_fingerprint() != state.fingerprint
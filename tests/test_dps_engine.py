@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from advanced_dps_calculator import AdvancedDPSCalculator
+from build_state import BuildState
+from build_view import BuildViewMixin
+from damage_calculator import DamageCalculator
+from data import BOONS_DATA
+from dps_engine import (
+    ADD_BOON, POM, HAMMER, CLASSIC_ENGINE, ADVANCED_ENGINE, LIVE_ENGINE, CLASSIC_WEAPONS
+)
+
+
+# (weapon, aspect, boons, pom levels, hammers)
+BUILDS = [
+    ('Stygian Blade', None, [], {}, 0),
+    ('Stygian Blade', 'Nemesis', ['Lightning Strike', 'Deadly Flourish', 'Divine Dash'],
+     {'Lightning Strike': 3}, 2),
+    ('Heart-Seeking Bow', 'Chaos', ['Crush Shot', 'True Shot', 'Clean Kill', "Hunter's Mark"],
+     {'True Shot': 2, 'Clean Kill': 4}, 1),
+    ('Adamant Rail', 'Eris', ['Drunken Strike', 'Trippy Shot', 'Pressure Points', 'Double Strike'],
+     {'Pressure Points': 5}, 3),
+    ('Twin Fists', 'Talos', ['Heartbreak Flourish', 'Tempest Strike', 'Divine Strike', 'Curse of Agony'],
+     {'Heartbreak Flourish': 2, 'Divine Strike': 3}, 0),
+    (None, None, ['Lightning Strike'], {}, 0),
+]
+
+# Outputs of the calculators before they moved onto dps_engine
+DAMAGE_CALCULATOR_EXPECTED = [
+    {'total_dps': 24.0, 'base_damage': 20, 'modified_damage': 20.0, 'crit_damage': 20.0,
+     'multiplier': 1.0, 'crit_chance': 0.0, 'attack_speed': 1.2, 'rating': '📊 Developing'},
+    {'total_dps': 75.4, 'base_damage': 20, 'modified_damage': 48.3, 'crit_damage': 62.8,
+     'multiplier': 2.42, 'crit_chance': 15.0, 'attack_speed': 1.2, 'rating': '✨ Strong'},
+    {'total_dps': 144.7, 'base_damage': 50, 'modified_damage': 95.2, 'crit_damage': 180.9,
+     'multiplier': 1.9, 'crit_chance': 45.0, 'attack_speed': 0.8, 'rating': '⭐ Excellent'},
+    {'total_dps': 78.0, 'base_damage': 10, 'modified_damage': 20.0, 'crit_damage': 26.0,
+     'multiplier': 2.0, 'crit_chance': 15.0, 'attack_speed': 3.0, 'rating': '✨ Strong'},
+    {'total_dps': 67.9, 'base_damage': 12, 'modified_damage': 33.9, 'crit_damage': 33.9,
+     'multiplier': 2.83, 'crit_chance': 0.0, 'attack_speed': 2.0, 'rating': '💫 Decent'},
+    {'total_dps': 0, 'base_damage': 0, 'modified_damage': 0, 'crit_damage': 0,
+     'multiplier': 1.0, 'crit_chance': 0, 'attack_speed': 0, 'rating': '📊 No Weapon'},
+]
+ADVANCED_EXPECTED = [
+    {'total_dps': 20.0, 'breakdown': {'base': 20, 'total': 20}},
+    {'total_dps': 36.0, 'breakdown': {'base': 20, 'total': 36}},
+    {'total_dps': 5.0, 'breakdown': {'base': 10, 'total': 10}},
+    {'total_dps': 26.4, 'breakdown': {'base': 10, 'total': 22}},
+    {'total_dps': 78.0, 'breakdown': {'base': 12, 'total': 52}},
+    {'total_dps': 0, 'breakdown': {}},
+]
+# (unrounded DPS, _calculate_dps_internal result)
+LIVE_EXPECTED = [
+    (44.444444, {'total': 44, 'rating': "📊"}),
+    (95.822222, {'total': 95, 'rating': "📊"}),
+    (29.542857, {'total': 29, 'rating': "📊"}),
+    (132.0, {'total': 132, 'rating': "🔥"}),
+    (119.28, {'total': 119, 'rating': "📊"}),
+    (0.0, {'total': 0, 'rating': ''}),
+]
+
+
+class BuildView(BuildViewMixin):
+    """The app's DPS path without the window."""
+
+    def __init__(self, weapon, aspect, boons, poms, hammers):
+        self.build = BuildState()
+        self.build.load(weapon, aspect, boons, poms, [])
+        for i in range(hammers):
+            self.build.add_hammer(f"Hammer {i + 1}")
+
+
+@pytest.mark.parametrize('build, expected', list(zip(BUILDS, DAMAGE_CALCULATOR_EXPECTED)))
+def test_damage_calculator_values(build, expected):
+    weapon, _, boons, poms, hammers = build
+    calculator = DamageCalculator()
+    calculator.set_weapon(weapon)
+    calculator.set_boons(list(boons), dict(poms))
+    calculator.set_hammers(hammers)
+    assert calculator.calculate_dps() == expected
+
+
+@pytest.mark.parametrize('build, expected', list(zip(BUILDS, ADVANCED_EXPECTED)))
+def test_advanced_calculator_values(build, expected):
+    weapon, _, boons, poms, _ = build
+    result = AdvancedDPSCalculator().calculate_comprehensive_dps(
+        {'weapon': weapon, 'boons': set(boons), 'pom_levels': dict(poms)})
+    assert result == expected
+
+
+@pytest.mark.parametrize('build, expected', list(zip(BUILDS, LIVE_EXPECTED)))
+def test_live_dps_values(build, expected):
+    assert BuildView(*build).calculate_detailed_dps_value() == pytest.approx(expected[0])
+
+
+@pytest.mark.parametrize('build, expected', list(zip(BUILDS, LIVE_EXPECTED)))
+def test_calculate_dps_internal_values(build, expected):
+    pytest.importorskip('customtkinter')
+    import main
+    assert main.HadesHelperUltimate._calculate_dps_internal(BuildView(*build)) == expected[1]
+
+
+# === BATCHES AND DELTAS ===
+
+ENGINES = [CLASSIC_ENGINE, ADVANCED_ENGINE, LIVE_ENGINE]
+BOON_NAMES = [boon['name'] for boon in BOONS_DATA]
+ASPECTS = [None, 'Zagreus', 'Nemesis', 'Arthur', 'Chaos']
+
+
+def random_build(rng):
+    boons = rng.sample(BOON_NAMES, rng.randint(0, 8))
+    return {
+        'weapon': rng.choice([None, 'Unknown Weapon'] + list(CLASSIC_WEAPONS)),
+        'aspect': rng.choice(ASPECTS),
+        'boons': set(boons),
+        'pom_levels': {boon: rng.randint(1, 5) for boon in boons if rng.random() < 0.5},
+        'hammers': rng.randint(0, 3),
+    }
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=lambda engine: engine.profile.name)
+def test_evaluate_batch_matches_evaluate(engine):
+    rng = random.Random(14)
+    builds = [random_build(rng) for _ in range(300)]
+    batch = engine.evaluate_batch(builds)
+    assert list(batch) == pytest.approx([engine.dps(build) for build in builds])
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=lambda engine: engine.profile.name)
+def test_evaluate_deltas_match_evaluate(engine):
+    rng = random.Random(41)
+    for _ in range(100):
+        build = random_build(rng)
+        owned = sorted(build['boons'])
+        deltas = [(ADD_BOON, name) for name in rng.sample(BOON_NAMES, 5)]
+        deltas += [(POM, name, rng.randint(1, 3)) for name in owned]
+        deltas += [(HAMMER,), (HAMMER, 2)]
+
+        expected = []
+        for delta in deltas:
+            after = dict(build, boons=set(build['boons']), pom_levels=dict(build['pom_levels']))
+            if delta[0] == ADD_BOON:
+                after['boons'].add(delta[1])
+            elif delta[0] == POM:
+                after['pom_levels'][delta[1]] = after['pom_levels'].get(delta[1], 1) + delta[2]
+            else:
+                after['hammers'] += delta[1] if len(delta) > 1 else 1
+            expected.append(engine.dps(after))
+        assert list(engine.evaluate_deltas(build, deltas)) == pytest.approx(expected)
@@ -0,0 +1,40 @@
+import pickle
+
+from parallel import make_shards, map_shards, simulate_parallel, _SimulateShard
+from run_simulator import (
+    DoorAdvisorPolicy, BoonAdvisorPolicy, door_advisor_policy, boon_advisor_policy,
+    dps_greedy_policy
+)
+
+
+class FirstDoorAdvisor:
+    """Minimal door advisor: keeps the offered order."""
+
+    def __init__(self, run):
+        self.run = run
+
+    def score_all_doors(self, doors):
+        return doors
+
+
+def test_advisor_policies_pickle():
+    door_policy = door_advisor_policy(FirstDoorAdvisor)
+    boon_policy = boon_advisor_policy(FirstDoorAdvisor, dps_greedy_policy)
+    assert isinstance(pickle.loads(pickle.dumps(door_policy)), DoorAdvisorPolicy)
+    assert isinstance(pickle.loads(pickle.dumps(boon_policy)), BoonAdvisorPolicy)
+
+
+def test_spawned_shards_match_inline():
+    task = _SimulateShard(door_advisor_policy(FirstDoorAdvisor), "Stygian Blade")
+    shards = make_shards(6, seed=11, shard_size=3)
+    spawned = map_shards(task, shards, processes=2, start_method="spawn")
+    inline = map_shards(task, shards, processes=1)
+    assert [tally.report() for tally in spawned] == [tally.report() for tally in inline]
+
+
+def test_simulate_parallel_matches_for_any_process_count():
+    policy = door_advisor_policy(FirstDoorAdvisor)
+    one = simulate_parallel(policy, 6, seed=5, processes=1, shard_size=2)
+    two = simulate_parallel(policy, 6, seed=5, processes=2, shard_size=2)
+    assert one.report() == two.report()
+    assert one.report()['runs'] == 6
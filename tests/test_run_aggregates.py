@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from combo_cube import GodComboCube
+from run_aggregates import RunAggregates
+
+
+GODS = ["Zeus", "Poseidon", "Athena", "Ares", "Aphrodite", "Artemis", "Dionysus", "Demeter"]
+WEAPONS = ["Stygian Blade", "Heart-Seeking Bow", "Shield of Chaos"]
+
+
+def make_run(rng, victory):
+    return {
+        'victory': victory,
+        'build_score': rng.randint(0, 100),
+        'heat_level': rng.randint(0, 32),
+        'weapon': rng.choice(WEAPONS),
+        'aspect': rng.choice(["Zagreus", "Nemesis"]),
+        'gods': rng.sample(GODS, rng.randint(0, 5)),
+        'boons': [f"Boon {i}" for i in rng.sample(range(12), rng.randint(0, 4))],
+    }
+
+
+def make_history(rng, count, pattern):
+    if pattern == 'wins':
+        outcomes = [True] * count
+    elif pattern == 'losses':
+        outcomes = [False] * count
+    else:
+        # Runs of wins and losses so streaks cross shard boundaries
+        outcomes = []
+        while len(outcomes) < count:
+            outcomes.extend([rng.random() < 0.5] * rng.randint(1, 5))
+        outcomes = outcomes[:count]
+    return [make_run(rng, victory) for victory in outcomes]
+
+
+def random_split(rng, runs):
+    """Consecutive shards, some of them empty."""
+    cuts = sorted(rng.randint(0, len(runs)) for _ in range(rng.randint(0, 5)))
+    bounds = [0] + cuts + [len(runs)]
+    return [runs[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def aggregates(runs):
+    result = RunAggregates()
+    result.rebuild(runs)
+    return result
+
+
+def cube(runs):
+    result = GodComboCube()
+    result.rebuild(runs)
+    return result
+
+
+@pytest.mark.parametrize('pattern', ['mixed', 'wins', 'losses'])
+def test_merged_aggregates_equal_rebuild(pattern):
+    rng = random.Random(pattern)
+    for _ in range(200):
+        runs = make_history(rng, rng.randint(0, 25), pattern)
+        merged = RunAggregates()
+        for shard in random_split(rng, runs):
+            merged.merge(aggregates(shard))
+        assert merged.to_dict() == aggregates(runs).to_dict()
+
+
+def test_merge_joins_all_win_and_all_loss_shards():
+    rng = random.Random(3)
+    for shape in (['wins', 'wins', 'losses'], ['losses', 'wins', 'wins'],
+                  ['losses', 'losses'], ['wins', 'losses', 'wins', 'losses']):
+        shards = [make_history(rng, rng.randint(1, 4), pattern) for pattern in shape]
+        merged = RunAggregates()
+        for shard in shards:
+            merged.merge(aggregates(shard))
+        runs = [run for shard in shards for run in shard]
+        assert merged.to_dict() == aggregates(runs).to_dict()
+
+
+def test_merged_cube_equals_rebuild():
+    rng = random.Random(9)
+    for _ in range(200):
+        runs = make_history(rng, rng.randint(0, 25), 'mixed')
+        merged = GodComboCube()
+        for shard in random_split(rng, runs):
+            merged.merge(cube(shard))
+        assert merged.cells == cube(runs).cells
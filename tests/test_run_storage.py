@@ -0,0 +1,45 @@
+from run_codec import RunCodec
+from run_storage import BinaryRunLogStore
+
+
+def make_run(number, gods):
+    return {
+        'run_number': number,
+        'weapon': "Stygian Blade",
+        'gods': gods,
+        'boons': ["Lightning Strike"],
+        'victory': number % 2 == 0,
+        'build_score': number,
+    }
+
+
+def open_store(directory, names):
+    """Store as reopened by a version whose data tables list ``names``."""
+    store = BinaryRunLogStore(str(directory))
+    store.codec = RunCodec(names)
+    store._table = store.codec.table_bytes()
+    store.load()
+    return store
+
+
+def test_restart_with_changed_name_table_round_trips(tmp_path):
+    first = make_run(1, ["Zeus", "Ares"])
+    open_store(tmp_path, ["Zeus", "Ares", "Stygian Blade"]).append(first)
+
+    second = make_run(2, ["Poseidon", "Zeus"])
+    store = open_store(tmp_path, ["Poseidon", "Zeus", "Ares", "Stygian Blade"])
+    store.append(second)
+    store.append(make_run(3, ["Ares"]))
+
+    runs = open_store(tmp_path, ["Athena"]).load()
+    assert runs == [first, second, make_run(3, ["Ares"])]
+    assert len(store._segment_indexes()) == 2
+
+
+def test_restart_with_same_name_table_keeps_appending_to_segment(tmp_path):
+    names = ["Zeus", "Ares", "Stygian Blade"]
+    open_store(tmp_path, names).append(make_run(1, ["Zeus"]))
+    store = open_store(tmp_path, names)
+    store.append(make_run(2, ["Ares"]))
+    assert len(store._segment_indexes()) == 1
+    assert [run['run_number'] for run in open_store(tmp_path, names).load()] == [1, 2]
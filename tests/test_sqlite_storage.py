@@ -0,0 +1,64 @@
+import threading
+
+from sqlite_storage import SQLiteRunStore
+
+
+def make_run(number):
+    return {
+        'run_number': number,
+        'timestamp': f"2024-01-01T00:00:{number:05d}",
+        'weapon': "Stygian Blade",
+        'gods': ["Zeus", "Athena"],
+        'boons': ["Lightning Strike", "Divine Dash"],
+        'victory': number % 2 == 0,
+        'build_score': number,
+    }
+
+
+def test_iter_runs_pages_in_order(tmp_path):
+    store = SQLiteRunStore(str(tmp_path / "runs.db"))
+    store.append_many([make_run(n) for n in range(1, 26)])
+    chunks = list(store.iter_runs(chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [run['run_number'] for chunk in chunks for run in chunk] == list(range(1, 26))
+    store.close()
+
+
+def test_concurrent_writer_loader_and_queries(tmp_path):
+    store = SQLiteRunStore(str(tmp_path / "runs.db"))
+    store.append_many([make_run(n) for n in range(1, 201)])
+    errors = []
+
+    def guarded(work):
+        def run():
+            try:
+                work()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+        return threading.Thread(target=run)
+
+    def write():
+        for n in range(201, 401):
+            store.append(make_run(n))
+
+    def load():
+        for _ in range(5):
+            for _ in store.iter_runs(chunk_size=7):
+                pass
+
+    def query():
+        for _ in range(50):
+            store.weapon_stats()
+            store.god_combo_stats()
+            store.room_statistics()
+
+    threads = [guarded(write), guarded(load), guarded(query)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert store.count() == 400
+    assert store.weapon_stats()["Stygian Blade"]['runs'] == 400
+    store.close()